@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 import threading
 import time
@@ -22,6 +23,9 @@ from nacc_node.tools import (
 
 from .config import NodeDefinition
 
+# Upper bound on concurrent node requests during a fan-out
+MAX_FANOUT_WORKERS = 16
+
 
 class NodeClient(Protocol):
     """Protocol implemented by node transports."""
@@ -274,8 +278,15 @@ class NodeRegistry:
         return status
 
     def refresh_all(self) -> list[NodeStatus]:
+        # Only the snapshot needs the lock; holding it through the probes would block
+        # every other registry call for as long as the slowest node takes to answer
         with self._lock:
-            return [self.refresh_status(node_id) for node_id in self._definitions]
+            node_ids = list(self._definitions)
+        if len(node_ids) <= 1:
+            return [self.refresh_status(node_id) for node_id in node_ids]
+        # Node probes are independent, so latency is the slowest node rather than the sum
+        with ThreadPoolExecutor(max_workers=min(len(node_ids), MAX_FANOUT_WORKERS)) as pool:
+            return list(pool.map(self.refresh_status, node_ids))
 
     def choose_node(self, preferred_tags: list[str] | None = None) -> NodeDefinition:
         candidates = self.definitions()
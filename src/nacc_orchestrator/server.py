@@ -28,6 +28,17 @@ class CommandPayload(BaseModel):
     env: dict[str, str] | None = None
 
 
+class BatchCommandPayload(BaseModel):
+    commands: list[CommandPayload] = Field(..., min_length=1)
+
+
+class FileWritePayload(BaseModel):
+    path: str
+    content: str
+    preferred_tags: list[str] | None = None
+    overwrite: bool = True
+
+
 class SyncPayload(BaseModel):
     source_node: str
     source_path: str
@@ -93,6 +104,22 @@ def create_app(service: OrchestratorService) -> FastAPI:
             env=payload.env,
         )
 
+    @app.post("/commands/batch")
+    def execute_batch(payload: BatchCommandPayload) -> dict[str, object]:
+        return {"results": service.execute_batch([command.model_dump() for command in payload.commands])}
+
+    @app.post("/files/write")
+    def write_file(payload: FileWritePayload) -> dict[str, object]:
+        try:
+            return service.write_file(
+                payload.path,
+                payload.content,
+                preferred_tags=payload.preferred_tags,
+                overwrite=payload.overwrite,
+            )
+        except (OSError, ValueError) as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
     @app.post("/sync")
     def sync(payload: SyncPayload) -> dict[str, object]:
         return service.sync_path(
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from typing import Any
 
 from .agents import AgentSuite, CommandRequest
 from .audit import AuditLogger
 from .config import OrchestratorConfig
-from .nodes import NodeRegistry
+from .nodes import MAX_FANOUT_WORKERS, NodeRegistry
 
 
 def _ensure_list(command: list[str] | str) -> list[str]:
@@ -92,8 +93,8 @@ class OrchestratorService:
             parallelism=parallelism,
         )
         plan = self.agents.plan_command(request)
-        results: list[CommandResult] = []
-        for node_id in plan.nodes:
+
+        def run_on(node_id: str) -> CommandResult:
             client = self.registry.get_client(node_id)
             response = client.execute_command(
                 command,
@@ -101,15 +102,19 @@ class OrchestratorService:
                 cwd=cwd,
                 env=env,
             )
-            results.append(
-                CommandResult(
-                    node_id=node_id,
-                    stdout=response.get("stdout", ""),
-                    stderr=response.get("stderr", ""),
-                    exit_code=response.get("exit_code", -1),
-                    duration=response.get("duration", 0.0),
-                )
+            return CommandResult(
+                node_id=node_id,
+                stdout=response.get("stdout", ""),
+                stderr=response.get("stderr", ""),
+                exit_code=response.get("exit_code", -1),
+                duration=response.get("duration", 0.0),
             )
+
+        if len(plan.nodes) <= 1:
+            results = [run_on(node_id) for node_id in plan.nodes]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(plan.nodes), MAX_FANOUT_WORKERS)) as pool:
+                results = list(pool.map(run_on, plan.nodes))
         command_list = _ensure_list(command)
         self.audit.record(
             "execute_command",
@@ -129,6 +134,20 @@ class OrchestratorService:
             "results": [asdict(result) for result in results],
         }
 
+    def execute_batch(self, commands: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Execute several command requests in order, one result per request.
+
+        A command the planner or node rejects (not allowed, unknown node, bad
+        path, transport failure) is reported inline; anything else propagates.
+        """
+        results: list[dict[str, Any]] = []
+        for spec in commands:
+            try:
+                results.append(self.execute_command(**spec))
+            except (OSError, ValueError, KeyError) as exc:
+                results.append({"error": str(exc)})
+        return results
+
     def sync_path(self, source_node: str, *, source_path: str, target_nodes: list[str], strategy: str = "mirror") -> dict[str, Any]:
         plan = self.agents.plan_sync(source_node, target_nodes, strategy=strategy)
         
@@ -7,6 +7,7 @@ import json
 import os
 
 # Use Professional UI v2 by default
+from .session_store import enable_session_persistence
 from .professional_ui_v2 import create_professional_ui_v2
 from .config import load_ui_config
 
@@ -27,6 +28,8 @@ def main(argv: list[str] | None = None) -> None:
     
     # Set orchestrator URL for professional UI
     os.environ["NACC_ORCHESTRATOR_URL"] = str(config.orchestrator_url)
+    if not args.dry_run:
+        enable_session_persistence()
     
     # Use Professional UI v2
     interface = create_professional_ui_v2()
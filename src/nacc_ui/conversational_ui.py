@@ -7,23 +7,172 @@ Three-pane layout:
 """
 
 import gradio as gr
+from collections import OrderedDict, deque
+from functools import cached_property, lru_cache
+from itertools import islice
 import json
-import requests
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Deque, Generator
 import os
 from pathlib import Path
 from datetime import datetime
-import hashlib
+from html import escape
+from io import StringIO
 import logging
+import re
+import secrets
+import threading
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Import the AI intent parser
 from .ai_intent_parser import AIIntentParser, PathResolver, ExecutionPlan
+from .session_store import SessionStore, default_session_store
 
 # Orchestrator URL
 ORCHESTRATOR_URL = os.getenv("NACC_ORCHESTRATOR_URL", "http://127.0.0.1:8888")
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Sessions persist to the SQLite file named by NACC_SESSION_DB (see session_store); with a
+# store configured, only the most recently used stay in memory
+SESSION_CACHE_SIZE = 128
+
+# Bounded per-session logs; message_count/tool_count keep the running totals
+HISTORY_LIMIT = 100
+TOOL_LOG_LIMIT = 100
+
+# Characters of message/tool output kept for AI context
+CONTENT_PREVIEW_CHARS = 100
+RESULT_PREVIEW_CHARS = 500
+
+# Largest file body rendered into the right panel
+FILE_PREVIEW_CHARS = 64 * 1024
+
+# One `ls -la` entry: file type, seven more columns, then the name. Applied with
+# finditer over the whole output so large listings are scanned in one C-level pass;
+# the "total N" header never matches.
+_LS_RE = re.compile(r'^([d\-lbcps])\S*[ \t]+(?:\S+[ \t]+){7}(.+?)\r?$', re.MULTILINE)
+
+# Fallback router keywords, in priority order
+_INTENT_KEYWORDS = (
+    ("list_files", frozenset({"show files", "list files", "files on", "what files"})),
+    ("navigate", frozenset({"navigate to", "go to", "open", "show me the", "file content", "show content"})),
+    ("sync_files", frozenset({"share", "transfer", "copy", "send", "sync"})),
+    ("list_nodes", frozenset({"show nodes", "list nodes", "nodes of", "what nodes"})),
+    ("execute_command", frozenset({"run", "execute", "command"})),
+    ("write_file", frozenset({"add", "modify", "change", "edit", "update", "write"})),
+)
+# Zero-width lookahead so one scan reports every keyword, including overlapping ones
+_INTENT_RE = re.compile("(?=" + "|".join(
+    f"(?P<{intent}>{'|'.join(map(re.escape, sorted(words)))})"
+    for intent, words in _INTENT_KEYWORDS
+) + ")")
+
+
+def _classify_intent(message_lower: str) -> Optional[str]:
+    """Return the highest-priority intent whose keywords occur in the message"""
+    hits = {m.lastgroup for m in _INTENT_RE.finditer(message_lower)}
+    for intent, _ in _INTENT_KEYWORDS:
+        if intent in hits:
+            return intent
+    return None
+
+
+# Static right-panel fragments
+_WELCOME_HTML = """
+        <div style="padding: 40px; text-align: center; font-family: 'Inter', sans-serif;">
+            <h2 style="color: #1f2937; margin-bottom: 20px;">🚀 Welcome to NACC AI</h2>
+            <p style="color: #6b7280; font-size: 16px; line-height: 1.8; max-width: 500px; margin: 0 auto;">
+                Network Agentic Connection Call with AI-powered orchestration
+            </p>
+            <div style="margin-top: 40px; display: grid; gap: 15px;">
+                <div style="background: #f0fdf4; border: 1px solid #86efac; border-radius: 8px; padding: 15px;">
+                    <div style="font-size: 24px; margin-bottom: 5px;">📂</div>
+                    <div style="color: #166534; font-weight: 600;">File Operations</div>
+                </div>
+                <div style="background: #eff6ff; border: 1px solid #93c5fd; border-radius: 8px; padding: 15px;">
+                    <div style="font-size: 24px; margin-bottom: 5px;">💻</div>
+                    <div style="color: #1e40af; font-weight: 600;">Command Execution</div>
+                </div>
+                <div style="background: #fef3c7; border: 1px solid #fcd34d; border-radius: 8px; padding: 15px;">
+                    <div style="font-size: 24px; margin-bottom: 5px;">🌐</div>
+                    <div style="color: #92400e; font-weight: 600;">Node Management</div>
+                </div>
+            </div>
+        </div>
+        """
+_ERROR_HTML_TMPL = "<div class='error'>Error: {}</div>"
+_ERROR_DIV_TMPL = "<div class='error'>{}</div>"
+_INFO_DIV_TMPL = "<div class='info'>{}</div>"
+_FILE_UNREADABLE_HTML = "<div class='error'>File not found or not readable</div>"
+_READ_ERROR_HTML = "<div class='error'>Error reading file</div>"
+_NODES_ERROR_HTML = "<div class='error'>Error fetching nodes</div>"
+_SYNC_TARGET_HTML = "<div class='info'>Specify target node for sync</div>"
+_MODIFY_READY_HTML = "<div class='info'>Ready to modify files</div>"
+
+# Right-panel file browser fragments
+_FILE_BROWSER_HEADER_TMPL = """
+        <div style="padding: 20px; font-family: 'Inter', sans-serif;">
+            <h3 style="color: #1f2937; margin-bottom: 10px;">📂 {path}</h3>
+            <div style="background: #f9fafb; border-radius: 8px; padding: 15px; border: 1px solid #e5e7eb;">
+        """
+_FILE_ROW_TMPL = """
+                <div style="padding: 8px; margin: 5px 0; background: white; border-radius: 6px; border: 1px solid #e5e7eb; cursor: pointer; transition: all 0.2s;">
+                    {icon} <span style="font-family: 'Monaco', monospace; color: #374151;">{file}</span>
+                </div>
+            """
+
+# Right-panel node cards
+_NODES_VIEW_HEADER = """
+        <div style="padding: 20px; font-family: 'Inter', sans-serif;">
+            <h3 style="color: #1f2937; margin-bottom: 15px;">🌐 NACC Network Nodes</h3>
+        """
+_NODE_CARD_TMPL = """
+            <div class="nacc-node-card" style="border-left-color: {status_color};">
+                <div class="nacc-node-card-head">
+                    <h4>🖥️ {node_id}</h4>
+                    <span class="nacc-node-status" style="background: {status_color};">{status_label}</span>
+                </div>
+                <div class="nacc-node-card-body">
+                    <div>🏷️ <strong>Tags:</strong> {tags}</div>
+            {metrics}
+                </div>
+            </div>
+            """
+# (color, label) of the status chip, indexed by the node's healthy flag
+_NODE_STATUS = (("#ef4444", "OFFLINE"), ("#10b981", "ONLINE"))
+_NODE_METRICS_TMPL = """
+                    <div>💻 <strong>CPU:</strong> {cpu:.1f}%</div>
+                    <div>💾 <strong>Memory:</strong> {mem:.1f}%</div>
+                    <div>� <strong>Disk:</strong> {disk:.1f}%</div>
+                """
+
+# Shared no-op update for outputs a handler leaves untouched
+NO_UPDATE = gr.update()
+_NOOP_TAIL = (NO_UPDATE, NO_UPDATE, NO_UPDATE)  # right_panel, tool_log, context_bar
+
+# Tool log shown while a message is being routed
+_ROUTING_LOG = "⏳ Routing…"
+
+# Update yielded by the iter_* pipeline as each planned tool finishes: (tool_name, right_panel, tool_log)
+ToolProgress = Tuple[str, Optional[str], str]
+
+# Context bar under the chat, filled from a SessionState's attributes
+_CONTEXT_BAR_TMPL = (
+    "💡 **Context:** Session `{short_id}...` | "
+    "Node: `{current_node}` | Path: `{current_path}` | "
+    "Tools executed: {tool_count} | "
+    "Messages: {message_count}"
+)
+_NEW_CHAT_LOG = "🚀 New chat started! Context-aware AI routing active."
+_NEW_CHAT_CONTEXT = "💡 **Context:** New session | No tools executed yet"
+
+# Seconds to reuse the node inventory before refetching /nodes
+NODES_CACHE_TTL = 5.0
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,13 +202,68 @@ Created: """ + datetime.now().isoformat())
     return str(nacc_workspace)
 
 
+_ts_cache = (0, "")
+
+
+@lru_cache(maxsize=256)
+def _render_node_card(node_id: str, is_healthy: bool, tags: Tuple[str, ...], metrics: Optional[Tuple[float, float, float]]) -> str:
+    """Render one node card; cached on the node's visible state"""
+    metrics_html = ""
+    if metrics:
+        cpu, mem, disk = metrics
+        metrics_html = _NODE_METRICS_TMPL.format(cpu=cpu, mem=mem, disk=disk)
+    status_color, status_label = _NODE_STATUS[is_healthy]
+    return _NODE_CARD_TMPL.format(
+        status_color=status_color,
+        node_id=escape(node_id),
+        status_label=status_label,
+        tags=escape(', '.join(tags)),
+        metrics=metrics_html
+    )
+
+
+def new_session_id() -> str:
+    """Random 8-hex-char session ID (not sequential, which would reuse persisted IDs after a restart)"""
+    return secrets.token_hex(4)
+
+
+def _run_to_completion(steps: Generator[Any, None, Any]) -> Any:
+    """Drive a progress generator to the end, discarding its updates, and return its result"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, reformatted at most once per second"""
+    global _ts_cache
+    second = int(time.time())
+    cached_second, cached_iso = _ts_cache
+    if second == cached_second:
+        return cached_iso
+    iso = datetime.fromtimestamp(second).isoformat()
+    _ts_cache = (second, iso)
+    return iso
+
+
 class SessionState:
     """Manages conversation session state and context"""
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.conversation_history: List[Dict[str, Any]] = []
-        self.tool_execution_log: List[Dict[str, Any]] = []
-        self.context_window_size = 10  # Last N messages for AI context
+        self.short_id = session_id[:6]  # Shown in the context bar
+        self.context_window_size = 10  # Messages kept when the window resets
+        # Append-only window: grows until window_cap, then restarts from the last
+        # context_window_size messages, so consecutive turns share a prompt prefix
+        self.window_start = 0  # Absolute message index where the window begins
+        self.window_cap = 20
+        self.conversation_history: Deque[Dict[str, Any]] = deque(maxlen=HISTORY_LIMIT)
+        self.tool_execution_log: Deque[Dict[str, Any]] = deque(maxlen=TOOL_LOG_LIMIT)
+        self.message_count = 0
+        self.tool_count = 0
+        self.last_result: Any = None  # Full result of the latest tool execution
+        self.sent_output_hashes: Dict[str, int] = {}  # Hash of each UI output last sent to the browser
         self.current_node = "macbook-local"  # Default to local Mac
         self.current_path = get_nacc_workspace()  # Dynamic workspace
         self.created_at = datetime.now()
@@ -69,53 +273,159 @@ class SessionState:
         message = {
             "role": role,
             "content": content,
-            "timestamp": datetime.now().isoformat(),
+            "content_preview": content[:CONTENT_PREVIEW_CHARS],
+            "timestamp": _now_iso(),
             "metadata": metadata or {}
         }
         self.conversation_history.append(message)
+        self.message_count += 1
+        if self.message_count - self.window_start > self.window_cap:
+            self.window_start = self.message_count - self.context_window_size
         
     def add_tool_execution(self, tool_name: str, params: Dict, result: Any, success: bool):
         """Log tool execution for debugging and context"""
+        self.last_result = result
         self.tool_execution_log.append({
             "tool": tool_name,
             "params": params,
-            "result": result,
+            "result_preview": json.dumps(result, default=str)[:RESULT_PREVIEW_CHARS],
             "success": success,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         })
+        self.tool_count += 1
         
     def get_context_window(self) -> List[Dict[str, Any]]:
         """Get recent messages for AI context"""
-        return self.conversation_history[-self.context_window_size:]
+        first_kept = self.message_count - len(self.conversation_history)
+        return list(islice(self.conversation_history, max(self.window_start - first_kept, 0), None))
+    
+    def output_changed(self, name: str, value: Any) -> bool:
+        """Record an output about to be sent; False if it matches what the browser already has"""
+        value_hash = hash(value)
+        if self.sent_output_hashes.get(name) == value_hash:
+            return False
+        self.sent_output_hashes[name] = value_hash
+        return True
+    
+    def recent_tools(self, count: int = 3) -> List[Dict[str, Any]]:
+        """Get the last few tool executions, oldest first"""
+        return list(islice(reversed(self.tool_execution_log), count))[::-1]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the session for persistence"""
+        return {
+            "session_id": self.session_id,
+            "conversation_history": list(self.conversation_history),
+            "tool_execution_log": list(self.tool_execution_log),
+            "message_count": self.message_count,
+            "tool_count": self.tool_count,
+            "window_start": self.window_start,
+            "current_node": self.current_node,
+            "current_path": self.current_path,
+            "created_at": self.created_at.isoformat(),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SessionState":
+        """Restore a session serialized with to_dict"""
+        session = cls(data["session_id"])
+        session.conversation_history.extend(data.get("conversation_history", []))
+        session.tool_execution_log.extend(data.get("tool_execution_log", []))
+        session.message_count = data.get("message_count", len(session.conversation_history))
+        session.tool_count = data.get("tool_count", len(session.tool_execution_log))
+        session.window_start = data.get("window_start", 0)
+        session.current_node = data.get("current_node", session.current_node)
+        session.current_path = data.get("current_path", session.current_path)
+        if "created_at" in data:
+            session.created_at = datetime.fromisoformat(data["created_at"])
+        return session
     
     def clear(self):
         """Clear conversation history"""
-        self.conversation_history = []
-        self.tool_execution_log = []
+        self.conversation_history.clear()
+        self.window_start = 0
+        self.tool_execution_log.clear()
+        self.message_count = 0
+        self.tool_count = 0
+        self.last_result = None
         
 
 class NACCConversationUI:
-    def __init__(self):
-        self.sessions: Dict[str, SessionState] = {}
+    def __init__(self, session_store: Optional[SessionStore] = None):
+        # Live sessions; an LRU in front of the SQLite store when one is configured
+        self.sessions: "OrderedDict[str, SessionState]" = OrderedDict()
+        self._sessions_lock = threading.Lock()
+        self.session_store = session_store if session_store is not None else default_session_store()
         self.default_node = "kali-vm"
+        
+        # Per-tool result renderers used by _execute_plan
+        self._tool_renderers = {
+            "write_file": self._render_write_file,
+            "list_files": self._render_list_files,
+            "read_file": self._render_read_file,
+        }
+        # (fetched_at, nodes) from the last /nodes call
+        self._nodes_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        
+    @cached_property
+    def intent_parser(self) -> AIIntentParser:
+        """AI intent parser, built on first use"""
         # Pure AI mode - no fallback heuristics
         # 30s timeout for complex network orchestration reasoning
-        self.intent_parser = AIIntentParser(
+        return AIIntentParser(
             model_name="mistral-nemo", 
             timeout=30.0, 
             use_ai=True,
             use_fallback=False  # Pure AI control
         )
+    
+    @cached_property
+    def _http(self):
+        """Pooled keep-alive connections to the orchestrator, built on first use"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
     def get_or_create_session(self, session_id: Optional[str] = None) -> SessionState:
         """Get existing session or create new one"""
         if session_id is None:
-            session_id = hashlib.md5(str(datetime.now().timestamp()).encode()).hexdigest()[:8]
+            session_id = new_session_id()
         
-        if session_id not in self.sessions:
-            self.sessions[session_id] = SessionState(session_id)
+        with self._sessions_lock:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                self.sessions.move_to_end(session_id)
+                return session
         
-        return self.sessions[session_id]
+        data = self.session_store.load(session_id) if self.session_store else None
+        loaded = SessionState.from_dict(data) if data else SessionState(session_id)
+        with self._sessions_lock:
+            # Another handler may have created the same session while we loaded
+            session = self.sessions.setdefault(session_id, loaded)
+            self.sessions.move_to_end(session_id)
+            # Without a store, evicting would drop the session's history for good
+            if self.session_store is not None and len(self.sessions) > SESSION_CACHE_SIZE:
+                self.sessions.popitem(last=False)  # Already persisted by save_session
+        return session
+    
+    def save_session(self, session: SessionState):
+        """Persist a session to the SQLite store"""
+        if self.session_store is None:
+            return
+        try:
+            self.session_store.save(session.session_id, session.to_dict())
+        except Exception as e:
+            logger.warning(f"Failed to persist session {session.session_id}: {e}")
     
     def get_user_home(self, node_id: str) -> str:
         """Get user home directory for a node"""
@@ -126,36 +436,64 @@ class NACCConversationUI:
         return "/home/user"
     
     def fetch_available_nodes(self) -> List[Dict[str, Any]]:
-        """Fetch available nodes from orchestrator for AI context"""
+        """Fetch available nodes from orchestrator for AI context (cached for NODES_CACHE_TTL)"""
+        if self._nodes_cache is not None:
+            fetched_at, nodes = self._nodes_cache
+            if time.monotonic() - fetched_at < NODES_CACHE_TTL:
+                return nodes
+        nodes = self._fetch_available_nodes()
+        if nodes is None:
+            return []  # Not cached, so the next turn retries
+        self._nodes_cache = (time.monotonic(), nodes)
+        return nodes
+    
+    def invalidate_nodes_cache(self):
+        """Drop the cached node inventory so the next turn refetches it"""
+        self._nodes_cache = None
+    
+    def _fetch_available_nodes(self) -> Optional[List[Dict[str, Any]]]:
+        """Node inventory formatted for the AI, or None when the orchestrator couldn't be reached"""
         try:
             result = self.call_orchestrator_api("/nodes", method="GET")
-            if "error" not in result and "nodes" in result:
-                nodes = result["nodes"]
-                # Format for AI consumption
-                return [
-                    {
-                        "node_id": node.get("node_id", "unknown"),
-                        "tags": node.get("tags", []),
-                        "os_type": node.get("os_type", "unknown"),
-                        "status": node.get("status", "unknown"),
-                        "capabilities": node.get("capabilities", [])
-                    }
-                    for node in nodes
-                ]
-            return []
+            if isinstance(result, dict) and "error" in result:
+                logger.warning(f"Failed to fetch nodes: {result['error']}")
+                return None
+            # /nodes returns a bare list; a {"nodes": [...]} wrapper is accepted too
+            nodes = result if isinstance(result, list) else result.get("nodes", [])
+            # Format for AI consumption
+            return [
+                {
+                    "node_id": node.get("node_id", "unknown"),
+                    "tags": node.get("tags", []),
+                    "os_type": node.get("os_type", "unknown"),
+                    "status": node.get("status", "unknown"),
+                    "capabilities": node.get("capabilities", [])
+                }
+                for node in nodes
+            ]
         except Exception as e:
             logger.warning(f"Failed to fetch nodes: {e}")
-            return []
+            return None
         
     def call_orchestrator_api(self, endpoint: str, method: str = "GET", data: Optional[Dict] = None) -> Dict:
         """Call the orchestrator API"""
         url = f"{ORCHESTRATOR_URL}{endpoint}"
         try:
             if method == "GET":
-                response = requests.get(url, timeout=30)
+                response = self._http.get(url, timeout=30)
             elif method == "POST":
-                response = requests.post(url, json=data, timeout=30)
+                if ORJSON_AVAILABLE:
+                    response = self._http.post(
+                        url,
+                        data=orjson.dumps(data),
+                        headers={"Content-Type": "application/json"},
+                        timeout=30
+                    )
+                else:
+                    response = self._http.post(url, json=data, timeout=30)
             response.raise_for_status()
+            if ORJSON_AVAILABLE:
+                return orjson.loads(response.content)
             return response.json()
         except Exception as e:
             return {"error": str(e)}
@@ -193,20 +531,13 @@ class NACCConversationUI:
         session.add_tool_execution("read_file", {"filepath": filepath}, result, "error" not in result)
         return result
     
-    def tool_write_file(self, session: SessionState, filepath: str, content: str) -> Dict:
-        """Write content to file"""
-        # Using echo for simple writes; real impl should use write-file endpoint
-        result = self.call_orchestrator_api(
-            "/commands/execute",
+    def tool_write_file(self, filepath: str, content: str) -> Dict:
+        """Write content to file (callers log the execution, as with tool_batch_execute)"""
+        return self.call_orchestrator_api(
+            "/files/write",
             method="POST",
-            data={
-                "description": f"Write to file {filepath}",
-                "command": ["sh", "-c", f"echo '{content}' > {filepath}"],
-                "parallelism": 1
-            }
+            data={"path": filepath, "content": content}
         )
-        session.add_tool_execution("write_file", {"filepath": filepath}, result, "error" not in result)
-        return result
     
     def tool_execute_command(self, session: SessionState, description: str, command: list) -> Dict:
         """Execute arbitrary command via orchestrator"""
@@ -222,6 +553,39 @@ class NACCConversationUI:
         session.add_tool_execution("execute_command", {"command": command}, result, "error" not in result)
         return result
     
+    def tool_batch_execute(self, commands: List[Dict]) -> List[Dict]:
+        """Execute several commands in a single orchestrator round-trip"""
+        result = self.call_orchestrator_api(
+            "/commands/batch",
+            method="POST",
+            data={"commands": commands}
+        )
+        if "error" in result:
+            return [result] * len(commands)
+        return result.get("results", [])
+    
+    def _build_tool_command(self, session: SessionState, tool_name: str, params: Dict) -> Optional[Tuple[Dict, Dict]]:
+        """Translate a planned tool call into a command payload and its log params"""
+        if tool_name == "write_file":
+            filepath = params.get("filepath")
+            # Not a command: the arguments for tool_write_file
+            return {"filepath": filepath, "content": params.get("content", "")}, {"filepath": filepath}
+        if tool_name == "list_files":
+            target_path = params.get("path") or session.current_path
+            return {
+                "description": f"List files in {target_path}",
+                "command": ["ls", "-la", target_path],
+                "parallelism": 1
+            }, {"path": target_path}
+        if tool_name == "read_file":
+            filepath = params.get("filepath")
+            return {
+                "description": f"Read file {filepath}",
+                "command": ["cat", filepath],
+                "parallelism": 1
+            }, {"filepath": filepath}
+        return None
+    
     def tool_list_nodes(self) -> Dict:
         """List all nodes in NACC network"""
         return self.call_orchestrator_api("/nodes")
@@ -232,6 +596,7 @@ class NACCConversationUI:
     
     def tool_sync_files(self, source_node: str, target_nodes: List[str], strategy: str = "mirror") -> Dict:
         """Sync files between nodes"""
+        self.invalidate_nodes_cache()
         return self.call_orchestrator_api(
             "/sync",
             method="POST",
@@ -253,15 +618,24 @@ class NACCConversationUI:
             }
         )
     
-    def process_message(self, user_message: str, chat_history: List, session_id: str = "default") -> Tuple[List, str, str]:
+    def process_message(self, user_message: str, chat_history: List, session_id: str = "default") -> Tuple[List, Optional[str], str]:
         """
         Process user message with full context awareness
         
         Returns:
             - Updated chat history
-            - Right panel content (HTML)
+            - Right panel content (HTML), or None to leave the panel as it is
             - Tool execution log
         """
+        return _run_to_completion(self.iter_process_message(user_message, chat_history, session_id))
+    
+    def iter_process_message(self, user_message: str, chat_history: List, session_id: str = "default") -> Generator[ToolProgress, None, Tuple[List, Optional[str], str]]:
+        """
+        Generator form of process_message for streaming handlers
+        
+        Yields (tool_name, right_panel, tool_log) as each planned tool's result is
+        rendered, then returns what process_message returns.
+        """
         session = self.get_or_create_session(session_id)
         
         # Add user message to session
@@ -269,24 +643,29 @@ class NACCConversationUI:
         chat_history.append({"role": "user", "content": user_message})
         
         # Get AI routing decision with full context
-        ai_response, right_panel, tool_log = self.handle_intent_with_ai(user_message, session)
+        ai_response, right_panel, tool_log = yield from self._iter_intent_with_ai(user_message, session)
         
         # Add AI response to session
-        session.add_message("assistant", ai_response, {"tools_used": len(session.tool_execution_log)})
+        session.add_message("assistant", ai_response, {"tools_used": session.tool_count})
         chat_history.append({"role": "assistant", "content": ai_response})
+        self.save_session(session)
         
         return chat_history, right_panel, tool_log
     
-    def handle_intent_with_ai(self, message: str, session: SessionState) -> Tuple[str, str, str]:
+    def handle_intent_with_ai(self, message: str, session: SessionState) -> Tuple[str, Optional[str], str]:
         """
         AI-powered intent classification and tool orchestration
         Uses AIIntentParser with Docker Mistral for precise tool execution
         
         Returns:
             - AI response text
-            - Right panel HTML
+            - Right panel HTML, or None when nothing new was produced
             - Tool execution log
         """
+        return _run_to_completion(self._iter_intent_with_ai(message, session))
+    
+    def _iter_intent_with_ai(self, message: str, session: SessionState) -> Generator[ToolProgress, None, Tuple[str, Optional[str], str]]:
+        """handle_intent_with_ai, yielding progress from the plan as each tool finishes"""
         tool_log = "🤖 **AGENTIC AI**: Analyzing network orchestration request...\n"
         
         # Fetch available nodes for intelligent routing
@@ -301,144 +680,186 @@ class NACCConversationUI:
             "os_type": "linux",  # TODO: Get from node metadata
             "available_nodes": available_nodes,  # NEW: Network awareness
             "conversation_history": [
-                {"role": msg["role"], "content": msg["content"][:100]}
+                {"role": msg["role"], "content": msg["content_preview"]}
                 for msg in session.get_context_window()
             ],
-            "recent_tools": session.tool_execution_log[-3:] if session.tool_execution_log else []
+            "recent_tools": session.recent_tools(3)
         }
         
         # Use AI intent parser
         try:
             execution_plan = self.intent_parser.parse(message, context)
             
-            tool_log += f"\n📋 **Intent**: {execution_plan.intent}\n"
-            tool_log += f"🖥️  **Target Node**: {execution_plan.target_node or 'auto-select'}\n"
-            tool_log += f"⚡ **Strategy**: {execution_plan.execution_strategy}\n"
-            tool_log += f"🎯 **Path**: {execution_plan.target_path or 'N/A'}\n"
-            tool_log += f"💪 **Confidence**: {execution_plan.confidence:.0%}\n"
-            tool_log += f"🧠 **Reasoning**: {execution_plan.reasoning}\n"
-            tool_log += f"🔧 **Tools**: {len(execution_plan.tools)} tool(s)\n\n"
+            # One concatenation for the whole plan summary rather than one per line
+            tool_log += (
+                f"\n📋 **Intent**: {execution_plan.intent}\n"
+                f"🖥️  **Target Node**: {execution_plan.target_node or 'auto-select'}\n"
+                f"⚡ **Strategy**: {execution_plan.execution_strategy}\n"
+                f"🎯 **Path**: {execution_plan.target_path or 'N/A'}\n"
+                f"💪 **Confidence**: {execution_plan.confidence:.0%}\n"
+                f"🧠 **Reasoning**: {execution_plan.reasoning}\n"
+                f"🔧 **Tools**: {len(execution_plan.tools)} tool(s)\n\n"
+            )
             
             # Execute the plan
-            ai_response, right_panel = self._execute_plan(execution_plan, session, tool_log)
+            ai_response, right_panel = yield from self._iter_plan(execution_plan, session, tool_log)
             
             return ai_response, right_panel, tool_log
             
         except Exception as e:
             logger.error(f"AI intent parsing failed: {e}")
-            tool_log += f"⚠️ Error: {str(e)}\n"
-            tool_log += "Falling back to pattern matching...\n"
+            tool_log += f"⚠️ Error: {str(e)}\nFalling back to pattern matching...\n"
             
             # Fallback to old pattern matching
             ai_response, right_panel = self._route_with_patterns(message, session, tool_log)
             return ai_response, right_panel, tool_log
     
-    def _execute_plan(self, plan: ExecutionPlan, session: SessionState, tool_log: str) -> Tuple[str, str]:
+    def _execute_plan(self, plan: ExecutionPlan, session: SessionState, tool_log: str) -> Tuple[str, Optional[str]]:
         """
         Execute the AI's structured plan
         
         Returns:
             - AI response text
-            - Right panel HTML
+            - Right panel HTML, or None if no tool rendered output
         """
+        return _run_to_completion(self._iter_plan(plan, session, tool_log))
+    
+    def _iter_plan(self, plan: ExecutionPlan, session: SessionState, tool_log: str) -> Generator[ToolProgress, None, Tuple[str, Optional[str]]]:
+        """_execute_plan, yielding (tool_name, right_panel, tool_log) after each tool is rendered"""
         ai_response = ""
-        right_panel = ""
+        right_panel = None
         
-        # Execute each tool in order
+        # First pass: translate every tool call into an orchestrator command
+        planned = []
         for tool_call in plan.tools:
             tool_name = tool_call.tool_name
             params = tool_call.parameters
             
             logger.info(f"Executing tool: {tool_name} with params: {params}")
             
-            if tool_name == "write_file":
-                # Create file
-                filepath = params.get("filepath")
-                content = params.get("content", "")
-                
-                result = self.tool_write_file(session, filepath, content)
-                
-                if "error" not in result or result.get("results", [{}])[0].get("exit_code") == 0:
-                    ai_response = f"✅ **File created successfully!**\n\nCreated `{Path(filepath).name}` in `{Path(filepath).parent}`\n\nContent:\n```\n{content}\n```"
-                    right_panel = f"""
-                    <div style="padding: 20px; font-family: 'Inter', sans-serif;">
-                        <h3 style="color: #10b981;">✅ File Created Successfully</h3>
-                        <div style="background: #f0fdf4; border-left: 4px solid #10b981; padding: 15px; border-radius: 8px; margin-top: 15px;">
-                            <div style="font-weight: 600; margin-bottom: 10px;">📄 {Path(filepath).name}</div>
-                            <div style="color: #6b7280; font-size: 14px;">Path: {filepath}</div>
-                            <div style="color: #6b7280; font-size: 14px;">Size: {len(content)} bytes</div>
-                        </div>
-                        <div style="background: #1e293b; border-radius: 8px; padding: 15px; margin-top: 15px; overflow: auto;">
-                            <pre style="margin: 0; color: #e2e8f0; font-family: 'Monaco', monospace; font-size: 13px;">{content}</pre>
-                        </div>
-                    </div>
-                    """
-                else:
-                    ai_response = f"❌ Failed to create file: {result.get('error', 'Unknown error')}"
-                    right_panel = f"<div class='error'>Error: {result.get('error')}</div>"
-            
-            elif tool_name == "list_files":
-                # List directory
-                path = params.get("path", session.current_path)
-                session.current_path = path  # Update session
-                
-                result = self.tool_list_files(session, path)
-                
-                if "error" not in result and "results" in result:
-                    stdout = result["results"][0].get("stdout", "")
-                    lines = stdout.strip().split("\n")[1:]  # Skip total line
-                    files = []
-                    for line in lines:
-                        parts = line.split()
-                        if len(parts) >= 9:
-                            filename = " ".join(parts[8:])
-                            if parts[0].startswith('d'):
-                                files.append(filename + "/")
-                            else:
-                                files.append(filename)
-                    
-                    file_list = "\n".join([f"• {f}" for f in files])
-                    ai_response = f"📂 **Directory Contents**: `{path}`\n\n{file_list}\n\n✅ Found {len(files)} items"
-                    right_panel = self.render_file_browser(files, path)
-                else:
-                    ai_response = f"❌ Failed to list files: {result.get('error', 'Unknown error')}"
-                    right_panel = f"<div class='error'>Error: {result.get('error')}</div>"
+            if tool_name == "list_files":
+                session.current_path = params.get("path", session.current_path)  # Update session
+            built = self._build_tool_command(session, tool_name, params)
+            if built is not None:
+                planned.append((tool_call, *built))
+        
+        # Batch consecutive commands into one round-trip; writes go through tool_write_file in plan order.
+        # Each round-trip's results are rendered as soon as it returns.
+        start = 0
+        while start < len(planned):
+            if planned[start][0].tool_name == "write_file":
+                end = start + 1
+                results = [self.tool_write_file(**planned[start][1])]
+            else:
+                end = start
+                while end < len(planned) and planned[end][0].tool_name != "write_file":
+                    end += 1
+                results = self.tool_batch_execute([payload for _, payload, _ in planned[start:end]])
             
-            elif tool_name == "read_file":
-                # Read file
-                filepath = params.get("filepath")
-                result = self.tool_read_file(session, filepath)
+            for offset, (tool_call, _, log_params) in enumerate(planned[start:end]):
+                tool_name = tool_call.tool_name
+                params = tool_call.parameters
+                result = results[offset] if offset < len(results) else {"error": "Missing batch result"}
+                session.add_tool_execution(tool_name, log_params, result, "error" not in result)
                 
-                if "error" not in result and "results" in result:
-                    stdout = result["results"][0].get("stdout", "")
-                    exit_code = result["results"][0].get("exit_code", 1)
-                    
-                    if exit_code == 0 and stdout:
-                        ai_response = f"📄 **File Contents**: `{Path(filepath).name}`\n\n```\n{stdout[:500]}{'...' if len(stdout) > 500 else ''}\n```"
-                        right_panel = self.render_file_content(Path(filepath).name, stdout)
-                    else:
-                        ai_response = f"❌ Could not read file: {filepath}"
-                        right_panel = f"<div class='error'>File not found or not readable</div>"
-                else:
-                    ai_response = f"❌ Error reading file: {result.get('error', 'Unknown error')}"
-                    right_panel = f"<div class='error'>Error: {result.get('error')}</div>"
+                handler = self._tool_renderers.get(tool_name)
+                if handler:
+                    ai_response, right_panel = handler(params, log_params, result)
+                yield tool_name, right_panel, tool_log
+            start = end
         
         return ai_response, right_panel
     
-    def _route_with_patterns(self, message: str, session: SessionState, tool_log_prefix: str) -> Tuple[str, str]:
+    def _parse_ls(self, stdout: str) -> List[str]:
+        """Parse `ls -la` output into entry names, directories suffixed with '/'"""
+        return [
+            m.group(2) + ("/" if m.group(1) == "d" else "")
+            for m in _LS_RE.finditer(stdout)
+        ]
+    
+    def _render_write_file(self, params: Dict, log_params: Dict, result: Dict) -> Tuple[str, str]:
+        """Render the outcome of a write_file tool call"""
+        # Create file
+        filepath = params.get("filepath")
+        content = params.get("content", "")
+        file_path = Path(filepath)
+        name, parent = file_path.name, file_path.parent
+
+        if "error" not in result and result.get("success"):
+            ai_response = f"✅ **File created successfully!**\n\nCreated `{name}` in `{parent}`\n\nContent:\n```\n{content}\n```"
+            right_panel = f"""
+            <div style="padding: 20px; font-family: 'Inter', sans-serif;">
+                <h3 style="color: #10b981;">✅ File Created Successfully</h3>
+                <div style="background: #f0fdf4; border-left: 4px solid #10b981; padding: 15px; border-radius: 8px; margin-top: 15px;">
+                    <div style="font-weight: 600; margin-bottom: 10px;">📄 {escape(name)}</div>
+                    <div style="color: #6b7280; font-size: 14px;">Path: {escape(filepath)}</div>
+                    <div style="color: #6b7280; font-size: 14px;">Size: {len(content)} bytes</div>
+                </div>
+                <div style="background: #1e293b; border-radius: 8px; padding: 15px; margin-top: 15px; overflow: auto;">
+                    <pre style="margin: 0; color: #e2e8f0; font-family: 'Monaco', monospace; font-size: 13px;">{escape(content)}</pre>
+                </div>
+            </div>
+            """
+        else:
+            error = result.get('error') or result.get('message') or 'Unknown error'
+            ai_response = f"❌ Failed to create file: {error}"
+            right_panel = _ERROR_HTML_TMPL.format(escape(str(error)))
+        return ai_response, right_panel
+    
+    def _render_list_files(self, params: Dict, log_params: Dict, result: Dict) -> Tuple[str, str]:
+        """Render the outcome of a list_files tool call"""
+        # List directory
+        path = log_params["path"]
+
+        if "error" not in result and "results" in result:
+            stdout = result["results"][0].get("stdout", "")
+            files = self._parse_ls(stdout)
+
+            file_list = "\n".join([f"• {f}" for f in files])
+            ai_response = f"📂 **Directory Contents**: `{path}`\n\n{file_list}\n\n✅ Found {len(files)} items"
+            right_panel = self.render_file_browser(files, path)
+        else:
+            ai_response = f"❌ Failed to list files: {result.get('error', 'Unknown error')}"
+            right_panel = _ERROR_HTML_TMPL.format(escape(str(result.get('error'))))
+        return ai_response, right_panel
+    
+    def _render_read_file(self, params: Dict, log_params: Dict, result: Dict) -> Tuple[str, str]:
+        """Render the outcome of a read_file tool call"""
+        # Read file
+        filepath = params.get("filepath")
+        name = Path(filepath).name
+
+        if "error" not in result and "results" in result:
+            stdout = result["results"][0].get("stdout", "")
+            exit_code = result["results"][0].get("exit_code", 1)
+
+            if exit_code == 0 and stdout:
+                ai_response = f"📄 **File Contents**: `{name}`\n\n```\n{stdout[:500]}{'...' if len(stdout) > 500 else ''}\n```"
+                right_panel = self.render_file_content(name, stdout)
+            else:
+                ai_response = f"❌ Could not read file: {filepath}"
+                right_panel = _FILE_UNREADABLE_HTML
+        else:
+            ai_response = f"❌ Error reading file: {result.get('error', 'Unknown error')}"
+            right_panel = _ERROR_HTML_TMPL.format(escape(str(result.get('error'))))
+        return ai_response, right_panel
+    
+    def _route_with_patterns(self, message: str, session: SessionState, tool_log_prefix: str) -> Tuple[str, Optional[str]]:
         """
         Enhanced pattern-based routing with session context
         
         Returns:
             - AI response text
-            - Right panel HTML
+            - Right panel HTML, or None for plain chat
         """
         message_lower = message.lower()
         tool_log = tool_log_prefix
-        right_panel = ""
+        right_panel = None
+        
+        intent = _classify_intent(message_lower)
         
         # Intent: List files
-        if any(word in message_lower for word in ["show files", "list files", "files on", "what files"]):
+        if intent == "list_files":
             tool_log += "🔧 Using tool: list_files\n"
             
             # Use tool_list_files with session context
@@ -447,16 +868,7 @@ class NACCConversationUI:
             if "error" not in result and "results" in result:
                 stdout = result["results"][0].get("stdout", "")
                 # Parse ls output
-                lines = stdout.strip().split("\n")[1:]  # Skip total line
-                files = []
-                for line in lines:
-                    parts = line.split()
-                    if len(parts) >= 9:
-                        filename = " ".join(parts[8:])
-                        if parts[0].startswith('d'):
-                            files.append(filename + "/")
-                        else:
-                            files.append(filename)
+                files = self._parse_ls(stdout)
                 
                 file_list = "\n".join([f"• {f}" for f in files])
                 ai_response = f"Sure! 📂 Using **list_files** tool.\n\nHere are the files on **{session.current_node}** at `{session.current_path}`:\n\n{file_list}"
@@ -466,10 +878,10 @@ class NACCConversationUI:
             else:
                 error_msg = result.get("error", "Unknown error")
                 ai_response = f"Sorry, I encountered an error: {error_msg}"
-                right_panel = f"<div class='error'>Error: {error_msg}</div>"
+                right_panel = _ERROR_HTML_TMPL.format(escape(str(error_msg)))
         
         # Intent: Navigate to directory / Read file
-        elif any(word in message_lower for word in ["navigate to", "go to", "open", "show me the", "file content", "show content"]):
+        elif intent == "navigate":
             # Extract filename (simple pattern matching)
             words = message.split()
             filename = None
@@ -509,32 +921,23 @@ class NACCConversationUI:
                         
                         if "error" not in list_result and "results" in list_result:
                             stdout = list_result["results"][0].get("stdout", "")
-                            lines = stdout.strip().split("\n")[1:]  # Skip total line
-                            files = []
-                            for line in lines:
-                                parts = line.split()
-                                if len(parts) >= 9:
-                                    fname = " ".join(parts[8:])
-                                    if parts[0].startswith('d'):
-                                        files.append(fname + "/")
-                                    else:
-                                        files.append(fname)
+                            files = self._parse_ls(stdout)
                             
                             file_list = "\n".join([f"• {f}" for f in files])
                             ai_response = f"Navigating... 📂 Using **list_files** tool.\n\nFolder **{filename}** contains:\n\n{file_list}"
                             right_panel = self.render_file_browser(files, full_path)
                         else:
                             ai_response = f"Sorry, couldn't access **{filename}**"
-                            right_panel = f"<div class='error'>Could not access {filename}</div>"
+                            right_panel = _ERROR_DIV_TMPL.format(f"Could not access {escape(filename)}")
                 else:
                     ai_response = f"Sorry, couldn't read **{filename}**"
-                    right_panel = f"<div class='error'>Error reading file</div>"
+                    right_panel = _READ_ERROR_HTML
             else:
                 ai_response = "Could you specify which file or folder you want to navigate to?"
-                right_panel = ""
+                right_panel = None
         
         # Intent: Transfer file
-        elif any(word in message_lower for word in ["share", "transfer", "copy", "send", "sync"]):
+        elif intent == "sync_files":
             tool_log += "🔧 Using tool: sync_files\n"
             
             # Extract target nodes (simplified)
@@ -551,78 +954,70 @@ class NACCConversationUI:
                     right_panel = f"<div class='success'>Sync initiated to {len(target_nodes)} node(s)</div>"
                 else:
                     ai_response = f"Sync encountered an error: {result.get('error')}"
-                    right_panel = f"<div class='error'>{result.get('error')}</div>"
+                    right_panel = _ERROR_DIV_TMPL.format(escape(str(result.get('error'))))
             else:
                 ai_response = "I can sync files between nodes! Which node would you like to sync to?"
-                right_panel = "<div class='info'>Specify target node for sync</div>"
+                right_panel = _SYNC_TARGET_HTML
         
         # Intent: Show nodes
-        elif any(word in message_lower for word in ["show nodes", "list nodes", "nodes of", "what nodes"]):
+        elif intent == "list_nodes":
             tool_log += "🔧 Using tool: list_nodes\n"
             result = self.tool_list_nodes()
             
             if "error" not in result and isinstance(result, list):
-                ai_response = "Yes! Here are the nodes in the NACC network:\n\n"
+                lines = ["Yes! Here are the nodes in the NACC network:\n\n"]
                 for node in result:
                     node_id = node.get('node_id') or node.get('id', 'Unknown')
-                    ai_response += f"**{node_id}**\n"
-                    ai_response += f"  • Status: {'🟢 Online' if node.get('healthy') else '🔴 Offline'}\n"
-                    ai_response += f"  • Tags: {', '.join(node.get('tags', []))}\n"
+                    lines.append(f"**{node_id}**\n")
+                    lines.append(f"  • Status: {'🟢 Online' if node.get('healthy') else '🔴 Offline'}\n")
+                    lines.append(f"  • Tags: {', '.join(node.get('tags', []))}\n")
                     metrics = node.get('metrics', {})
                     if metrics:
-                        ai_response += f"  • CPU: {metrics.get('cpu_percent', 0):.1f}%\n"
-                        ai_response += f"  • Memory: {metrics.get('memory_percent', 0):.1f}%\n"
-                    ai_response += "\n"
+                        lines.append(f"  • CPU: {metrics.get('cpu_percent', 0):.1f}%\n")
+                        lines.append(f"  • Memory: {metrics.get('memory_percent', 0):.1f}%\n")
+                    lines.append("\n")
+                ai_response = "".join(lines)
                 
                 right_panel = self.render_nodes_view(result)
             else:
                 ai_response = "Sorry, couldn't fetch nodes information."
-                right_panel = "<div class='error'>Error fetching nodes</div>"
+                right_panel = _NODES_ERROR_HTML
         
         # Intent: Execute command
-        elif any(word in message_lower for word in ["run", "execute", "command"]):
+        elif intent == "execute_command":
             tool_log += "🔧 Using tool: execute_command\n"
             # Try to extract command from message
             ai_response = "I can execute commands! What command would you like me to run?\n\nExample: 'run ls -la' or 'execute whoami'"
-            right_panel = "<div class='info'>Ready to execute commands on " + session.current_node + "</div>"
+            right_panel = _INFO_DIV_TMPL.format("Ready to execute commands on " + escape(session.current_node))
         
         # Intent: Modify file
-        elif any(word in message_lower for word in ["add", "modify", "change", "edit", "update", "write"]):
+        elif intent == "write_file":
             tool_log += "🔧 Using tool: write_file\n"
             # Extract filename and content (simplified)
             ai_response = "I can modify files! Please specify:\n\n• Which file to edit\n• What changes to make\n\nExample: 'Add a print statement to app.py'"
-            right_panel = "<div class='info'>Ready to modify files</div>"
+            right_panel = _MODIFY_READY_HTML
         
         # Default: General chat with context awareness
         else:
             # Show context-aware help
             context_hint = ""
             if session.conversation_history:
-                context_hint = f"\n\n💡 Current context:\n• Node: **{session.current_node}**\n• Path: `{session.current_path}`\n• Tools used: {len(session.tool_execution_log)}"
+                context_hint = f"\n\n💡 Current context:\n• Node: **{session.current_node}**\n• Path: `{session.current_path}`\n• Tools used: {session.tool_count}"
             
             ai_response = f"I'm NACC AI! 🤖 I can help you:\n\n• 📂 Browse files across nodes\n• 📝 Read and modify files\n• 🔄 Transfer files between machines\n• 💻 Execute commands\n• 🌐 Manage nodes{context_hint}\n\nWhat would you like to do?"
-            right_panel = self.render_welcome_panel()
+            right_panel = None  # Pure chat: keep the last tool output on screen
         
         return ai_response, right_panel
     
     def render_file_browser(self, files: List[str], current_path: str) -> str:
         """Render file browser in right panel"""
-        html = f"""
-        <div style="padding: 20px; font-family: 'Inter', sans-serif;">
-            <h3 style="color: #1f2937; margin-bottom: 10px;">📂 {current_path}</h3>
-            <div style="background: #f9fafb; border-radius: 8px; padding: 15px; border: 1px solid #e5e7eb;">
-        """
-        
-        for file in files:
-            icon = "📁" if "/" in file or not "." in file else "📄"
-            html += f"""
-                <div style="padding: 8px; margin: 5px 0; background: white; border-radius: 6px; border: 1px solid #e5e7eb; cursor: pointer; transition: all 0.2s;">
-                    {icon} <span style="font-family: 'Monaco', monospace; color: #374151;">{file}</span>
-                </div>
-            """
-        
-        html += "</div></div>"
-        return html
+        parts = [_FILE_BROWSER_HEADER_TMPL.format(path=escape(current_path))]
+        parts.extend(
+            _FILE_ROW_TMPL.format(icon="📁" if "/" in file or not "." in file else "📄", file=escape(file))
+            for file in files
+        )
+        parts.append("</div></div>")
+        return "".join(parts)
     
     def render_file_content(self, filename: str, content: str) -> str:
         """Render file content in right panel"""
@@ -639,11 +1034,17 @@ class NACCConversationUI:
         }
         lang = lang_map.get(ext, "text")
         
+        notice = ""
+        if len(content) > FILE_PREVIEW_CHARS:
+            notice = f'<div style="color: #6b7280; font-size: 13px; margin-bottom: 10px;">Showing first {FILE_PREVIEW_CHARS:,} of {len(content):,} characters</div>'
+            content = content[:FILE_PREVIEW_CHARS]
+        
         html = f"""
         <div style="padding: 20px; font-family: 'Inter', sans-serif;">
-            <h3 style="color: #1f2937; margin-bottom: 10px;">📄 {filename}</h3>
+            <h3 style="color: #1f2937; margin-bottom: 10px;">📄 {escape(filename)}</h3>
+            {notice}
             <div style="background: #1e293b; border-radius: 8px; padding: 20px; overflow: auto; max-height: 600px;">
-                <pre style="margin: 0; color: #e2e8f0; font-family: 'Monaco', 'Courier New', monospace; font-size: 13px; line-height: 1.6;"><code class="language-{lang}">{content}</code></pre>
+                <pre style="margin: 0; color: #e2e8f0; font-family: 'Monaco', 'Courier New', monospace; font-size: 13px; line-height: 1.6;"><code class="language-{lang}">{escape(content)}</code></pre>
             </div>
         </div>
         """
@@ -651,172 +1052,232 @@ class NACCConversationUI:
     
     def render_nodes_view(self, nodes: List[Dict]) -> str:
         """Render nodes visualization in right panel"""
-        html = """
-        <div style="padding: 20px; font-family: 'Inter', sans-serif;">
-            <h3 style="color: #1f2937; margin-bottom: 15px;">🌐 NACC Network Nodes</h3>
-        """
-        
+        # writelines consumes the generator as it goes; join would collect every fragment first
+        buf = StringIO()
+        buf.writelines(self._iter_node_html(nodes))
+        return buf.getvalue()
+    
+    def _iter_node_html(self, nodes: List[Dict]):
+        """Yield the node grid's HTML fragments in order"""
+        yield _NODES_VIEW_HEADER
         for node in nodes:
-            node_id = node.get('node_id') or node.get('id', 'Unknown')
-            is_healthy = node.get('healthy', False)
-            status_color = "#10b981" if is_healthy else "#ef4444"
             metrics = node.get('metrics', {})
-            
-            html += f"""
-            <div style="background: white; border-radius: 12px; padding: 20px; margin-bottom: 15px; border-left: 4px solid {status_color}; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
-                    <h4 style="margin: 0; color: #1f2937; font-size: 18px;">🖥️ {node_id}</h4>
-                    <span style="background: {status_color}; color: white; padding: 4px 12px; border-radius: 12px; font-size: 12px; font-weight: 600;">
-                        {'ONLINE' if is_healthy else 'OFFLINE'}
-                    </span>
-                </div>
-                <div style="color: #6b7280; font-size: 14px; line-height: 1.8;">
-                    <div>🏷️ <strong>Tags:</strong> {', '.join(node.get('tags', []))}</div>
-            """
-            
-            if metrics:
-                html += f"""
-                    <div>💻 <strong>CPU:</strong> {metrics.get('cpu_percent', 0):.1f}%</div>
-                    <div>💾 <strong>Memory:</strong> {metrics.get('memory_percent', 0):.1f}%</div>
-                    <div>� <strong>Disk:</strong> {metrics.get('disk_percent', 0):.1f}%</div>
-                """
-            
-            html += """
-                </div>
-            </div>
-            """
-        
-        html += "</div>"
-        return html
+            # Rounded to display precision so metric jitter still hits the cache
+            metrics_key = (
+                round(metrics.get('cpu_percent', 0), 1),
+                round(metrics.get('memory_percent', 0), 1),
+                round(metrics.get('disk_percent', 0), 1),
+            ) if metrics else None
+            yield _render_node_card(
+                str(node.get('node_id') or node.get('id', 'Unknown')),
+                bool(node.get('healthy', False)),
+                tuple(node.get('tags', [])),
+                metrics_key
+            )
+        yield "</div>"
     
     def render_welcome_panel(self) -> str:
         """Render welcome panel"""
-        return """
-        <div style="padding: 40px; text-align: center; font-family: 'Inter', sans-serif;">
-            <h2 style="color: #1f2937; margin-bottom: 20px;">🚀 Welcome to NACC AI</h2>
-            <p style="color: #6b7280; font-size: 16px; line-height: 1.8; max-width: 500px; margin: 0 auto;">
-                Network Agentic Connection Call with AI-powered orchestration
-            </p>
-            <div style="margin-top: 40px; display: grid; gap: 15px;">
-                <div style="background: #f0fdf4; border: 1px solid #86efac; border-radius: 8px; padding: 15px;">
-                    <div style="font-size: 24px; margin-bottom: 5px;">📂</div>
-                    <div style="color: #166534; font-weight: 600;">File Operations</div>
-                </div>
-                <div style="background: #eff6ff; border: 1px solid #93c5fd; border-radius: 8px; padding: 15px;">
-                    <div style="font-size: 24px; margin-bottom: 5px;">💻</div>
-                    <div style="color: #1e40af; font-weight: 600;">Command Execution</div>
-                </div>
-                <div style="background: #fef3c7; border: 1px solid #fcd34d; border-radius: 8px; padding: 15px;">
-                    <div style="font-size: 24px; margin-bottom: 5px;">🌐</div>
-                    <div style="color: #92400e; font-weight: 600;">Node Management</div>
-                </div>
-            </div>
-        </div>
-        """
+        return _WELCOME_HTML
+    
+    def respond(self, message: str, chat_history: List, session_id: Optional[str]):
+        """Handle user message with session context"""
+        if not message.strip():
+            yield ("", chat_history, *_NOOP_TAIL, session_id)
+            return
+        
+        # Pin the ID on the first turn so later turns reuse this session
+        if session_id is None:
+            session_id = new_session_id()
+        
+        chat_history = chat_history or []
+        session = self.get_or_create_session(session_id)
+        
+        # Show the message and a placeholder reply while routing and tools run
+        session.output_changed("tool_log", _ROUTING_LOG)
+        yield (
+            "",
+            chat_history + [{"role": "user", "content": message}, {"role": "assistant", "content": "…"}],
+            NO_UPDATE, _ROUTING_LOG, NO_UPDATE, session_id
+        )
+        
+        updated_history, right_content, log = self.process_message(message, chat_history, session_id)
+        
+        # Don't resend outputs that are unchanged since the last turn
+        if right_content is not None and session.output_changed("right_panel", right_content):
+            right_update = right_content
+        else:
+            right_update = NO_UPDATE
+        log_update = log if session.output_changed("tool_log", log) else NO_UPDATE
+        
+        # Update context bar
+        context_info = _CONTEXT_BAR_TMPL.format_map(vars(session))
+        
+        yield "", updated_history, right_update, log_update, context_info, session_id
+        
+    def new_chat(self, session_id: Optional[str]):
+        """Start a new chat session"""
+        return [], self.render_welcome_panel(), _NEW_CHAT_LOG, _NEW_CHAT_CONTEXT, new_session_id()
 
 
-def create_ui():
-    """Create the Gradio UI"""
-    nacc = NACCConversationUI()
-    
-    # Custom CSS for professional Manus-style look
-    css = """
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-    
-    .gradio-container {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-    }
-    
-    .chat-message {
-        padding: 14px 18px !important;
-        border-radius: 16px !important;
-        margin-bottom: 10px !important;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.08) !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    .user-message {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        color: white !important;
-        margin-left: 15% !important;
-        border-bottom-right-radius: 4px !important;
-    }
-    
-    .bot-message {
-        background: white !important;
-        color: #1f2937 !important;
-        margin-right: 15% !important;
-        border-bottom-left-radius: 4px !important;
-        border-left: 3px solid #667eea !important;
-    }
-    
-    #chat-input {
-        border-radius: 12px !important;
-        border: 2px solid #e5e7eb !important;
-        padding: 14px 20px !important;
-        font-size: 15px !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    #chat-input:focus {
-        border-color: #667eea !important;
-        outline: none !important;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1) !important;
-    }
-    
-    .tool-log {
-        background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%) !important;
-        border-left: 4px solid #f59e0b !important;
-        padding: 14px !important;
-        border-radius: 8px !important;
-        font-family: 'Monaco', 'Courier New', monospace !important;
-        font-size: 13px !important;
-        box-shadow: 0 2px 6px rgba(0,0,0,0.08) !important;
-        margin-top: 10px !important;
-    }
-    
-    .context-bar {
-        background: linear-gradient(135deg, #e0e7ff 0%, #ddd6fe 100%) !important;
-        border-left: 4px solid #667eea !important;
-        padding: 12px 16px !important;
-        border-radius: 8px !important;
-        font-size: 13px !important;
-        margin-top: 8px !important;
-        box-shadow: 0 2px 6px rgba(0,0,0,0.06) !important;
-    }
-    
-    button {
-        border-radius: 8px !important;
-        font-weight: 600 !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    button:hover {
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.15) !important;
-    }
-    
-    .gradio-row {
-        gap: 16px !important;
-    }
-    
-    .gradio-column {
-        background: white !important;
-        border-radius: 16px !important;
-        padding: 24px !important;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.1) !important;
-    }
-    """
-    
-    with gr.Blocks(css=css, title="NACC AI - Professional Orchestration Interface", theme=gr.themes.Soft()) as interface:
-        gr.Markdown(
-            """
+def minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a stylesheet (run once at import)"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};:,])\s*', r'\1', css).strip()
+
+
+# Custom CSS for professional Manus-style look
+_CSS = minify_css("""
+@import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
+
+.gradio-container {
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
+}
+
+.chat-message {
+    padding: 14px 18px !important;
+    border-radius: 16px !important;
+    margin-bottom: 10px !important;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.08) !important;
+    transition: all 0.2s ease !important;
+}
+
+.user-message {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
+    color: white !important;
+    margin-left: 15% !important;
+    border-bottom-right-radius: 4px !important;
+}
+
+.bot-message {
+    background: white !important;
+    color: #1f2937 !important;
+    margin-right: 15% !important;
+    border-bottom-left-radius: 4px !important;
+    border-left: 3px solid #667eea !important;
+}
+
+#chat-input {
+    border-radius: 12px !important;
+    border: 2px solid #e5e7eb !important;
+    padding: 14px 20px !important;
+    font-size: 15px !important;
+    transition: all 0.2s ease !important;
+}
+
+#chat-input:focus {
+    border-color: #667eea !important;
+    outline: none !important;
+    box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1) !important;
+}
+
+.tool-log {
+    background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%) !important;
+    border-left: 4px solid #f59e0b !important;
+    padding: 14px !important;
+    border-radius: 8px !important;
+    font-family: 'Monaco', 'Courier New', monospace !important;
+    font-size: 13px !important;
+    box-shadow: 0 2px 6px rgba(0,0,0,0.08) !important;
+    margin-top: 10px !important;
+}
+
+.context-bar {
+    background: linear-gradient(135deg, #e0e7ff 0%, #ddd6fe 100%) !important;
+    border-left: 4px solid #667eea !important;
+    padding: 12px 16px !important;
+    border-radius: 8px !important;
+    font-size: 13px !important;
+    margin-top: 8px !important;
+    box-shadow: 0 2px 6px rgba(0,0,0,0.06) !important;
+}
+
+button {
+    border-radius: 8px !important;
+    font-weight: 600 !important;
+    transition: all 0.2s ease !important;
+}
+
+button:hover {
+    transform: translateY(-1px) !important;
+    box-shadow: 0 4px 12px rgba(0,0,0,0.15) !important;
+}
+
+.gradio-row {
+    gap: 16px !important;
+}
+
+.gradio-column {
+    background: white !important;
+    border-radius: 16px !important;
+    padding: 24px !important;
+    box-shadow: 0 4px 20px rgba(0,0,0,0.1) !important;
+}
+
+.nacc-node-card {
+    background: white;
+    border-radius: 12px;
+    padding: 20px;
+    margin-bottom: 15px;
+    border-left: 4px solid;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+}
+
+.nacc-node-card-head {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 10px;
+}
+
+.nacc-node-card-head h4 {
+    margin: 0;
+    color: #1f2937;
+    font-size: 18px;
+}
+
+.nacc-node-status {
+    color: white;
+    padding: 4px 12px;
+    border-radius: 12px;
+    font-size: 12px;
+    font-weight: 600;
+}
+
+.nacc-node-card-body {
+    color: #6b7280;
+    font-size: 14px;
+    line-height: 1.8;
+}
+""")
+
+_HEADER_MD = """
             # 🤖 NACC AI - Network Orchestration Assistant
             ### Context-Aware Conversational Interface with Multi-Tool Execution
             Professional AI-powered distributed systems management
             """
-        )
+
+# Blocks theme, built once per process
+_THEME = gr.themes.Soft()
+
+# Example queries shown under the chat
+_EXAMPLES = (
+    ("Hey, can you show me the files on the kali machine?",),
+    ("Navigate to file A and share the contents to me",),
+    ("Can you show me the nodes of NACC?",),
+    ("Add a print statement to the Python file",),
+    ("Transfer this file to my macOS",),
+)
+
+
+def create_ui():
+    """Create the Gradio UI"""
+    nacc = NACCConversationUI()
+    
+    with gr.Blocks(css=_CSS, title="NACC AI - Professional Orchestration Interface", theme=_THEME) as interface:
+        gr.Markdown(_HEADER_MD)
         
         # Session state (stored in Gradio state)
         session_id_state = gr.State(value=None)
@@ -853,7 +1314,7 @@ def create_ui():
                 
                 # Context info bar
                 context_bar = gr.Markdown(
-                    "💡 **Context:** New session | No tools executed yet",
+                    _NEW_CHAT_CONTEXT,
                     elem_classes=["context-bar"]
                 )
             
@@ -868,56 +1329,26 @@ def create_ui():
         gr.Markdown("### 💡 Try these examples:")
         with gr.Row():
             gr.Examples(
-                examples=[
-                    ["Hey, can you show me the files on the kali machine?"],
-                    ["Navigate to file A and share the contents to me"],
-                    ["Can you show me the nodes of NACC?"],
-                    ["Add a print statement to the Python file"],
-                    ["Transfer this file to my macOS"]
-                ],
+                examples=[list(example) for example in _EXAMPLES],
                 inputs=msg
             )
         
-        def respond(message, chat_history, session_id):
-            """Handle user message with session context"""
-            if not message.strip():
-                return "", chat_history, gr.update(), gr.update(), gr.update(), session_id
-            
-            updated_history, right_content, log = nacc.process_message(message, chat_history or [], session_id)
-            
-            # Update context bar
-            session = nacc.get_or_create_session(session_id)
-            context_info = (
-                f"💡 **Context:** Session `{session.session_id[:6]}...` | "
-                f"Node: `{session.current_node}` | Path: `{session.current_path}` | "
-                f"Tools executed: {len(session.tool_execution_log)} | "
-                f"Messages: {len(session.conversation_history)}"
-            )
-            
-            return "", updated_history, right_content, log, context_info, session_id
-        
-        def new_chat(session_id):
-            """Start a new chat session"""
-            # Generate new session ID
-            import hashlib
-            from datetime import datetime
-            new_session_id = hashlib.md5(str(datetime.now().timestamp()).encode()).hexdigest()[:8]
-            
-            return [], nacc.render_welcome_panel(), "🚀 New chat started! Context-aware AI routing active.", "💡 **Context:** New session | No tools executed yet", new_session_id
-        
         # Event handlers
+        # No concurrency cap: turns mostly wait on orchestrator I/O, so users can overlap
         submit.click(
-            respond, 
+            nacc.respond, 
             [msg, chatbot, session_id_state], 
-            [msg, chatbot, right_panel, tool_log, context_bar, session_id_state]
+            [msg, chatbot, right_panel, tool_log, context_bar, session_id_state],
+            concurrency_limit=None
         )
         msg.submit(
-            respond, 
+            nacc.respond, 
             [msg, chatbot, session_id_state], 
-            [msg, chatbot, right_panel, tool_log, context_bar, session_id_state]
+            [msg, chatbot, right_panel, tool_log, context_bar, session_id_state],
+            concurrency_limit=None
         )
         new_chat_btn.click(
-            new_chat,
+            nacc.new_chat,
             [session_id_state],
             [chatbot, right_panel, tool_log, context_bar, session_id_state]
         )
@@ -927,6 +1358,8 @@ def create_ui():
 
 def main():
     """Main entry point for the CLI"""
+    logging.basicConfig(level=logging.INFO)
+    enable_session_persistence()
     ui = create_ui()
     ui.launch(
         server_name="0.0.0.0",
@@ -4,24 +4,34 @@ Enterprise-grade conversational interface with modern design, accessibility, and
 """
 
 import gradio as gr
-import json
-import requests
+from collections import OrderedDict
+from functools import lru_cache
 import os
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
-import hashlib
+from html import escape
+from typing import Callable, List, Dict, Any, Optional, Tuple
 import logging
-from pathlib import Path
 
 # Import the existing components
 from .ai_intent_parser import AIIntentParser, PathResolver, ExecutionPlan
-from .conversational_ui import NACCConversationUI, SessionState
+from .conversational_ui import NO_UPDATE, NACCConversationUI, SessionState, minify_css, new_session_id
+from .session_store import SessionStore, enable_session_persistence
 
 # Orchestrator URL
 ORCHESTRATOR_URL = os.getenv("NACC_ORCHESTRATOR_URL", "http://127.0.0.1:8888")
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Rendered file listings kept per UI instance, keyed on (path, files)
+FILE_BROWSER_CACHE_SIZE = 32
+
+# Rendered status dashboards kept across all UIs, keyed on theme and node state
+STATUS_DASHBOARD_CACHE_SIZE = 32
+
+# Seconds between network status refreshes while the status panel is open
+STATUS_REFRESH_SECONDS = 2.0
+
+# Chat turns handled at once. Turns mostly wait on the orchestrator, so size this like
+# an I/O-bound thread pool (ThreadPoolExecutor's default) rather than by cores alone
+QUEUE_CONCURRENCY = int(os.getenv("NACC_UI_CONCURRENCY", min(32, (os.cpu_count() or 1) + 4)))
+
 logger = logging.getLogger(__name__)
 
 
@@ -130,115 +140,133 @@ class EnterpriseTheme:
         'normal': '300ms cubic-bezier(0.4, 0, 0.2, 1)',
         'slow': '500ms cubic-bezier(0.4, 0, 0.2, 1)',
     }
+    
+    # Every token in one flat dict (color_primary, type_sm, radius_lg, ...) for templates;
+    # subclasses that override a token table must rebuild this
+    FLAT = {
+        **{f'color_{k}': v for k, v in COLORS.items()},
+        **{f'type_{k}': v for k, v in TYPOGRAPHY.items()},
+        **{f'space_{k}': v for k, v in SPACING.items()},
+        **{f'radius_{k}': v for k, v in RADIUS.items()},
+        **{f'shadow_{k}': v for k, v in SHADOWS.items()},
+        **{f'transition_{k}': v for k, v in TRANSITIONS.items()},
+    }
 
 
-class EnterpriseNACCUI(NACCConversationUI):
-    """Enhanced NACC UI with enterprise-grade features"""
-    
-    def __init__(self):
-        super().__init__()
-        self.theme = EnterpriseTheme()
-        self.accessibility_mode = False
-        
-    def get_enterprise_css(self) -> str:
-        """Generate comprehensive enterprise CSS with design system"""
-        return f"""
+# Enterprise stylesheet. Only the :root block reads theme tokens (EnterpriseTheme.FLAT keys);
+# the sections after it are plain CSS that use the custom properties it defines.
+_CSS_ROOT_TMPL = """
         /* Import Inter font for professional typography */
         @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
         @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500;600&display=swap');
         
         :root {{
             /* CSS Custom Properties for Dynamic Theming */
-            --primary: {self.theme.COLORS['primary']};
-            --primary-light: {self.theme.COLORS['primary_light']};
-            --primary-dark: {self.theme.COLORS['primary_dark']};
-            --success: {self.theme.COLORS['success']};
-            --warning: {self.theme.COLORS['warning']};
-            --error: {self.theme.COLORS['error']};
-            --info: {self.theme.COLORS['info']};
+            --primary: {color_primary};
+            --primary-light: {color_primary_light};
+            --primary-dark: {color_primary_dark};
+            --success: {color_success};
+            --warning: {color_warning};
+            --error: {color_error};
+            --info: {color_info};
+            
+            --bg-primary: {color_bg_primary};
+            --bg-secondary: {color_bg_secondary};
+            --bg-tertiary: {color_bg_tertiary};
             
-            --bg-primary: {self.theme.COLORS['bg_primary']};
-            --bg-secondary: {self.theme.COLORS['bg_secondary']};
-            --bg-tertiary: {self.theme.COLORS['bg_tertiary']};
+            --text-primary: {color_text_primary};
+            --text-secondary: {color_text_secondary};
+            --text-muted: {color_text_muted};
             
-            --text-primary: {self.theme.COLORS['text_primary']};
-            --text-secondary: {self.theme.COLORS['text_secondary']};
-            --text-muted: {self.theme.COLORS['text_muted']};
+            --border-light: {color_border_light};
+            --border-medium: {color_border_medium};
+            --border-dark: {color_border_dark};
             
-            --border-light: {self.theme.COLORS['border_light']};
-            --border-medium: {self.theme.COLORS['border_medium']};
-            --border-dark: {self.theme.COLORS['border_dark']};
+            --shadow-sm: {shadow_sm};
+            --shadow-md: {shadow_md};
+            --shadow-lg: {shadow_lg};
+            --shadow-xl: {shadow_xl};
             
-            --shadow-sm: {self.theme.SHADOWS['sm']};
-            --shadow-md: {self.theme.SHADOWS['md']};
-            --shadow-lg: {self.theme.SHADOWS['lg']};
-            --shadow-xl: {self.theme.SHADOWS['xl']};
+            --radius-sm: {radius_sm};
+            --radius-md: {radius_md};
+            --radius-lg: {radius_lg};
+            --radius-xl: {radius_xl};
+            --radius-full: {radius_full};
             
-            --radius-sm: {self.theme.RADIUS['sm']};
-            --radius-md: {self.theme.RADIUS['md']};
-            --radius-lg: {self.theme.RADIUS['lg']};
-            --radius-xl: {self.theme.RADIUS['xl']};
+            --transition-fast: {transition_fast};
+            --transition-normal: {transition_normal};
+            --transition-slow: {transition_slow};
             
-            --transition-fast: {self.theme.TRANSITIONS['fast']};
-            --transition-normal: {self.theme.TRANSITIONS['normal']};
-            --transition-slow: {self.theme.TRANSITIONS['slow']};
+            --font-family: {type_font_family};
+            --font-mono: {type_font_mono};
+            --text-xs: {type_xs};
+            --text-sm: {type_sm};
+            --text-lg: {type_lg};
+            --text-xl: {type_xl};
+            --text-2xl: {type_2xl};
+            --font-medium: {type_medium};
+            --font-semibold: {type_semibold};
+            --font-bold: {type_bold};
         }}
-        
+"""
+_CSS_LAYOUT = """
         /* Global Styles */
-        .gradio-container {{
-            font-family: {self.theme.TYPOGRAPHY['font_family']} !important;
+        .gradio-container {
+            font-family: var(--font-family) !important;
             background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%) !important;
             min-height: 100vh !important;
-        }}
+        }
         
         /* Header Styling */
-        .enterprise-header {{
+        .enterprise-header {
             background: var(--bg-primary) !important;
             border-bottom: 1px solid var(--border-light) !important;
             box-shadow: var(--shadow-sm) !important;
             padding: 1rem 2rem !important;
             margin-bottom: 2rem !important;
-        }}
+        }
         
-        .enterprise-logo {{
+        .enterprise-logo {
             display: flex !important;
             align-items: center !important;
             gap: 1rem !important;
-        }}
+        }
         
-        .enterprise-title {{
-            font-size: {self.theme.TYPOGRAPHY['2xl']} !important;
-            font-weight: {self.theme.TYPOGRAPHY['bold']} !important;
+        .enterprise-title {
+            font-size: var(--text-2xl) !important;
+            font-weight: var(--font-bold) !important;
             color: var(--text-primary) !important;
             margin: 0 !important;
-        }}
+        }
         
-        .enterprise-subtitle {{
-            font-size: {self.theme.TYPOGRAPHY['sm']} !important;
+        .enterprise-subtitle {
+            font-size: var(--text-sm) !important;
             color: var(--text-muted) !important;
             margin: 0 !important;
-            font-weight: {self.theme.TYPOGRAPHY['medium']} !important;
-        }}
+            font-weight: var(--font-medium) !important;
+        }
         
         /* Main Layout */
-        .enterprise-main {{
+        .enterprise-main {
             display: grid !important;
             grid-template-columns: 1fr 400px !important;
             gap: 2rem !important;
             padding: 0 2rem !important;
             max-width: 1600px !important;
             margin: 0 auto !important;
-        }}
+        }
         
-        @media (max-width: 1200px) {{
-            .enterprise-main {{
+        @media (max-width: 1200px) {
+            .enterprise-main {
                 grid-template-columns: 1fr !important;
                 gap: 1.5rem !important;
-            }}
-        }}
+            }
+        }
         
+"""
+_CSS_CHAT = """
         /* Chat Interface Styling */
-        .chat-container {{
+        .chat-container {
             background: var(--bg-primary) !important;
             border-radius: var(--radius-xl) !important;
             box-shadow: var(--shadow-lg) !important;
@@ -248,59 +276,59 @@ class EnterpriseNACCUI(NACCConversationUI):
             min-height: 600px !important;
             display: flex !important;
             flex-direction: column !important;
-        }}
+        }
         
-        .chat-header {{
+        .chat-header {
             background: var(--bg-secondary) !important;
             border-bottom: 1px solid var(--border-light) !important;
             padding: 1.5rem 2rem !important;
             display: flex !important;
             justify-content: space-between !important;
             align-items: center !important;
-        }}
+        }
         
-        .chat-title {{
-            font-size: {self.theme.TYPOGRAPHY['xl']} !important;
-            font-weight: {self.theme.TYPOGRAPHY['semibold']} !important;
+        .chat-title {
+            font-size: var(--text-xl) !important;
+            font-weight: var(--font-semibold) !important;
             color: var(--text-primary) !important;
             margin: 0 !important;
-        }}
+        }
         
-        .session-info {{
-            font-size: {self.theme.TYPOGRAPHY['sm']} !important;
+        .session-info {
+            font-size: var(--text-sm) !important;
             color: var(--text-muted) !important;
-        }}
+        }
         
-        .chat-messages {{
+        .chat-messages {
             flex: 1 !important;
             overflow-y: auto !important;
             padding: 2rem !important;
             scroll-behavior: smooth !important;
-        }}
+        }
         
         /* Message Styling */
-        .message {{
+        .message {
             margin-bottom: 1.5rem !important;
             animation: slideIn 0.3s ease-out !important;
-        }}
-        
-        @keyframes slideIn {{
-            from {{
-                opacity: 0 !important;
-                transform: translateY(10px) !important;
-            }}
-            to {{
-                opacity: 1 !important;
-                transform: translateY(0) !important;
-            }}
-        }}
-        
-        .user-message {{
+        }
+        
+        @keyframes slideIn {
+            from {
+                opacity: 0;
+                transform: translateY(10px);
+            }
+            to {
+                opacity: 1;
+                transform: translateY(0);
+            }
+        }
+        
+        .user-message {
             display: flex !important;
             justify-content: flex-end !important;
-        }}
+        }
         
-        .user-bubble {{
+        .user-bubble {
             background: linear-gradient(135deg, var(--primary) 0%, var(--primary-light) 100%) !important;
             color: white !important;
             padding: 1rem 1.5rem !important;
@@ -308,14 +336,14 @@ class EnterpriseNACCUI(NACCConversationUI):
             max-width: 70% !important;
             word-wrap: break-word !important;
             box-shadow: var(--shadow-md) !important;
-        }}
+        }
         
-        .bot-message {{
+        .bot-message {
             display: flex !important;
             justify-content: flex-start !important;
-        }}
+        }
         
-        .bot-bubble {{
+        .bot-bubble {
             background: var(--bg-primary) !important;
             color: var(--text-primary) !important;
             padding: 1.5rem 2rem !important;
@@ -323,34 +351,36 @@ class EnterpriseNACCUI(NACCConversationUI):
             border: 1px solid var(--border-light) !important;
             max-width: 70% !important;
             box-shadow: var(--shadow-sm) !important;
-        }}
+        }
         
-        .bot-bubble:hover {{
+        .bot-bubble:hover {
             box-shadow: var(--shadow-md) !important;
             transition: box-shadow var(--transition-fast) !important;
-        }}
+        }
         
+"""
+_CSS_INPUT = """
         /* Chat Input Area - ENHANCED VISIBILITY */
-        .chat-input-area {{
+        .chat-input-area {
             background: var(--bg-primary) !important;
             border-top: 2px solid var(--border-medium) !important;
             padding: 1.5rem 2rem !important;
-        }}
+        }
         
-        .input-container {{
+        .input-container {
             display: flex !important;
             gap: 1rem !important;
             align-items: flex-end !important;
-        }}
+        }
         
         /* Enhanced Input Field with Maximum Contrast */
-        .message-input {{
+        .message-input {
             flex: 1 !important;
             border: 2px solid var(--border-dark) !important;
             border-radius: var(--radius-lg) !important;
             padding: 1rem 1.5rem !important;
             font-size: 1rem !important;
-            font-family: {self.theme.TYPOGRAPHY['font_family']} !important;
+            font-family: var(--font-family) !important;
             background: #ffffff !important;
             color: #000000 !important;
             font-weight: 500 !important;
@@ -360,28 +390,28 @@ class EnterpriseNACCUI(NACCConversationUI):
             min-height: 3rem !important;
             max-height: 8rem !important;
             line-height: 1.5 !important;
-        }}
+        }
         
         /* Strong placeholder visibility */
-        .message-input::placeholder {{
+        .message-input::placeholder {
             color: #64748b !important;
             font-weight: 400 !important;
             opacity: 1 !important;
-        }}
+        }
         
-        .message-input:focus {{
+        .message-input:focus {
             border-color: var(--primary) !important;
             box-shadow: 0 0 0 4px rgba(37, 99, 235, 0.15) !important;
             background: #ffffff !important;
-        }}
+        }
         
-        .send-button {{
+        .send-button {
             background: var(--primary) !important;
             color: #ffffff !important;
             border: none !important;
             border-radius: var(--radius-lg) !important;
             padding: 1rem 1.5rem !important;
-            font-weight: {self.theme.TYPOGRAPHY['semibold']} !important;
+            font-weight: var(--font-semibold) !important;
             font-size: 0.95rem !important;
             cursor: pointer !important;
             transition: all var(--transition-fast) !important;
@@ -389,20 +419,22 @@ class EnterpriseNACCUI(NACCConversationUI):
             display: flex !important;
             align-items: center !important;
             justify-content: center !important;
-        }}
+        }
         
-        .send-button:hover {{
+        .send-button:hover {
             background: var(--primary-dark) !important;
             transform: translateY(-2px) !important;
             box-shadow: var(--shadow-lg) !important;
-        }}
+        }
         
-        .send-button:active {{
+        .send-button:active {
             transform: translateY(0) !important;
-        }}
+        }
         
+"""
+_CSS_PANELS = """
         /* Right Panel Styling */
-        .right-panel {{
+        .right-panel {
             background: var(--bg-primary) !important;
             border-radius: var(--radius-xl) !important;
             box-shadow: var(--shadow-lg) !important;
@@ -412,218 +444,280 @@ class EnterpriseNACCUI(NACCConversationUI):
             min-height: 600px !important;
             display: flex !important;
             flex-direction: column !important;
-        }}
+        }
         
-        .panel-header {{
+        .panel-header {
             background: var(--bg-secondary) !important;
             border-bottom: 1px solid var(--border-light) !important;
             padding: 1.5rem 2rem !important;
-        }}
+        }
         
-        .panel-title {{
-            font-size: {self.theme.TYPOGRAPHY['lg']} !important;
-            font-weight: {self.theme.TYPOGRAPHY['semibold']} !important;
+        .panel-title {
+            font-size: var(--text-lg) !important;
+            font-weight: var(--font-semibold) !important;
             color: var(--text-primary) !important;
             margin: 0 !important;
-        }}
+        }
         
-        .panel-content {{
+        .panel-content {
             flex: 1 !important;
             overflow-y: auto !important;
             padding: 2rem !important;
-        }}
+        }
         
         /* Status Cards */
-        .status-card {{
+        .status-card {
             background: var(--bg-primary) !important;
             border: 1px solid var(--border-light) !important;
             border-radius: var(--radius-lg) !important;
             padding: 1.5rem !important;
             margin-bottom: 1rem !important;
             transition: all var(--transition-fast) !important;
-        }}
+        }
         
-        .status-card:hover {{
+        .status-card:hover {
             box-shadow: var(--shadow-md) !important;
             transform: translateY(-1px) !important;
-        }}
+        }
         
-        .status-indicator {{
+        .node-card {
+            background: var(--bg-primary) !important;
+            border-radius: var(--radius-lg) !important;
+            padding: 1.5rem !important;
+            margin-bottom: 1rem !important;
+            border-left-width: 4px !important;
+            border-left-style: solid !important;  /* Colour is set inline from the node status */
+            box-shadow: var(--shadow-sm) !important;
+        }
+        
+        .node-card-head {
+            display: flex !important;
+            justify-content: space-between !important;
+            align-items: center !important;
+            margin-bottom: 1rem !important;
+        }
+        
+        .node-card-head h4 {
+            margin: 0 !important;
+            color: var(--text-primary) !important;
+            font-size: var(--text-lg) !important;
+            font-weight: var(--font-semibold) !important;
+        }
+        
+        .node-badge {
+            color: white !important;
+            padding: 0.25rem 0.75rem !important;
+            border-radius: var(--radius-full) !important;
+            font-size: var(--text-xs) !important;
+            font-weight: var(--font-semibold) !important;
+            text-transform: uppercase !important;
+        }
+        
+        .node-card-body {
+            color: var(--text-secondary) !important;
+            font-size: var(--text-sm) !important;
+            line-height: 1.6 !important;
+        }
+        
+        .node-metrics {
+            margin-top: 0.5rem !important;
+        }
+        
+        .status-indicator {
             display: inline-flex !important;
             align-items: center !important;
             gap: 0.5rem !important;
-            font-weight: {self.theme.TYPOGRAPHY['medium']} !important;
-        }}
+            font-weight: var(--font-medium) !important;
+        }
         
-        .status-online {{
+        .status-online {
             color: var(--success) !important;
-        }}
+        }
         
-        .status-offline {{
+        .status-offline {
             color: var(--error) !important;
-        }}
+        }
         
-        .status-warning {{
+        .status-warning {
             color: var(--warning) !important;
-        }}
+        }
         
         /* Tool Execution Log */
-        .tool-log {{
+        .tool-log {
             background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%) !important;
             border: 1px solid #fbbf24 !important;
             border-left: 4px solid var(--warning) !important;
             border-radius: var(--radius-md) !important;
             padding: 1rem 1.5rem !important;
-            font-family: {self.theme.TYPOGRAPHY['font_mono']} !important;
-            font-size: {self.theme.TYPOGRAPHY['sm']} !important;
+            font-family: var(--font-mono) !important;
+            font-size: var(--text-sm) !important;
             margin: 1rem 0 !important;
             box-shadow: var(--shadow-sm) !important;
-        }}
+        }
         
         /* Context Bar */
-        .context-bar {{
+        .context-bar {
             background: linear-gradient(135deg, #e0e7ff 0%, #ddd6fe 100%) !important;
             border: 1px solid #a5b4fc !important;
             border-left: 4px solid var(--primary) !important;
             border-radius: var(--radius-md) !important;
             padding: 0.75rem 1rem !important;
-            font-size: {self.theme.TYPOGRAPHY['sm']} !important;
+            font-size: var(--text-sm) !important;
             margin: 1rem 0 !important;
             color: var(--text-secondary) !important;
-        }}
+        }
         
         /* Loading States */
-        .loading {{
+        .loading {
             display: flex !important;
             align-items: center !important;
             gap: 0.5rem !important;
             color: var(--text-muted) !important;
-        }}
+        }
         
-        .loading-spinner {{
+        .loading-spinner {
             width: 1rem !important;
             height: 1rem !important;
             border: 2px solid var(--border-light) !important;
             border-top: 2px solid var(--primary) !important;
             border-radius: 50% !important;
             animation: spin 1s linear infinite !important;
-        }}
+        }
         
-        @keyframes spin {{
-            to {{
-                transform: rotate(360deg) !important;
-            }}
-        }}
+        @keyframes spin {
+            to {
+                transform: rotate(360deg);
+            }
+        }
         
         /* Example Queries */
-        .examples-container {{
+        .examples-container {
             background: var(--bg-primary) !important;
             border-radius: var(--radius-xl) !important;
             box-shadow: var(--shadow-lg) !important;
             border: 1px solid var(--border-light) !important;
             padding: 2rem !important;
             margin-top: 2rem !important;
-        }}
+        }
         
-        .examples-title {{
-            font-size: {self.theme.TYPOGRAPHY['lg']} !important;
-            font-weight: {self.theme.TYPOGRAPHY['semibold']} !important;
+        .examples-title {
+            font-size: var(--text-lg) !important;
+            font-weight: var(--font-semibold) !important;
             color: var(--text-primary) !important;
             margin-bottom: 1rem !important;
-        }}
+        }
         
-        .example-button {{
+        .example-button {
             background: var(--bg-secondary) !important;
             border: 1px solid var(--border-light) !important;
             border-radius: var(--radius-md) !important;
             padding: 0.75rem 1rem !important;
-            font-size: {self.theme.TYPOGRAPHY['sm']} !important;
+            font-size: var(--text-sm) !important;
             color: var(--text-secondary) !important;
             cursor: pointer !important;
             transition: all var(--transition-fast) !important;
             margin: 0.5rem !important;
-        }}
+        }
         
-        .example-button:hover {{
+        .example-button:hover {
             background: var(--primary) !important;
             color: white !important;
             transform: translateY(-1px) !important;
             box-shadow: var(--shadow-md) !important;
-        }}
+        }
         
+"""
+_CSS_ACCESSIBILITY = """
         /* Accessibility Improvements */
-        @media (prefers-reduced-motion: reduce) {{
-            * {{
+        @media (prefers-reduced-motion: reduce) {
+            * {
                 animation-duration: 0.01ms !important;
                 animation-iteration-count: 1 !important;
                 transition-duration: 0.01ms !important;
-            }}
-        }}
+            }
+        }
         
         /* High contrast mode support */
-        @media (prefers-contrast: high) {{
-            .user-bubble {{
+        @media (prefers-contrast: high) {
+            .user-bubble {
                 border: 2px solid currentColor !important;
-            }}
+            }
             
-            .bot-bubble {{
+            .bot-bubble {
                 border: 2px solid var(--border-dark) !important;
-            }}
-        }}
+            }
+        }
         
         /* Focus management for accessibility */
-        .focus-visible {{
+        .focus-visible {
             outline: 2px solid var(--primary) !important;
             outline-offset: 2px !important;
-        }}
+        }
         
+"""
+_CSS_RESPONSIVE = """
         /* Mobile Responsive */
-        @media (max-width: 768px) {{
-            .enterprise-main {{
+        @media (max-width: 768px) {
+            .enterprise-main {
                 padding: 0 1rem !important;
-            }}
+            }
             
             .chat-container,
-            .right-panel {{
+            .right-panel {
                 height: calc(100vh - 150px) !important;
                 min-height: 500px !important;
-            }}
+            }
             
-            .chat-messages {{
+            .chat-messages {
                 padding: 1rem !important;
-            }}
+            }
             
             .user-bubble,
-            .bot-bubble {{
+            .bot-bubble {
                 max-width: 85% !important;
-            }}
-        }}
+            }
+        }
         
+"""
+_CSS_PRINT = """
         /* Print styles */
-        @media print {{
+        @media print {
             .send-button,
-            .example-button {{
+            .example-button {
                 display: none !important;
-            }}
+            }
             
             .chat-container,
-            .right-panel {{
+            .right-panel {
                 box-shadow: none !important;
                 border: 1px solid #ccc !important;
-            }}
-        }}
-        """
+            }
+        }
+"""
+_CSS_STATIC = "".join((_CSS_LAYOUT, _CSS_CHAT, _CSS_INPUT, _CSS_PANELS, _CSS_ACCESSIBILITY, _CSS_RESPONSIVE, _CSS_PRINT))
 
-    def create_enterprise_header(self) -> str:
-        """Create clean enterprise header HTML"""
-        return f"""
+
+@lru_cache(maxsize=None)
+def themed(template: str, theme: type) -> str:
+    """Fill a template's theme placeholders for a theme class, once per (template, class)"""
+    return template.format_map(theme.FLAT)
+
+
+@lru_cache(maxsize=None)
+def enterprise_css(theme: type) -> str:
+    """Minified enterprise stylesheet for a theme class"""
+    return minify_css(_CSS_ROOT_TMPL.format_map(theme.FLAT) + _CSS_STATIC)
+
+
+# Page header; theme placeholders are EnterpriseTheme.FLAT keys
+_ENTERPRISE_HEADER_TMPL = """
         <div class="enterprise-header" role="banner">
             <div class="enterprise-logo">
                 <div style="
                     width: 2.5rem; 
                     height: 2.5rem; 
-                    background: linear-gradient(135deg, {self.theme.COLORS['primary']} 0%, {self.theme.COLORS['accent']} 100%);
-                    border-radius: {self.theme.RADIUS['lg']};
+                    background: linear-gradient(135deg, {color_primary} 0%, {color_accent} 100%);
+                    border-radius: {radius_lg};
                     display: flex;
                     align-items: center;
                     justify-content: center;
@@ -640,38 +734,37 @@ class EnterpriseNACCUI(NACCConversationUI):
         </div>
         """
 
-    def create_welcome_panel(self) -> str:
-        """Create clean welcome panel for right sidebar"""
-        return f"""
-        <div style="padding: 3rem 2rem; text-align: center; font-family: {self.theme.TYPOGRAPHY['font_family']};">
+# Right-panel fragments; theme placeholders are EnterpriseTheme.FLAT keys
+_WELCOME_PANEL_TMPL = """
+        <div style="padding: 3rem 2rem; text-align: center; font-family: {type_font_family};">
             <div style="
                 width: 4rem; 
                 height: 4rem; 
-                background: linear-gradient(135deg, {self.theme.COLORS['primary']} 0%, {self.theme.COLORS['accent']} 100%);
-                border-radius: {self.theme.RADIUS['2xl']};
+                background: linear-gradient(135deg, {color_primary} 0%, {color_accent} 100%);
+                border-radius: {radius_2xl};
                 display: flex;
                 align-items: center;
                 justify-content: center;
                 margin: 0 auto 2rem;
                 color: white;
                 font-size: 2rem;
-                box-shadow: {self.theme.SHADOWS['lg']};
+                box-shadow: {shadow_lg};
             ">
                 🤖
             </div>
             
             <h2 style="
-                color: {self.theme.COLORS['text_primary']}; 
-                font-size: {self.theme.TYPOGRAPHY['xl']}; 
-                font-weight: {self.theme.TYPOGRAPHY['semibold']}; 
+                color: {color_text_primary}; 
+                font-size: {type_xl}; 
+                font-weight: {type_semibold}; 
                 margin-bottom: 1rem;
             ">
                 AI Agent Ready
             </h2>
             
             <p style="
-                color: {self.theme.COLORS['text_secondary']}; 
-                font-size: {self.theme.TYPOGRAPHY['base']}; 
+                color: {color_text_secondary}; 
+                font-size: {type_base}; 
                 line-height: 1.6; 
                 max-width: 350px; 
                 margin: 0 auto 2rem;
@@ -720,231 +813,398 @@ class EnterpriseNACCUI(NACCConversationUI):
             </div>
         </div>
         """
-
-    def create_enhanced_file_browser(self, files: List[str], current_path: str) -> str:
-        """Create enhanced file browser with modern design"""
-        html = f"""
-        <div style="padding: 2rem; font-family: {self.theme.TYPOGRAPHY['font_family']};">
-            <div style="margin-bottom: 1.5rem;">
-                <h3 style="color: {self.theme.COLORS['text_primary']}; font-size: {self.theme.TYPOGRAPHY['xl']}; font-weight: {self.theme.TYPOGRAPHY['semibold']}; margin-bottom: 0.5rem;">
-                    📂 {current_path}
-                </h3>
-                <div style="color: {self.theme.COLORS['text_muted']}; font-size: {self.theme.TYPOGRAPHY['sm']};">
-                    {len(files)} items
-                </div>
-            </div>
-            
-            <div style="
-                background: {self.theme.COLORS['bg_secondary']}; 
-                border-radius: {self.theme.RADIUS['lg']}; 
-                padding: 1rem; 
-                border: 1px solid {self.theme.COLORS['border_light']};
-                max-height: 400px;
-                overflow-y: auto;
-            ">
-        """
-        
-        for file in files:
-            # Use proper SVG icons instead of emoji
-            is_folder = "/" in file or not "." in file
-            icon_svg = f"""
-                <svg width="20" height="20" viewBox="0 0 24 24" fill="currentColor" style="color: {self.theme.COLORS['primary']};">
-                    <path d="M10 4H4c-1.11 0-2 .89-2 2v12c0 1.11.89 2 2 2h16c1.11 0 2-.89 2-2V8c0-1.11-.89-2-2-2h-8l-2-2z"/>
-                </svg>
-            """ if is_folder else f"""
-                <svg width="20" height="20" viewBox="0 0 24 24" fill="currentColor" style="color: {self.theme.COLORS['text_secondary']};">
-                    <path d="M14,2H6A2,2 0 0,0 4,4V20A2,2 0 0,0 6,22H18A2,2 0 0,0 20,20V8L14,2M18,20H6V4H13V9H18V20Z"/>
-                </svg>
-            """
-            
-            file_style = f"""
-                <div style="
-                    padding: 0.75rem 1rem;
-                    margin: 0.5rem 0;
-                    background: {self.theme.COLORS['bg_primary']};
-                    border-radius: {self.theme.RADIUS['md']};
-                    border: 1px solid {self.theme.COLORS['border_light']};
-                    cursor: pointer;
-                    transition: all {self.theme.TRANSITIONS['fast']};
-                    display: flex;
-                    align-items: center;
-                    gap: 0.75rem;
-                "
-                onmouseover="this.style.background='{self.theme.COLORS['bg_tertiary']}'; this.style.transform='translateX(4px)'"
-                onmouseout="this.style.background='{self.theme.COLORS['bg_primary']}'; this.style.transform='translateX(0)'">
-                    {icon_svg}
-                    <span style="
-                        font-family: {self.theme.TYPOGRAPHY['font_mono']};
-                        color: {self.theme.COLORS['text_primary']};
-                        font-size: {self.theme.TYPOGRAPHY['sm']};
-                    ">
-                        {file}
-                    </span>
-                </div>
-            """
-            html += file_style
-        
-        html += "</div></div>"
-        return html
-
-    def create_status_dashboard(self, nodes: List[Dict]) -> str:
-        """Create enterprise status dashboard"""
-        html = f"""
-        <div style="padding: 2rem; font-family: {self.theme.TYPOGRAPHY['font_family']};">
-            <h3 style="color: {self.theme.COLORS['text_primary']}; font-size: {self.theme.TYPOGRAPHY['xl']}; font-weight: {self.theme.TYPOGRAPHY['semibold']}; margin-bottom: 1.5rem;">
+_DASHBOARD_HEADER_TMPL = """
+        <div style="padding: 2rem; font-family: {type_font_family};">
+            <h3 style="color: {color_text_primary}; font-size: {type_xl}; font-weight: {type_semibold}; margin-bottom: 1.5rem;">
                 🌐 Network Status Dashboard
             </h3>
         """
-        
-        # System overview
-        online_nodes = len([n for n in nodes if n.get('healthy', False)])
-        total_nodes = len(nodes)
-        
-        html += f"""
+_DASHBOARD_OVERVIEW_TMPL = """
         <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 1rem; margin-bottom: 2rem;">
             <div class="status-card">
                 <div style="text-align: center;">
-                    <div style="font-size: 2rem; font-weight: bold; color: {self.theme.COLORS['success']};">{online_nodes}</div>
-                    <div style="color: {self.theme.COLORS['text_muted']}; font-size: {self.theme.TYPOGRAPHY['sm']};">Online Nodes</div>
+                    <div style="font-size: 2rem; font-weight: bold; color: {color_success};">{{online}}</div>
+                    <div style="color: {color_text_muted}; font-size: {type_sm};">Online Nodes</div>
                 </div>
             </div>
             <div class="status-card">
                 <div style="text-align: center;">
-                    <div style="font-size: 2rem; font-weight: bold; color: {self.theme.COLORS['primary']};">{total_nodes}</div>
-                    <div style="color: {self.theme.COLORS['text_muted']}; font-size: {self.theme.TYPOGRAPHY['sm']};">Total Nodes</div>
+                    <div style="font-size: 2rem; font-weight: bold; color: {color_primary};">{{total}}</div>
+                    <div style="color: {color_text_muted}; font-size: {type_sm};">Total Nodes</div>
                 </div>
             </div>
             <div class="status-card">
                 <div style="text-align: center;">
-                    <div style="font-size: 2rem; font-weight: bold; color: {self.theme.COLORS['warning']};">{total_nodes - online_nodes}</div>
-                    <div style="color: {self.theme.COLORS['text_muted']}; font-size: {self.theme.TYPOGRAPHY['sm']};">Offline Nodes</div>
+                    <div style="font-size: 2rem; font-weight: bold; color: {color_warning};">{{offline}}</div>
+                    <div style="color: {color_text_muted}; font-size: {type_sm};">Offline Nodes</div>
                 </div>
             </div>
         </div>
         """
-        
-        # Individual node status
-        for node in nodes:
-            node_id = node.get('node_id') or node.get('id', 'Unknown')
-            is_healthy = node.get('healthy', False)
-            status_color = self.theme.COLORS['success'] if is_healthy else self.theme.COLORS['error']
-            status_text = "ONLINE" if is_healthy else "OFFLINE"
-            metrics = node.get('metrics', {})
-            
-            html += f"""
-            <div style="
-                background: {self.theme.COLORS['bg_primary']}; 
-                border-radius: {self.theme.RADIUS['lg']}; 
-                padding: 1.5rem; 
-                margin-bottom: 1rem; 
-                border-left: 4px solid {status_color}; 
-                box-shadow: {self.theme.SHADOWS['sm']};
-            ">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                    <h4 style="margin: 0; color: {self.theme.COLORS['text_primary']}; font-size: {self.theme.TYPOGRAPHY['lg']}; font-weight: {self.theme.TYPOGRAPHY['semibold']};">
-                        🖥️ {node_id}
-                    </h4>
-                    <span style="
-                        background: {status_color}; 
-                        color: white; 
-                        padding: 0.25rem 0.75rem; 
-                        border-radius: {self.theme.RADIUS['full']}; 
-                        font-size: {self.theme.TYPOGRAPHY['xs']}; 
-                        font-weight: {self.theme.TYPOGRAPHY['semibold']};
-                        text-transform: uppercase;
-                    ">
-                        {status_text}
-                    </span>
+_DASHBOARD_SUMMARY_TMPL = _DASHBOARD_HEADER_TMPL + _DASHBOARD_OVERVIEW_TMPL
+# Node cards are styled by the .node-card rules in the stylesheet; only the status colour is inline
+_DASHBOARD_NODE_TMPL = """
+            <div class="node-card" id="node-{node_id}" style="border-left-color: {status_color};">
+                <div class="node-card-head">
+                    <h4>🖥️ {node_id}</h4>
+                    <span class="node-badge" style="background: {status_color};">{status_text}</span>
                 </div>
-                <div style="color: {self.theme.COLORS['text_secondary']}; font-size: {self.theme.TYPOGRAPHY['sm']}; line-height: 1.6;">
-                    <div>🏷️ <strong>Tags:</strong> {', '.join(node.get('tags', []))}</div>
+                <div class="node-card-body">
             """
-            
-            if metrics:
-                html += f"""
-                    <div style="margin-top: 0.5rem;">
-                        <div>💻 <strong>CPU:</strong> {metrics.get('cpu_percent', 0):.1f}%</div>
-                        <div>💾 <strong>Memory:</strong> {metrics.get('memory_percent', 0):.1f}%</div>
-                        <div>💽 <strong>Disk:</strong> {metrics.get('disk_percent', 0):.1f}%</div>
+_DASHBOARD_TAGS_TMPL = """
+                    <div>🏷️ <strong>Tags:</strong> {tags}</div>
+            """
+_DASHBOARD_METRICS_TMPL = """
+                    <div class="node-metrics">
+                        <div>💻 <strong>CPU:</strong> <span class="node-cpu">{cpu:.1f}</span>%</div>
+                        <div>💾 <strong>Memory:</strong> <span class="node-mem">{mem:.1f}</span>%</div>
+                        <div>💽 <strong>Disk:</strong> <span class="node-disk">{disk:.1f}</span>%</div>
                     </div>
                 """
-            
-            html += """
+_DASHBOARD_NODE_END = """
                 </div>
             </div>
             """
-        
-        html += "</div>"
-        return html
-
-    def create_error_message(self, error: str, context: str = "") -> str:
-        """Create professional error message"""
-        return f"""
+# Page-head script used by refresh_status_dashboard() refreshes
+_DASHBOARD_SCRIPT = """
+<script>
+// Patches the metrics of node cards already on the page (matched by id="node-<id>")
+// from a create_status_payload() dict; anything else changing means a full re-render.
+window.naccUpdateNodes = function (data) {
+    if (!data) { return; }
+    if (typeof data === "string") { data = JSON.parse(data); }
+    data.nodes.forEach(function (n) {
+        var card = document.getElementById("node-" + n.id);
+        if (!card || n.cpu == null) { return; }
+        card.querySelector(".node-cpu").textContent = n.cpu.toFixed(1);
+        card.querySelector(".node-mem").textContent = n.mem.toFixed(1);
+        card.querySelector(".node-disk").textContent = n.disk.toFixed(1);
+    });
+};
+</script>
+"""
+_FILE_BROWSER_HEADER_TMPL = """
+        <div style="padding: 2rem; font-family: {type_font_family};">
+            <div style="margin-bottom: 1.5rem;">
+                <h3 style="color: {color_text_primary}; font-size: {type_xl}; font-weight: {type_semibold}; margin-bottom: 0.5rem;">
+                    📂 {{path}}
+                </h3>
+                <div style="color: {color_text_muted}; font-size: {type_sm};">
+                    {{count}} items
+                </div>
+            </div>
+            
+            <div style="
+                background: {color_bg_secondary}; 
+                border-radius: {radius_lg}; 
+                padding: 1rem; 
+                border: 1px solid {color_border_light};
+                max-height: 400px;
+                overflow-y: auto;
+            ">
+        """
+_ERROR_MESSAGE_TMPL = """
         <div style="
             background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%); 
             border: 1px solid #f87171; 
-            border-left: 4px solid {self.theme.COLORS['error']}; 
-            border-radius: {self.theme.RADIUS['lg']}; 
+            border-left: 4px solid {color_error}; 
+            border-radius: {radius_lg}; 
             padding: 1.5rem; 
             margin: 1rem 0;
-            font-family: {self.theme.TYPOGRAPHY['font_family']};
+            font-family: {type_font_family};
         ">
             <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
                 <span style="font-size: 1.2rem;">❌</span>
-                <strong style="color: {self.theme.COLORS['error']};">Error</strong>
+                <strong style="color: {color_error};">Error</strong>
             </div>
-            <div style="color: {self.theme.COLORS['text_secondary']}; font-size: {self.theme.TYPOGRAPHY['sm']};">
-                {error}
-                {f'<br><br><strong>Context:</strong> {context}' if context else ''}
+            <div style="color: {color_text_secondary}; font-size: {type_sm};">
+                {{error}}
+                {{context}}
             </div>
         </div>
         """
-
-    def create_loading_state(self, message: str = "Processing...") -> str:
-        """Create professional loading state"""
-        return f"""
+_LOADING_STATE_TMPL = """
         <div style="
             display: flex; 
             align-items: center; 
             justify-content: center; 
             gap: 1rem; 
             padding: 2rem;
-            color: {self.theme.COLORS['text_muted']};
-            font-family: {self.theme.TYPOGRAPHY['font_family']};
+            color: {color_text_muted};
+            font-family: {type_font_family};
         ">
             <div class="loading-spinner"></div>
-            <span>{message}</span>
+            <span>{{message}}</span>
         </div>
         """
+_FOLDER_ICON_TMPL = """
+                <svg width="20" height="20" viewBox="0 0 24 24" fill="currentColor" style="color: {color_primary};">
+                    <path d="M10 4H4c-1.11 0-2 .89-2 2v12c0 1.11.89 2 2 2h16c1.11 0 2-.89 2-2V8c0-1.11-.89-2-2-2h-8l-2-2z"/>
+                </svg>
+            """
+_FILE_ICON_TMPL = """
+                <svg width="20" height="20" viewBox="0 0 24 24" fill="currentColor" style="color: {color_text_secondary};">
+                    <path d="M14,2H6A2,2 0 0,0 4,4V20A2,2 0 0,0 6,22H18A2,2 0 0,0 20,20V8L14,2M18,20H6V4H13V9H18V20Z"/>
+                </svg>
+            """
+_FILE_ROW_TMPL = """
+                <div style="
+                    padding: 0.75rem 1rem;
+                    margin: 0.5rem 0;
+                    background: {color_bg_primary};
+                    border-radius: {radius_md};
+                    border: 1px solid {color_border_light};
+                    cursor: pointer;
+                    transition: all {transition_fast};
+                    display: flex;
+                    align-items: center;
+                    gap: 0.75rem;
+                "
+                onmouseover="this.style.background='{color_bg_tertiary}'; this.style.transform='translateX(4px)'"
+                onmouseout="this.style.background='{color_bg_primary}'; this.style.transform='translateX(0)'">
+                    {{icon}}
+                    <span style="
+                        font-family: {type_font_mono};
+                        color: {color_text_primary};
+                        font-size: {type_sm};
+                    ">
+                        {{file}}
+                    </span>
+                </div>
+            """
+
+# Filled from vars(SessionState)
+_SESSION_INFO_TMPL = (
+    "Session: {session_id:.8}... | Node: {current_node} | Path: {current_path} | "
+    "Tools: {tool_count} | Messages: {message_count}"
+)
+
+
+def _node_state(node: Dict) -> Tuple:
+    """Everything the dashboard shows for a node, as a hashable cache key
+    
+    Metrics are rounded to the one decimal place they are displayed with, so readings
+    that only jitter below that still hit the cache.
+    """
+    metrics = node.get('metrics')
+    return (
+        node.get('node_id') or node.get('id', 'Unknown'),
+        bool(node.get('healthy', False)),
+        tuple(node.get('tags') or ()),
+        (
+            round(metrics.get('cpu_percent', 0), 1),
+            round(metrics.get('memory_percent', 0), 1),
+            round(metrics.get('disk_percent', 0), 1),
+        ) if metrics else None,
+    )
+
+
+@lru_cache(maxsize=STATUS_DASHBOARD_CACHE_SIZE)
+def _render_status_dashboard(theme: type, state: Tuple[Tuple, ...]) -> str:
+    """Status dashboard HTML for a theme class and a tuple of _node_state() entries"""
+    # Everything the loop reads that doesn't depend on the node is bound once
+    format_card = _DASHBOARD_NODE_TMPL.format_map
+    format_tags = _DASHBOARD_TAGS_TMPL.format
+    format_metrics = _DASHBOARD_METRICS_TMPL.format
+    card = {}  # Refilled for each node rather than building a kwargs dict per call
+    # (colour, label) indexed by health, like _NODE_STATUS in the conversational UI
+    node_status = (
+        (theme.FLAT['color_error'], "OFFLINE"),
+        (theme.FLAT['color_success'], "ONLINE"),
+    )
+    parts = [""]  # Slot for the header, which needs the counts from the loop
+    append = parts.append
+    online_nodes = 0
+    for node_id, is_healthy, tags, metrics in state:
+        online_nodes += is_healthy
+        
+        card['node_id'] = escape(node_id)
+        card['status_color'], card['status_text'] = node_status[is_healthy]
+        append(format_card(card))
+        if tags:
+            append(format_tags(tags=escape(', '.join(tags))))
+        if metrics:
+            cpu, mem, disk = metrics
+            append(format_metrics(cpu=cpu, mem=mem, disk=disk))
+        append(_DASHBOARD_NODE_END)
+    
+    # Header and system overview
+    total_nodes = len(state)
+    parts[0] = themed(_DASHBOARD_SUMMARY_TMPL, theme).format(
+        online=online_nodes, total=total_nodes, offline=total_nodes - online_nodes
+    )
+    
+    append("</div>")
+    return "".join(parts)
+
+
+class EnterpriseNACCUI(NACCConversationUI):
+    """Enhanced NACC UI with enterprise-grade features"""
+    
+    # Design tokens are all class-level, so the theme class itself is used (never instantiated)
+    theme = EnterpriseTheme
+    
+    def __init__(self, session_store: Optional[SessionStore] = None):
+        super().__init__(session_store)
+        self.accessibility_mode = False
+        # Static panels, rendered once instead of on every empty or new-chat turn
+        self._welcome_panel_html = self.create_welcome_panel()
+        self._loading_ready_html = self.create_loading_state("Ready")
+        self._browser_cache: "OrderedDict[Tuple[str, Tuple[str, ...]], str]" = OrderedDict()
+        
+    def get_enterprise_css(self) -> str:
+        """Generate comprehensive enterprise CSS with design system
+        
+        Built once per theme class and shared by every UI instance.
+        """
+        return enterprise_css(self.theme)
+
+    def create_enterprise_header(self) -> str:
+        """Create clean enterprise header HTML"""
+        return themed(_ENTERPRISE_HEADER_TMPL, self.theme)
+
+    def create_welcome_panel(self) -> str:
+        """Create clean welcome panel for right sidebar"""
+        return themed(_WELCOME_PANEL_TMPL, self.theme)
+
+    def create_enhanced_file_browser(self, files: List[str], current_path: str) -> str:
+        """Create enhanced file browser with modern design"""
+        key = (current_path, tuple(files))
+        cached = self._browser_cache.get(key)
+        if cached is not None:
+            self._browser_cache.move_to_end(key)
+            return cached
+        
+        html = self._render_file_browser(files, current_path)
+        self._browser_cache[key] = html
+        if len(self._browser_cache) > FILE_BROWSER_CACHE_SIZE:
+            self._browser_cache.popitem(last=False)
+        return html
+    
+    def _render_file_browser(self, files: List[str], current_path: str) -> str:
+        """Build the file browser HTML for one listing"""
+        html = themed(_FILE_BROWSER_HEADER_TMPL, self.theme).format(path=escape(current_path), count=len(files))
+        
+        row_tmpl = themed(_FILE_ROW_TMPL, self.theme)
+        # Use proper SVG icons instead of emoji
+        folder_icon = themed(_FOLDER_ICON_TMPL, self.theme)
+        file_icon = themed(_FILE_ICON_TMPL, self.theme)
+        rows = "".join([
+            row_tmpl.format(icon=folder_icon if "/" in file or "." not in file else file_icon, file=escape(file))
+            for file in files
+        ])
+        return f"{html}{rows}</div></div>"
+
+    def create_status_dashboard(self, nodes: List[Dict]) -> str:
+        """Create enterprise status dashboard"""
+        return _render_status_dashboard(self.theme, tuple(map(_node_state, nodes)))
+
+    def refresh_status_dashboard(self, session_id: Optional[str]) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Fetch nodes and return (dashboard HTML, status payload)
+        
+        While a session's nodes keep the same ids, health and metrics presence, the HTML
+        is a no-op update and the browser patches the metrics in from the payload.
+        """
+        result = self.tool_list_nodes()
+        session = self.get_or_create_session(session_id) if session_id else None
+        if not isinstance(result, list):
+            if session:
+                session.sent_output_hashes.pop("status_layout", None)
+            return self.create_error_message("Couldn't fetch nodes information."), None
+        
+        payload = self.create_status_payload(result)
+        layout = tuple((n["id"], n["healthy"], "cpu" in n) for n in payload["nodes"])
+        if session is None or session.output_changed("status_layout", layout):
+            return self.create_status_dashboard(result), payload
+        return NO_UPDATE, payload
+
+    def create_status_payload(self, nodes: List[Dict]) -> Dict[str, Any]:
+        """Create the compact status data naccUpdateNodes() patches the dashboard from"""
+        payload_nodes = []
+        for node in nodes:
+            entry = {
+                "id": node.get('node_id') or node.get('id', 'Unknown'),
+                "healthy": bool(node.get('healthy', False)),
+            }
+            metrics = node.get('metrics')
+            if metrics:
+                entry["cpu"] = metrics.get('cpu_percent', 0)
+                entry["mem"] = metrics.get('memory_percent', 0)
+                entry["disk"] = metrics.get('disk_percent', 0)
+            payload_nodes.append(entry)
+        
+        return {
+            "online": sum(1 for n in payload_nodes if n["healthy"]),
+            "total": len(payload_nodes),
+            "nodes": payload_nodes,
+        }
+
+    def create_error_message(self, error: str, context: str = "") -> str:
+        """Create professional error message"""
+        return themed(_ERROR_MESSAGE_TMPL, self.theme).format(
+            error=escape(error), context=f'<br><br><strong>Context:</strong> {escape(context)}' if context else ''
+        )
+
+    def create_loading_state(self, message: str = "Processing...") -> str:
+        """Create professional loading state"""
+        return themed(_LOADING_STATE_TMPL, self.theme).format(message=message)
 
     def process_message_with_enhanced_ui(self, user_message: str, chat_history: List, session_id: str) -> Tuple[List, str, str, str]:
         """Enhanced message processing with enterprise UI"""
         if not user_message.strip():
-            return chat_history, self.create_welcome_panel(), "", "", session_id
+            return chat_history, self._welcome_panel_html, "", "", session_id
         
         # Process with existing logic
         updated_history, right_content, tool_log = self.process_message(user_message, chat_history or [], session_id)
+        if right_content is None:
+            right_content = NO_UPDATE  # Nothing new to show; keep the current panel
         
         # Update session info
         session = self.get_or_create_session(session_id)
-        session_info = f"""
-        Session: {session.session_id[:8]}... | 
-        Node: {session.current_node} | 
-        Path: {session.current_path} | 
-        Tools: {len(session.tool_execution_log)} | 
-        Messages: {len(session.conversation_history)}
-        """
+        session_info = _SESSION_INFO_TMPL.format_map(vars(session))
         
         return updated_history, right_content, tool_log, session_info, session_id
+    
+    def stream_message_with_enhanced_ui(self, user_message: str, chat_history: List, session_id: str):
+        """Yield (history, right_panel, tool_log, session_id): a pending placeholder, one update per
+        finished tool, then the result"""
+        pending_history = chat_history + [{"role": "user", "content": user_message}, {"role": "assistant", "content": "…"}]
+        
+        # Show the message and a spinner straight away; routing and tools can take seconds
+        yield pending_history, NO_UPDATE, self.create_loading_state("Routing…"), session_id
+        
+        steps = self.iter_process_message(user_message, chat_history, session_id)
+        progress = ""
+        while True:
+            try:
+                tool_name, right_panel, tool_log = next(steps)
+            except StopIteration as done:
+                updated_history, right_content, tool_log = done.value
+                break
+            progress += f"✅ `{tool_name}` done\n"
+            yield pending_history, NO_UPDATE if right_panel is None else right_panel, tool_log + progress, session_id
+        
+        yield updated_history, NO_UPDATE if right_content is None else right_content, tool_log, session_id
 
 
-def create_enterprise_ui():
-    """Create the enterprise-grade UI interface"""
+def create_enterprise_ui(stylesheet_href: Optional[str] = None):
+    """Create the enterprise-grade UI interface
+    
+    With stylesheet_href the enterprise CSS is linked from that URL instead of
+    being inlined into every page (see create_enterprise_app).
+    """
     nacc = EnterpriseNACCUI()
+    head = """
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <link rel="preconnect" href="https://fonts.googleapis.com">
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+        """ + _DASHBOARD_SCRIPT
+    if stylesheet_href:
+        head += f'<link rel="stylesheet" href="{stylesheet_href}">\n'
     
     # Create the interface with enterprise styling
     with gr.Blocks(
-        css=nacc.get_enterprise_css(), 
+        css=None if stylesheet_href else nacc.get_enterprise_css(), 
         title="Enterprise AI Agent",
         theme=gr.themes.Soft(
             primary_hue="blue", 
@@ -952,11 +1212,7 @@ def create_enterprise_ui():
             text_size="lg",
             font=["Inter", "system-ui", "sans-serif"]
         ),
-        head="""
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <link rel="preconnect" href="https://fonts.googleapis.com">
-        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-        """
+        head=head
     ) as interface:
         
         # Enterprise Header
@@ -1004,11 +1260,19 @@ def create_enterprise_ui():
             
             with gr.Column(scale=1):
                 # Right Panel
-                right_panel = gr.HTML(nacc.create_welcome_panel(), label="📊 Status & Output")
+                right_panel = gr.HTML(nacc._welcome_panel_html, label="📊 Status & Output")
+                
+                # Network status; refreshes after the first only patch node metrics client-side
+                with gr.Accordion("🌐 Network Status", open=False) as status_accordion:
+                    status_panel = gr.HTML()
+                    status_payload = gr.JSON(visible=False)
+                    refresh_status = gr.Button("Refresh", variant="secondary", size="sm")
+                    # Polls on Gradio's own scheduler, off the chat path; only runs while the panel is open
+                    status_timer = gr.Timer(STATUS_REFRESH_SECONDS, active=False)
         
         # Status Display (Simplified)
         tool_log = gr.HTML(
-            nacc.create_loading_state("Ready"),
+            nacc._loading_ready_html,
             elem_classes=["tool-log"]
         )
         
@@ -1037,47 +1301,86 @@ def create_enterprise_ui():
         def respond(message, chat_history, session_id):
             """Handle user message with enhanced UI"""
             if not message.strip():
-                return chat_history, nacc.create_welcome_panel(), nacc.create_loading_state("Ready"), session_id
+                # Nothing to do: leave every output as it is in the browser
+                yield NO_UPDATE, NO_UPDATE, NO_UPDATE, session_id
+                return
             
-            updated_history, right_content, tool_log_content, session_info, session_id = nacc.process_message_with_enhanced_ui(
-                message, chat_history or [], session_id
-            )
+            # Pin the ID on the first turn so later turns reuse this session
+            if session_id is None:
+                session_id = new_session_id()
             
-            return updated_history, right_content, tool_log_content, session_id
+            yield from nacc.stream_message_with_enhanced_ui(message, chat_history or [], session_id)
         
         def new_chat(session_id):
             """Start a new enterprise chat session"""
-            import hashlib
-            from datetime import datetime
-            new_session_id = hashlib.md5(str(datetime.now().timestamp()).encode()).hexdigest()[:8]
-            
-            return [], nacc.create_welcome_panel(), nacc.create_loading_state("New session started"), new_session_id
+            return [], nacc._welcome_panel_html, nacc.create_loading_state("New session started"), new_session_id()
         
         # Event Handlers
+        gr.on(
+            triggers=[refresh_status.click, status_timer.tick, status_accordion.expand],
+            fn=nacc.refresh_status_dashboard,
+            inputs=[session_id_state],
+            outputs=[status_panel, status_payload],
+            show_progress="hidden"
+        )
+        status_accordion.expand(lambda: gr.Timer(active=True), None, status_timer)
+        status_accordion.collapse(lambda: gr.Timer(active=False), None, status_timer)
+        status_payload.change(None, status_payload, None, js="(payload) => window.naccUpdateNodes(payload)")
         submit.click(
             respond, 
             [msg, chatbot, session_id_state], 
-            [chatbot, right_panel, tool_log, session_id_state]
+            [chatbot, right_panel, tool_log, session_id_state],
+            show_progress="minimal"
         )
         msg.submit(
             respond, 
             [msg, chatbot, session_id_state], 
-            [chatbot, right_panel, tool_log, session_id_state]
+            [chatbot, right_panel, tool_log, session_id_state],
+            show_progress="minimal"
         )
     
+    # Run turns concurrently, and bound the backlog instead of queueing without limit
+    interface.queue(default_concurrency_limit=QUEUE_CONCURRENCY, max_size=QUEUE_CONCURRENCY * 8)
     return interface
 
 
-def main():
-    """Main entry point for the enterprise UI"""
-    ui = create_enterprise_ui()
-    ui.launch(
-        server_name="0.0.0.0",
-        server_port=7860,
-        share=False,
-        show_error=True,
-        favicon_path=None
+def css_asset_app(css: str, name: str, build_ui: Callable[..., "gr.Blocks"]):
+    """FastAPI app mounting build_ui(stylesheet_href=...) with css as an immutable, content-hashed asset"""
+    import hashlib
+    from fastapi import FastAPI, Response
+    
+    href = f"/static/{name}.{hashlib.sha256(css.encode()).hexdigest()[:8]}.css"
+    
+    app = FastAPI()
+    
+    @app.get(href, include_in_schema=False)
+    def stylesheet() -> Response:
+        # The URL changes whenever the CSS does, so browsers may keep it forever
+        return Response(css, media_type="text/css", headers={"Cache-Control": "public, max-age=31536000, immutable"})
+    
+    # show_error is off so tracebacks stay in the server log instead of every error response;
+    # share (from the old ui.launch()) has no counterpart when uvicorn serves the app
+    return gr.mount_gradio_app(
+        app, build_ui(stylesheet_href=href), path="/", show_error=False, favicon_path=None
     )
 
+
+def create_enterprise_app():
+    """FastAPI app serving the enterprise UI, with its CSS as an immutable, content-hashed asset"""
+    return css_asset_app(enterprise_css(EnterpriseNACCUI.theme), "enterprise", create_enterprise_ui)
+
+
+def main():
+    """Main entry point for the enterprise UI
+    
+    Serves create_enterprise_app() with uvicorn rather than ui.launch(), so the
+    stylesheet route can sit next to Gradio. There is no share link in this mode.
+    """
+    logging.basicConfig(level=logging.INFO)
+    enable_session_persistence()
+    import uvicorn
+    
+    uvicorn.run(create_enterprise_app(), host="0.0.0.0", port=7860)
+
 if __name__ == "__main__":
     main()
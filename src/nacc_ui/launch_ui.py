@@ -6,21 +6,30 @@ Allows easy comparison between conversational, enterprise, and professional UIs
 
 import sys
 import argparse
-from pathlib import Path
+import logging
 
-def launch_ui(share: bool = False, port: int = 7860):
+def launch_ui(share: bool = False, port: int = 7860, quiet: bool = False):
     """Launch the NACC UI"""
     
-    print(f"\n{'='*80}")
-    print(f"🚀 NACC UI LAUNCHER")
-    print(f"{'='*80}")
-    print(f"Port: {port}")
-    print(f"Share: {share}")
-    print(f"{'='*80}\n")
+    if not quiet:
+        print(f"\n{'='*80}")
+        print(f"🚀 NACC UI LAUNCHER")
+        print(f"{'='*80}")
+        print(f"Port: {port}")
+        print(f"Share: {share}")
+        print(f"{'='*80}\n")
+        
+        print("💼 Launching NACC Professional UI")
+        print("   Features: Dark theme, dashboard, file browser, help system\n")
     
-    print("💼 Launching NACC Professional UI")
-    print("   Features: Dark theme, dashboard, file browser, help system\n")
-    from src.nacc_ui.professional_ui_v2 import create_professional_ui_v2
+    # Imported here, not at module level: Gradio and the UI stack take seconds to load,
+    # which --help and argument errors shouldn't pay for
+    try:
+        from src.nacc_ui.session_store import enable_session_persistence
+        from src.nacc_ui.professional_ui_v2 import create_professional_ui_v2
+    except ImportError as e:
+        raise ImportError(f"{e}. Install the UI dependencies with: pip install -r requirements.txt") from e
+    enable_session_persistence()
     demo = create_professional_ui_v2()
     demo.launch(server_name="0.0.0.0", server_port=port, share=share)
 
@@ -66,10 +75,17 @@ About NACC:
         help='Port to run on (default: 7860)'
     )
     
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Skip the startup banner'
+    )
+    
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
     
     try:
-        launch_ui(args.share, args.port)
+        launch_ui(args.share, args.port, args.quiet)
     except KeyboardInterrupt:
         print("\n\n👋 Shutting down NACC UI...")
         sys.exit(0)
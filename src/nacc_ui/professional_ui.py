@@ -5,24 +5,23 @@ Enhanced version with dark mode, professional animations, and comprehensive ente
 
 import gradio as gr
 import json
-import requests
+from functools import lru_cache
 import os
 from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
-import hashlib
 import logging
+from html import escape
 from pathlib import Path
 
 # Import the existing components
-from .ai_intent_parser import AIIntentParser, PathResolver, ExecutionPlan
-from .conversational_ui import NACCConversationUI, SessionState
-from .enterprise_ui import EnterpriseNACCUI, EnterpriseTheme
+from .conversational_ui import minify_css
+from .enterprise_ui import (
+    STATUS_DASHBOARD_CACHE_SIZE, EnterpriseNACCUI, EnterpriseTheme, css_asset_app, enterprise_css, themed
+)
+from .session_store import SessionStore, enable_session_persistence
 
 # Orchestrator URL
 ORCHESTRATOR_URL = os.getenv("NACC_ORCHESTRATOR_URL", "http://127.0.0.1:8888")
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -69,528 +68,523 @@ class ProfessionalTheme(EnterpriseTheme):
         'slide': 'cubic-bezier(0.25, 0.46, 0.45, 0.94)',
         'fade': 'ease-in-out',
     }
+    
+    # EnterpriseTheme.FLAT plus dark_* and animation_* tokens
+    FLAT = {
+        **EnterpriseTheme.FLAT,
+        **{f'dark_{k}': v for k, v in DARK_COLORS.items()},
+        **{f'animation_{k}': v for k, v in ANIMATIONS.items()},
+    }
 
 
-class ProfessionalNACCUI(EnterpriseNACCUI):
-    """Enhanced UI with professional features, dark mode, and enterprise capabilities"""
+# Dark mode and professional rules appended to the enterprise stylesheet;
+# placeholders are ProfessionalTheme.FLAT keys
+_PROFESSIONAL_CSS_DARK = """
+    /* Dark Mode Support */
+    [data-theme="dark"] {{
+        --primary: {dark_primary};
+        --primary-light: {dark_primary_light};
+        --primary-dark: {dark_primary_dark};
+        --success: {dark_success};
+        --warning: {dark_warning};
+        --error: {dark_error};
+        --info: {dark_info};
+        
+        --bg-primary: {dark_bg_primary};
+        --bg-secondary: {dark_bg_secondary};
+        --bg-tertiary: {dark_bg_tertiary};
+        
+        --text-primary: {dark_text_primary};
+        --text-secondary: {dark_text_secondary};
+        --text-muted: {dark_text_muted};
+        
+        --border-light: {dark_border_light};
+        --border-medium: {dark_border_medium};
+        --border-dark: {dark_border_dark};
+    }}
     
-    def __init__(self):
-        super().__init__()
-        self.theme = ProfessionalTheme()
-        self.current_theme = "dark"  # Default to dark mode like screenshot
-        self.animation_enabled = True
-        self.professional_mode = True
-        
-    def get_comprehensive_css(self) -> str:
-        """Generate comprehensive CSS with dark mode support and professional features"""
-        base_css = self.get_enterprise_css()
-        
-        dark_mode_css = f"""
-        /* Dark Mode Support */
-        [data-theme="dark"] {{
-            --primary: {self.theme.DARK_COLORS['primary']};
-            --primary-light: {self.theme.DARK_COLORS['primary_light']};
-            --primary-dark: {self.theme.DARK_COLORS['primary_dark']};
-            --success: {self.theme.DARK_COLORS['success']};
-            --warning: {self.theme.DARK_COLORS['warning']};
-            --error: {self.theme.DARK_COLORS['error']};
-            --info: {self.theme.DARK_COLORS['info']};
-            
-            --bg-primary: {self.theme.DARK_COLORS['bg_primary']};
-            --bg-secondary: {self.theme.DARK_COLORS['bg_secondary']};
-            --bg-tertiary: {self.theme.DARK_COLORS['bg_tertiary']};
-            
-            --text-primary: {self.theme.DARK_COLORS['text_primary']};
-            --text-secondary: {self.theme.DARK_COLORS['text_secondary']};
-            --text-muted: {self.theme.DARK_COLORS['text_muted']};
-            
-            --border-light: {self.theme.DARK_COLORS['border_light']};
-            --border-medium: {self.theme.DARK_COLORS['border_medium']};
-            --border-dark: {self.theme.DARK_COLORS['border_dark']};
-        }}
-        
-        /* Theme Toggle Button */
-        .theme-toggle {{
-            position: fixed !important;
-            top: 2rem !important;
-            right: 2rem !important;
-            z-index: 1000 !important;
-            background: var(--bg-primary) !important;
-            border: 1px solid var(--border-light) !important;
-            border-radius: var(--radius-full) !important;
-            padding: 0.75rem !important;
-            cursor: pointer !important;
-            transition: all {self.theme.TRANSITIONS['fast']} !important;
-            box-shadow: var(--shadow-md) !important;
-            color: var(--text-primary) !important;
-        }}
-        
-        .theme-toggle:hover {{
-            transform: translateY(-2px) !important;
-            box-shadow: var(--shadow-lg) !important;
-        }}
-        
-        /* Enhanced Animations */
-        @keyframes pulse {{
-            0%, 100% {{
-                opacity: 1 !important;
-            }}
-            50% {{
-                opacity: 0.7 !important;
-            }}
-        }}
-        
-        @keyframes slideInUp {{
-            from {{
-                opacity: 0 !important;
-                transform: translateY(30px) !important;
-            }}
-            to {{
-                opacity: 1 !important;
-                transform: translateY(0) !important;
-            }}
-        }}
-        
-        @keyframes slideInRight {{
-            from {{
-                opacity: 0 !important;
-                transform: translateX(30px) !important;
-            }}
-            to {{
-                opacity: 1 !important;
-                transform: translateX(0) !important;
-            }}
-        }}
-        
-        @keyframes fadeIn {{
-            from {{
-                opacity: 0 !important;
-            }}
-            to {{
-                opacity: 1 !important;
-            }}
-        }}
-        
-        @keyframes shimmer {{
-            0% {{
-                background-position: -200px 0 !important;
-            }}
-            100% {{
-                background-position: calc(200px + 100%) 0 !important;
-            }}
-        }}
-        
-        /* Professional Loading States */
-        .professional-loading {{
-            background: linear-gradient(90deg, var(--bg-secondary) 25%, var(--bg-tertiary) 50%, var(--bg-secondary) 75%) !important;
-            background-size: 200px 100% !important;
-            animation: shimmer 1.5s infinite !important;
-            border-radius: var(--radius-md) !important;
-        }}
-        
-        .status-indicator-animated {{
-            animation: pulse 2s infinite !important;
-        }}
-        
-        /* Enhanced Message Styling */
-        .message-enhanced {{
-            animation: slideInUp 0.4s {self.theme.ANIMATIONS['smooth']} !important;
-            margin-bottom: 1.5rem !important;
+"""
+_PROFESSIONAL_CSS_TOGGLE = """
+    /* Theme Toggle Button */
+    .theme-toggle {{
+        position: fixed !important;
+        top: 2rem !important;
+        right: 2rem !important;
+        z-index: 1000 !important;
+        background: var(--bg-primary) !important;
+        border: 1px solid var(--border-light) !important;
+        border-radius: var(--radius-full) !important;
+        padding: 0.75rem !important;
+        cursor: pointer !important;
+        transition: all {transition_fast} !important;
+        box-shadow: var(--shadow-md) !important;
+        color: var(--text-primary) !important;
+    }}
+    
+    .theme-toggle:hover {{
+        transform: translateY(-2px) !important;
+        box-shadow: var(--shadow-lg) !important;
+    }}
+    
+"""
+_PROFESSIONAL_CSS_ANIMATIONS = """
+    /* Enhanced Animations */
+    @keyframes pulse {{
+        0%, 100% {{
+            opacity: 1;
         }}
-        
-        .user-message-enhanced {{
-            display: flex !important;
-            justify-content: flex-end !important;
-            animation: slideInRight 0.4s {self.theme.ANIMATIONS['smooth']} !important;
+        50% {{
+            opacity: 0.7;
         }}
-        
-        .bot-bubble-enhanced {{
-            background: var(--bg-primary) !important;
-            color: var(--text-primary) !important;
-            padding: 1.5rem 2rem !important;
-            border-radius: var(--radius-lg) var(--radius-lg) var(--radius-lg) var(--radius-sm) !important;
-            border: 1px solid var(--border-light) !important;
-            max-width: 70% !important;
-            box-shadow: var(--shadow-md) !important;
-            transition: all {self.theme.TRANSITIONS['fast']} !important;
-            position: relative !important;
-            overflow: hidden !important;
+    }}
+    
+    /* One slide-in; each user sets the offset it slides from with --slide-x / --slide-y */
+    @keyframes slideInOffset {{
+        from {{
+            opacity: 0;
+            transform: translate(var(--slide-x, 0), var(--slide-y, 0));
         }}
-        
-        .bot-bubble-enhanced::before {{
-            content: '' !important;
-            position: absolute !important;
-            top: 0 !important;
-            left: -100% !important;
-            width: 100% !important;
-            height: 100% !important;
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.1), transparent) !important;
-            transition: left 0.5s !important;
+        to {{
+            opacity: 1;
+            transform: none;
         }}
-        
-        .bot-bubble-enhanced:hover::before {{
-            left: 100% !important;
+    }}
+    
+    @keyframes fadeIn {{
+        from {{
+            opacity: 0;
         }}
-        
-        .bot-bubble-enhanced:hover {{
-            box-shadow: var(--shadow-lg) !important;
-            transform: translateY(-2px) !important;
+        to {{
+            opacity: 1;
         }}
-        
-        /* Professional Status Dashboard */
-        .status-dashboard {{
-            background: var(--bg-primary) !important;
-            border-radius: var(--radius-xl) !important;
-            box-shadow: var(--shadow-xl) !important;
-            border: 1px solid var(--border-light) !important;
-            overflow: hidden !important;
-            animation: fadeIn 0.6s {self.theme.ANIMATIONS['smooth']} !important;
+    }}
+    
+    @keyframes shimmer {{
+        0% {{
+            background-position: -200px 0;
         }}
-        
-        .metric-card {{
-            background: var(--bg-secondary) !important;
-            border: 1px solid var(--border-light) !important;
-            border-radius: var(--radius-lg) !important;
-            padding: 1.5rem !important;
-            margin-bottom: 1rem !important;
-            transition: all {self.theme.TRANSITIONS['fast']} !important;
-            position: relative !important;
-            overflow: hidden !important;
+        100% {{
+            background-position: calc(200px + 100%) 0;
         }}
-        
-        .metric-card::before {{
-            content: '' !important;
-            position: absolute !important;
-            top: 0 !important;
-            left: 0 !important;
-            width: 4px !important;
-            height: 100% !important;
-            background: var(--primary) !important;
-            transition: width {self.theme.TRANSITIONS['fast']} !important;
+    }}
+    
+    /* Professional Loading States */
+    .professional-loading {{
+        background: linear-gradient(90deg, var(--bg-secondary) 25%, var(--bg-tertiary) 50%, var(--bg-secondary) 75%) !important;
+        background-size: 200px 100% !important;
+        animation: shimmer 1.5s infinite !important;
+        border-radius: var(--radius-md) !important;
+    }}
+    
+    .status-indicator-animated {{
+        animation: pulse 2s infinite !important;
+    }}
+    
+"""
+_PROFESSIONAL_CSS_MESSAGES = """
+    /* Enhanced Message Styling */
+    .message-enhanced {{
+        --slide-y: 30px;
+        animation: slideInOffset 0.4s {animation_smooth} !important;
+        margin-bottom: 1.5rem !important;
+    }}
+    
+    .user-message-enhanced {{
+        display: flex !important;
+        justify-content: flex-end !important;
+        --slide-x: 30px;
+        animation: slideInOffset 0.4s {animation_smooth} !important;
+    }}
+    
+    .bot-bubble-enhanced {{
+        background: var(--bg-primary) !important;
+        color: var(--text-primary) !important;
+        padding: 1.5rem 2rem !important;
+        border-radius: var(--radius-lg) var(--radius-lg) var(--radius-lg) var(--radius-sm) !important;
+        border: 1px solid var(--border-light) !important;
+        max-width: 70% !important;
+        box-shadow: var(--shadow-md) !important;
+        transition: all {transition_fast} !important;
+        position: relative !important;
+        overflow: hidden !important;
+        --sweep-color: rgba(255,255,255,0.1);
+        --sweep-duration: 0.5s;
+    }}
+    
+    .bot-bubble-enhanced:hover {{
+        box-shadow: var(--shadow-lg) !important;
+        transform: translateY(-2px) !important;
+    }}
+    
+"""
+_PROFESSIONAL_CSS_DASHBOARD = """
+    /* Professional Status Dashboard */
+    .status-dashboard {{
+        background: var(--bg-primary) !important;
+        border-radius: var(--radius-xl) !important;
+        box-shadow: var(--shadow-xl) !important;
+        border: 1px solid var(--border-light) !important;
+        overflow: hidden !important;
+        animation: fadeIn 0.6s {animation_smooth} !important;
+    }}
+    
+    .metric-card {{
+        background: var(--bg-secondary) !important;
+        border: 1px solid var(--border-light) !important;
+        border-radius: var(--radius-lg) !important;
+        padding: 1.5rem !important;
+        margin-bottom: 1rem !important;
+        transition: all {transition_fast} !important;
+        position: relative !important;
+        overflow: hidden !important;
+    }}
+    
+    .metric-card::before {{
+        content: '' !important;
+        position: absolute !important;
+        top: 0 !important;
+        left: 0 !important;
+        width: 4px !important;
+        height: 100% !important;
+        background: var(--primary) !important;
+        transition: width {transition_fast} !important;
+    }}
+    
+    .metric-card:hover {{
+        transform: translateY(-4px) !important;
+        box-shadow: var(--shadow-xl) !important;
+    }}
+    
+    .metric-card:hover::before {{
+        width: 100% !important;
+        opacity: 0.1 !important;
+    }}
+    
+"""
+_PROFESSIONAL_CSS_NAVIGATION = """
+    /* Professional Navigation */
+    .enterprise-navigation {{
+        background: var(--bg-primary) !important;
+        border-bottom: 1px solid var(--border-light) !important;
+        backdrop-filter: blur(10px) !important;
+        position: sticky !important;
+        top: 0 !important;
+        z-index: 100 !important;
+        padding: 1rem 2rem !important;
+    }}
+    
+    .nav-item {{
+        padding: 0.5rem 1rem !important;
+        border-radius: var(--radius-md) !important;
+        color: var(--text-secondary) !important;
+        text-decoration: none !important;
+        font-weight: {type_medium} !important;
+        transition: all {transition_fast} !important;
+        cursor: pointer !important;
+        display: inline-flex !important;
+        align-items: center !important;
+        gap: 0.5rem !important;
+    }}
+    
+    .nav-item:hover,
+    .nav-item.active {{
+        background: var(--primary) !important;
+        color: white !important;
+        transform: translateY(-1px) !important;
+    }}
+    
+"""
+_PROFESSIONAL_CSS_FILES = """
+    /* Enhanced File Browser */
+    .file-browser-enhanced {{
+        background: var(--bg-secondary) !important;
+        border-radius: var(--radius-lg) !important;
+        padding: 1rem !important;
+        border: 1px solid var(--border-light) !important;
+        max-height: 500px !important;
+        overflow-y: auto !important;
+    }}
+    
+    .file-item {{
+        display: flex !important;
+        align-items: center !important;
+        gap: 0.75rem !important;
+        padding: 0.75rem 1rem !important;
+        margin: 0.5rem 0 !important;
+        background: var(--bg-primary) !important;
+        border: 1px solid var(--border-light) !important;
+        border-radius: var(--radius-md) !important;
+        cursor: pointer !important;
+        transition: all {transition_fast} !important;
+        position: relative !important;
+        overflow: hidden !important;
+        --sweep-color: var(--primary-light);
+        --sweep-duration: 0.3s;
+    }}
+    
+    .file-item:hover {{
+        background: var(--primary) !important;
+        color: white !important;
+        transform: translateX(4px) !important;
+        box-shadow: var(--shadow-md) !important;
+    }}
+    
+    /* Hover sweep shared by chat bubbles and file items */
+    .bot-bubble-enhanced::before,
+    .file-item::before {{
+        content: '' !important;
+        position: absolute !important;
+        top: 0 !important;
+        left: -100% !important;
+        width: 100% !important;
+        height: 100% !important;
+        background: linear-gradient(90deg, transparent, var(--sweep-color), transparent) !important;
+        transition: left var(--sweep-duration) !important;
+    }}
+    
+    .bot-bubble-enhanced:hover::before,
+    .file-item:hover::before {{
+        left: 100% !important;
+    }}
+    
+"""
+_PROFESSIONAL_CSS_ERRORS = """
+    /* Professional Error States */
+    .error-container {{
+        background: linear-gradient(135deg, rgba(239, 68, 68, 0.1) 0%, rgba(220, 38, 38, 0.05) 100%) !important;
+        border: 1px solid var(--error) !important;
+        border-left: 4px solid var(--error) !important;
+        border-radius: var(--radius-lg) !important;
+        padding: 1.5rem !important;
+        margin: 1rem 0 !important;
+        --slide-y: 30px;
+        animation: slideInOffset 0.3s {animation_smooth} !important;
+    }}
+    
+"""
+_PROFESSIONAL_CSS_HELP = """
+    /* Help System */
+    .help-panel {{
+        background: var(--bg-primary) !important;
+        border: 1px solid var(--border-light) !important;
+        border-radius: var(--radius-xl) !important;
+        box-shadow: var(--shadow-xl) !important;
+        padding: 2rem !important;
+        animation: fadeIn 0.5s {animation_smooth} !important;
+    }}
+    
+    .help-section {{
+        margin-bottom: 2rem !important;
+    }}
+    
+    .help-title {{
+        font-size: {type_xl} !important;
+        font-weight: {type_semibold} !important;
+        color: var(--text-primary) !important;
+        margin-bottom: 1rem !important;
+    }}
+    
+    .help-item {{
+        background: var(--bg-secondary) !important;
+        border: 1px solid var(--border-light) !important;
+        border-radius: var(--radius-md) !important;
+        padding: 1rem !important;
+        margin-bottom: 0.5rem !important;
+        transition: all {transition_fast} !important;
+    }}
+    
+    .help-item:hover {{
+        background: var(--bg-tertiary) !important;
+        transform: translateX(2px) !important;
+    }}
+    
+    /* Professional Tooltips */
+    .tooltip {{
+        position: relative !important;
+        display: inline-block !important;
+    }}
+    
+    .tooltip .tooltip-text {{
+        visibility: hidden !important;
+        width: 200px !important;
+        background-color: var(--bg-primary) !important;
+        color: var(--text-primary) !important;
+        text-align: center !important;
+        border-radius: var(--radius-md) !important;
+        padding: 0.5rem !important;
+        position: absolute !important;
+        z-index: 1000 !important;
+        bottom: 125% !important;
+        left: 50% !important;
+        margin-left: -100px !important;
+        opacity: 0 !important;
+        transition: opacity {transition_fast} !important;
+        box-shadow: var(--shadow-lg) !important;
+        border: 1px solid var(--border-light) !important;
+        font-size: {type_sm} !important;
+    }}
+    
+    .tooltip:hover .tooltip-text {{
+        visibility: visible !important;
+        opacity: 1 !important;
+    }}
+    
+    /* Keyboard Shortcuts Indicator */
+    .keyboard-hint {{
+        background: var(--bg-tertiary) !important;
+        border: 1px solid var(--border-medium) !important;
+        border-radius: var(--radius-sm) !important;
+        padding: 0.2rem 0.4rem !important;
+        font-family: {type_font_mono} !important;
+        font-size: {type_xs} !important;
+        color: var(--text-muted) !important;
+        margin-left: 0.5rem !important;
+    }}
+    
+"""
+_PROFESSIONAL_CSS_MEDIA = """
+    /* Enhanced Mobile Responsiveness; only what differs from the enterprise breakpoint */
+    @media (max-width: 768px) {{
+        .enterprise-main {{
+            grid-template-columns: 1fr !important;
+            gap: 1rem !important;
         }}
         
-        .metric-card:hover {{
-            transform: translateY(-4px) !important;
-            box-shadow: var(--shadow-xl) !important;
+        .chat-container,
+        .right-panel {{
+            height: calc(100vh - 120px) !important;
+            min-height: 400px !important;
         }}
         
-        .metric-card:hover::before {{
-            width: 100% !important;
-            opacity: 0.1 !important;
+        .theme-toggle {{
+            top: 1rem !important;
+            right: 1rem !important;
+            padding: 0.5rem !important;
         }}
         
-        /* Professional Navigation */
         .enterprise-navigation {{
-            background: var(--bg-primary) !important;
-            border-bottom: 1px solid var(--border-light) !important;
-            backdrop-filter: blur(10px) !important;
-            position: sticky !important;
-            top: 0 !important;
-            z-index: 100 !important;
-            padding: 1rem 2rem !important;
-        }}
-        
-        .nav-item {{
-            padding: 0.5rem 1rem !important;
-            border-radius: var(--radius-md) !important;
-            color: var(--text-secondary) !important;
-            text-decoration: none !important;
-            font-weight: {self.theme.TYPOGRAPHY['medium']} !important;
-            transition: all {self.theme.TRANSITIONS['fast']} !important;
-            cursor: pointer !important;
-            display: inline-flex !important;
-            align-items: center !important;
-            gap: 0.5rem !important;
-        }}
-        
-        .nav-item:hover,
-        .nav-item.active {{
-            background: var(--primary) !important;
-            color: white !important;
-            transform: translateY(-1px) !important;
-        }}
-        
-        /* Enhanced File Browser */
-        .file-browser-enhanced {{
-            background: var(--bg-secondary) !important;
-            border-radius: var(--radius-lg) !important;
-            padding: 1rem !important;
-            border: 1px solid var(--border-light) !important;
-            max-height: 500px !important;
-            overflow-y: auto !important;
-        }}
-        
-        .file-item {{
-            display: flex !important;
-            align-items: center !important;
-            gap: 0.75rem !important;
             padding: 0.75rem 1rem !important;
-            margin: 0.5rem 0 !important;
-            background: var(--bg-primary) !important;
-            border: 1px solid var(--border-light) !important;
-            border-radius: var(--radius-md) !important;
-            cursor: pointer !important;
-            transition: all {self.theme.TRANSITIONS['fast']} !important;
-            position: relative !important;
-            overflow: hidden !important;
         }}
-        
-        .file-item::before {{
-            content: '' !important;
-            position: absolute !important;
-            top: 0 !important;
-            left: -100% !important;
-            width: 100% !important;
-            height: 100% !important;
-            background: linear-gradient(90deg, transparent, var(--primary-light), transparent) !important;
-            transition: left 0.3s !important;
+    }}
+    
+    /* Reduced motion; the enterprise rule already zeroes durations on *, but these
+       !important class-level animations outrank it */
+    @media (prefers-reduced-motion: reduce) {{
+        .message-enhanced,
+        .user-message-enhanced {{
+            animation: none !important;
         }}
-        
-        .file-item:hover::before {{
-            left: 100% !important;
+    }}
+    
+    /* High Contrast Mode */
+    @media (prefers-contrast: high) {{
+        .user-bubble {{
+            border: 2px solid var(--text-primary) !important;
         }}
         
-        .file-item:hover {{
-            background: var(--primary) !important;
-            color: white !important;
-            transform: translateX(4px) !important;
-            box-shadow: var(--shadow-md) !important;
+        .bot-bubble-enhanced {{
+            border: 2px solid var(--border-dark) !important;
         }}
         
-        /* Professional Error States */
-        .error-container {{
-            background: linear-gradient(135deg, rgba(239, 68, 68, 0.1) 0%, rgba(220, 38, 38, 0.05) 100%) !important;
-            border: 1px solid var(--error) !important;
-            border-left: 4px solid var(--error) !important;
-            border-radius: var(--radius-lg) !important;
-            padding: 1.5rem !important;
-            margin: 1rem 0 !important;
-            animation: slideInUp 0.3s {self.theme.ANIMATIONS['smooth']} !important;
+        .file-item:hover {{
+            outline: 2px solid var(--primary) !important;
         }}
-        
-        /* Help System */
+    }}
+    
+    /* Focus Management */
+    .focus-enhanced:focus {{
+        outline: 2px solid var(--primary) !important;
+        outline-offset: 2px !important;
+        box-shadow: 0 0 0 4px rgba(59, 130, 246, 0.1) !important;
+    }}
+    
+    /* Print Optimizations; the enterprise print rules already flatten the panels */
+    @media print {{
+        .theme-toggle,
+        .enterprise-navigation,
         .help-panel {{
-            background: var(--bg-primary) !important;
-            border: 1px solid var(--border-light) !important;
-            border-radius: var(--radius-xl) !important;
-            box-shadow: var(--shadow-xl) !important;
-            padding: 2rem !important;
-            animation: fadeIn 0.5s {self.theme.ANIMATIONS['smooth']} !important;
-        }}
-        
-        .help-section {{
-            margin-bottom: 2rem !important;
-        }}
-        
-        .help-title {{
-            font-size: {self.theme.TYPOGRAPHY['xl']} !important;
-            font-weight: {self.theme.TYPOGRAPHY['semibold']} !important;
-            color: var(--text-primary) !important;
-            margin-bottom: 1rem !important;
-        }}
-        
-        .help-item {{
-            background: var(--bg-secondary) !important;
-            border: 1px solid var(--border-light) !important;
-            border-radius: var(--radius-md) !important;
-            padding: 1rem !important;
-            margin-bottom: 0.5rem !important;
-            transition: all {self.theme.TRANSITIONS['fast']} !important;
-        }}
-        
-        .help-item:hover {{
-            background: var(--bg-tertiary) !important;
-            transform: translateX(2px) !important;
-        }}
-        
-        /* Professional Tooltips */
-        .tooltip {{
-            position: relative !important;
-            display: inline-block !important;
-        }}
-        
-        .tooltip .tooltip-text {{
-            visibility: hidden !important;
-            width: 200px !important;
-            background-color: var(--bg-primary) !important;
-            color: var(--text-primary) !important;
-            text-align: center !important;
-            border-radius: var(--radius-md) !important;
-            padding: 0.5rem !important;
-            position: absolute !important;
-            z-index: 1000 !important;
-            bottom: 125% !important;
-            left: 50% !important;
-            margin-left: -100px !important;
-            opacity: 0 !important;
-            transition: opacity {self.theme.TRANSITIONS['fast']} !important;
-            box-shadow: var(--shadow-lg) !important;
-            border: 1px solid var(--border-light) !important;
-            font-size: {self.theme.TYPOGRAPHY['sm']} !important;
-        }}
-        
-        .tooltip:hover .tooltip-text {{
-            visibility: visible !important;
-            opacity: 1 !important;
-        }}
-        
-        /* Keyboard Shortcuts Indicator */
-        .keyboard-hint {{
-            background: var(--bg-tertiary) !important;
-            border: 1px solid var(--border-medium) !important;
-            border-radius: var(--radius-sm) !important;
-            padding: 0.2rem 0.4rem !important;
-            font-family: {self.theme.TYPOGRAPHY['font_mono']} !important;
-            font-size: {self.theme.TYPOGRAPHY['xs']} !important;
-            color: var(--text-muted) !important;
-            margin-left: 0.5rem !important;
-        }}
-        
-        /* Enhanced Mobile Responsiveness */
-        @media (max-width: 768px) {{
-            .enterprise-main {{
-                padding: 0 1rem !important;
-                grid-template-columns: 1fr !important;
-                gap: 1rem !important;
-            }}
-            
-            .chat-container,
-            .right-panel {{
-                height: calc(100vh - 120px) !important;
-                min-height: 400px !important;
-            }}
-            
-            .chat-messages {{
-                padding: 1rem !important;
-            }}
-            
-            .user-bubble,
-            .bot-bubble {{
-                max-width: 85% !important;
-            }}
-            
-            .theme-toggle {{
-                top: 1rem !important;
-                right: 1rem !important;
-                padding: 0.5rem !important;
-            }}
-            
-            .enterprise-navigation {{
-                padding: 0.75rem 1rem !important;
-            }}
-        }}
-        
-        /* Accessibility Enhancements */
-        @media (prefers-reduced-motion: reduce) {{
-            * {{
-                animation-duration: 0.01ms !important;
-                animation-iteration-count: 1 !important;
-                transition-duration: 0.01ms !important;
-            }}
-            
-            .message-enhanced,
-            .user-message-enhanced {{
-                animation: none !important;
-            }}
+            display: none !important;
         }}
         
-        /* High Contrast Mode */
-        @media (prefers-contrast: high) {{
-            .user-bubble {{
-                border: 2px solid var(--text-primary) !important;
-            }}
-            
-            .bot-bubble-enhanced {{
-                border: 2px solid var(--border-dark) !important;
-            }}
-            
-            .file-item:hover {{
-                outline: 2px solid var(--primary) !important;
-            }}
-        }}
-        
-        /* Focus Management */
-        .focus-enhanced:focus {{
-            outline: 2px solid var(--primary) !important;
-            outline-offset: 2px !important;
-            box-shadow: 0 0 0 4px rgba(59, 130, 246, 0.1) !important;
-        }}
-        
-        /* Print Optimizations */
-        @media print {{
-            .theme-toggle,
-            .enterprise-navigation,
-            .help-panel {{
-                display: none !important;
-            }}
-            
-            .chat-container,
-            .right-panel {{
-                box-shadow: none !important;
-                border: 1px solid #ccc !important;
-            }}
-            
-            .message-enhanced,
-            .user-message-enhanced {{
-                animation: none !important;
-            }}
+        .message-enhanced,
+        .user-message-enhanced {{
+            animation: none !important;
         }}
-        """
-        
-        return base_css + dark_mode_css
+    }}
     
-    def create_theme_toggle(self) -> str:
-        """Create theme toggle button"""
-        return f"""
+"""
+_PROFESSIONAL_CSS_TMPL = "".join((
+    _PROFESSIONAL_CSS_DARK, _PROFESSIONAL_CSS_TOGGLE, _PROFESSIONAL_CSS_ANIMATIONS, _PROFESSIONAL_CSS_MESSAGES, _PROFESSIONAL_CSS_DASHBOARD,
+    _PROFESSIONAL_CSS_NAVIGATION, _PROFESSIONAL_CSS_FILES, _PROFESSIONAL_CSS_ERRORS, _PROFESSIONAL_CSS_HELP, _PROFESSIONAL_CSS_MEDIA,
+))
+
+
+@lru_cache(maxsize=None)
+def _comprehensive_css(theme: type) -> str:
+    """Minified enterprise stylesheet plus the dark mode and professional rules, for a theme class"""
+    return enterprise_css(theme) + minify_css(_PROFESSIONAL_CSS_TMPL.format_map(theme.FLAT))
+
+
+# Icons used by the header and theme toggle, sent once as symbols and drawn with <use>
+_SVG_SPRITE = (
+    '<svg style="display: none;" xmlns="http://www.w3.org/2000/svg">'
+    '<symbol id="ic-chat" viewBox="0 0 24 24"><path d="M20 2H4c-1.1 0-2 .9-2 2v18l4-4h14c1.1 0 2-.9 2-2V4c0-1.1-.9-2-2-2zm0 14H6l-2 2V4h16v12z"/></symbol>'
+    '<symbol id="ic-dash" viewBox="0 0 24 24"><path d="M3 13h8V3H3v10zm0 8h8v-6H3v6zm10 0h8V11h-8v10zm0-18v6h8V3h-8z"/></symbol>'
+    '<symbol id="ic-help" viewBox="0 0 24 24"><path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm1 15h-2v-2h2v2zm0-4h-2V7h2v6z"/></symbol>'
+    '<symbol id="ic-sun" viewBox="0 0 24 24"><path d="M12 2.25a.75.75 0 01.75.75v2.25a.75.75 0 01-1.5 0V3a.75.75 0 01.75-.75zM7.5 12a4.5 4.5 0 119 0 4.5 4.5 0 01-9 0zM18.894 6.166a.75.75 0 00-1.06-1.06l-1.591 1.59a.75.75 0 101.06 1.061l1.591-1.59zM21.75 12a.75.75 0 01-.75.75h-2.25a.75.75 0 010-1.5H21a.75.75 0 01.75.75zM17.834 18.894a.75.75 0 001.06-1.06l-1.59-1.591a.75.75 0 10-1.061 1.06l1.59 1.591zM12 18a.75.75 0 01.75.75V21a.75.75 0 01-1.5 0v-2.25A.75.75 0 0112 18zM7.758 17.303a.75.75 0 00-1.061-1.06l-1.591 1.59a.75.75 0 001.06 1.061l1.591-1.59zM6 12a.75.75 0 01-.75.75H3a.75.75 0 010-1.5h2.25A.75.75 0 016 12zM6.697 7.757a.75.75 0 001.06-1.06l-1.59-1.591a.75.75 0 00-1.061 1.06l1.59 1.591z"/></symbol>'
+    '<symbol id="ic-moon" viewBox="0 0 24 24"><path d="M9.528 1.718a.75.75 0 01.162.819A8.97 8.97 0 009 6a9 9 0 009 9 8.97 8.97 0 003.463-.69.75.75 0 01.981.98 10.503 10.503 0 01-9.694 6.46c-5.799 0-10.5-4.701-10.5-10.5 0-4.368 2.667-8.112 6.46-9.694a.75.75 0 01.818.162z"/></symbol>'
+    '</svg>'
+)
+
+# Theme toggle; the script only swaps which sprite symbol the icon uses
+_THEME_TOGGLE_HTML = """
         <button class="theme-toggle" onclick="toggleTheme()" title="Toggle theme (L/D)">
-            <svg id="theme-icon" width="20" height="20" viewBox="0 0 24 24" fill="currentColor">
-                <path d="M12 2.25a.75.75 0 01.75.75v2.25a.75.75 0 01-1.5 0V3a.75.75 0 01.75-.75zM7.5 12a4.5 4.5 0 119 0 4.5 4.5 0 01-9 0zM18.894 6.166a.75.75 0 00-1.06-1.06l-1.591 1.59a.75.75 0 101.06 1.061l1.591-1.59zM21.75 12a.75.75 0 01-.75.75h-2.25a.75.75 0 010-1.5H21a.75.75 0 01.75.75zM17.834 18.894a.75.75 0 001.06-1.06l-1.59-1.591a.75.75 0 10-1.061 1.06l1.59 1.591zM12 18a.75.75 0 01.75.75V21a.75.75 0 01-1.5 0v-2.25A.75.75 0 0112 18zM7.758 17.303a.75.75 0 00-1.061-1.06l-1.591 1.59a.75.75 0 001.06 1.061l1.591-1.59zM6 12a.75.75 0 01-.75.75H3a.75.75 0 010-1.5h2.25A.75.75 0 016 12zM6.697 7.757a.75.75 0 001.06-1.06l-1.59-1.591a.75.75 0 00-1.061 1.06l1.59 1.591z"/>
-            </svg>
+            <svg id="theme-icon" width="20" height="20" fill="currentColor"><use href="#ic-sun"/></svg>
         </button>
         <script>
-            function toggleTheme() {{
+            function toggleTheme() {
                 const html = document.documentElement;
                 const currentTheme = html.getAttribute('data-theme');
                 const themeIcon = document.getElementById('theme-icon');
                 
-                if (currentTheme === 'dark') {{
+                if (currentTheme === 'dark') {
                     html.removeAttribute('data-theme');
-                    themeIcon.innerHTML = '<path d="M12 2.25a.75.75 0 01.75.75v2.25a.75.75 0 01-1.5 0V3a.75.75 0 01.75-.75zM7.5 12a4.5 4.5 0 119 0 4.5 4.5 0 01-9 0zM18.894 6.166a.75.75 0 00-1.06-1.06l-1.591 1.59a.75.75 0 101.06 1.061l1.591-1.59zM21.75 12a.75.75 0 01-.75.75h-2.25a.75.75 0 010-1.5H21a.75.75 0 01.75.75zM17.834 18.894a.75.75 0 001.06-1.06l-1.59-1.591a.75.75 0 10-1.061 1.06l1.59 1.591zM12 18a.75.75 0 01.75.75V21a.75.75 0 01-1.5 0v-2.25A.75.75 0 0112 18zM7.758 17.303a.75.75 0 00-1.061-1.06l-1.591 1.59a.75.75 0 001.06 1.061l1.591-1.59zM6 12a.75.75 0 01-.75.75H3a.75.75 0 010-1.5h2.25A.75.75 0 016 12zM6.697 7.757a.75.75 0 001.06-1.06l-1.59-1.591a.75.75 0 00-1.061 1.06l1.59 1.591z"/>';
+                    themeIcon.firstElementChild.setAttribute('href', '#ic-sun');
                     localStorage.setItem('theme', 'light');
-                }} else {{
+                } else {
                     html.setAttribute('data-theme', 'dark');
-                    themeIcon.innerHTML = '<path d="M9.528 1.718a.75.75 0 01.162.819A8.97 8.97 0 009 6a9 9 0 009 9 8.97 8.97 0 003.463-.69.75.75 0 01.981.98 10.503 10.503 0 01-9.694 6.46c-5.799 0-10.5-4.701-10.5-10.5 0-4.368 2.667-8.112 6.46-9.694a.75.75 0 01.818.162z"/>';
+                    themeIcon.firstElementChild.setAttribute('href', '#ic-moon');
                     localStorage.setItem('theme', 'dark');
-                }}
-            }}
+                }
+            }
             
             // Initialize theme - DEFAULT TO DARK MODE like screenshot
             const savedTheme = localStorage.getItem('theme') || 'dark';
-            if (savedTheme === 'dark') {{
+            if (savedTheme === 'dark') {
                 document.documentElement.setAttribute('data-theme', 'dark');
-                document.getElementById('theme-icon').innerHTML = '<path d="M9.528 1.718a.75.75 0 01.162.819A8.97 8.97 0 009 6a9 9 0 009 9 8.97 8.97 0 003.463-.69.75.75 0 01.981.98 10.503 10.503 0 01-9.694 6.46c-5.799 0-10.5-4.701-10.5-10.5 0-4.368 2.667-8.112 6.46-9.694a.75.75 0 01.818.162z"/>';
-            }}
+                document.getElementById('theme-icon').firstElementChild.setAttribute('href', '#ic-moon');
+            }
         </script>
         """
-    
-    def create_professional_header(self) -> str:
-        """Create enhanced professional header with navigation"""
-        return f"""
+
+
+# Static panels; theme placeholders are ProfessionalTheme.FLAT keys
+_PROFESSIONAL_HEADER_TMPL = _SVG_SPRITE + """
         <div class="enterprise-navigation" role="banner">
             <div style="display: flex; justify-content: space-between; align-items: center;">
                 <div class="enterprise-logo">
                     <div style="
                         width: 3rem; 
                         height: 3rem; 
-                        background: linear-gradient(135deg, {self.theme.COLORS['primary']} 0%, {self.theme.COLORS['accent']} 100%);
-                        border-radius: {self.theme.RADIUS['lg']};
+                        background: linear-gradient(135deg, {color_primary} 0%, {color_accent} 100%);
+                        border-radius: {radius_lg};
                         display: flex;
                         align-items: center;
                         justify-content: center;
                         color: white;
                         font-weight: bold;
                         font-size: 1.25rem;
-                        box-shadow: {self.theme.SHADOWS['md']};
+                        box-shadow: {shadow_md};
                     ">
                         N
                     </div>
@@ -601,40 +595,31 @@ class ProfessionalNACCUI(EnterpriseNACCUI):
                 
                 <nav style="display: flex; gap: 1rem; align-items: center;">
                     <a class="nav-item active" href="#" onclick="showTab('chat')">
-                        <svg width="20" height="20" viewBox="0 0 24 24" fill="currentColor" style="margin-right: 8px;">
-                            <path d="M20 2H4c-1.1 0-2 .9-2 2v18l4-4h14c1.1 0 2-.9 2-2V4c0-1.1-.9-2-2-2zm0 14H6l-2 2V4h16v12z"/>
-                        </svg>
+                        <svg width="20" height="20" fill="currentColor" style="margin-right: 8px;"><use href="#ic-chat"/></svg>
                         Chat
                         <span class="keyboard-hint">C</span>
                     </a>
                     <a class="nav-item" href="#" onclick="showTab('dashboard')">
-                        <svg width="20" height="20" viewBox="0 0 24 24" fill="currentColor" style="margin-right: 8px;">
-                            <path d="M3 13h8V3H3v10zm0 8h8v-6H3v6zm10 0h8V11h-8v10zm0-18v6h8V3h-8z"/>
-                        </svg>
+                        <svg width="20" height="20" fill="currentColor" style="margin-right: 8px;"><use href="#ic-dash"/></svg>
                         Dashboard
                         <span class="keyboard-hint">D</span>
                     </a>
                     <a class="nav-item" href="#" onclick="showTab('help')">
-                        <svg width="20" height="20" viewBox="0 0 24 24" fill="currentColor" style="margin-right: 8px;">
-                            <path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm1 15h-2v-2h2v2zm0-4h-2V7h2v6z"/>
-                        </svg>
+                        <svg width="20" height="20" fill="currentColor" style="margin-right: 8px;"><use href="#ic-help"/></svg>
                         Help
                         <span class="keyboard-hint">H</span>
                     </a>
                 </nav>
             </div>
         </div>
-        {self.create_theme_toggle()}
         """
-    
-    def create_help_system(self) -> str:
-        """Create comprehensive help system"""
-        return f"""
+
+_HELP_SYSTEM_TMPL = """
         <div class="help-panel">
             <h2 class="help-title">📚 About NACC Project</h2>
             
             <div class="help-section">
-                <h3 style="color: var(--text-primary); font-size: {self.theme.TYPOGRAPHY['lg']}; margin-bottom: 1rem;">
+                <h3 style="color: var(--text-primary); font-size: {type_lg}; margin-bottom: 1rem;">
                     🎯 What is NACC?
                 </h3>
                 <div class="help-item">
@@ -649,49 +634,49 @@ class ProfessionalNACCUI(EnterpriseNACCUI):
             </div>
             
             <div class="help-section">
-                <h3 style="color: var(--text-primary); font-size: {self.theme.TYPOGRAPHY['lg']}; margin-bottom: 1rem;">
+                <h3 style="color: var(--text-primary); font-size: {type_lg}; margin-bottom: 1rem;">
                     🛠️ Available Tools
                 </h3>
                 <div class="help-item">
                     <strong>📊 Network Dashboard</strong><br>
-                    <span style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">
+                    <span style="color: var(--text-muted); font-size: {type_sm};">
                         Real-time visualization of all connected nodes with health metrics, CPU/memory/disk usage, and status indicators
                     </span>
                 </div>
                 <div class="help-item">
                     <strong>🖥️ Command Execution</strong><br>
-                    <span style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">
+                    <span style="color: var(--text-muted); font-size: {type_sm};">
                         Execute shell commands on any node through natural language. AI translates your requests into precise commands
                     </span>
                 </div>
                 <div class="help-item">
                     <strong>📁 File Browser</strong><br>
-                    <span style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">
+                    <span style="color: var(--text-muted); font-size: {type_sm};">
                         Browse, view, and manage files across your network infrastructure with visual file explorer
                     </span>
                 </div>
                 <div class="help-item">
                     <strong>🔍 AI Intent Parser</strong><br>
-                    <span style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">
+                    <span style="color: var(--text-muted); font-size: {type_sm};">
                         Understands natural language and converts it to executable commands using Mistral-NeMo AI model
                     </span>
                 </div>
                 <div class="help-item">
                     <strong>🌐 Multi-Node Orchestration</strong><br>
-                    <span style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">
+                    <span style="color: var(--text-muted); font-size: {type_sm};">
                         Manage multiple servers simultaneously with tag-based targeting and parallel execution
                     </span>
                 </div>
                 <div class="help-item">
                     <strong>📝 Session Management</strong><br>
-                    <span style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">
+                    <span style="color: var(--text-muted); font-size: {type_sm};">
                         Context-aware sessions that remember your current node, path, and conversation history
                     </span>
                 </div>
             </div>
             
             <div class="help-section">
-                <h3 style="color: var(--text-primary); font-size: {self.theme.TYPOGRAPHY['lg']}; margin-bottom: 1rem;">
+                <h3 style="color: var(--text-primary); font-size: {type_lg}; margin-bottom: 1rem;">
                     💡 Usage Examples
                 </h3>
                 <div class="help-item">
@@ -712,7 +697,7 @@ class ProfessionalNACCUI(EnterpriseNACCUI):
             </div>
             
             <div class="help-section">
-                <h3 style="color: var(--text-primary); font-size: {self.theme.TYPOGRAPHY['lg']}; margin-bottom: 1rem;">
+                <h3 style="color: var(--text-primary); font-size: {type_lg}; margin-bottom: 1rem;">
                     🏗️ Architecture
                 </h3>
                 <div class="help-item">
@@ -730,48 +715,137 @@ class ProfessionalNACCUI(EnterpriseNACCUI):
             </div>
         </div>
         """
-    
-    def create_real_time_dashboard(self, nodes: List[Dict] = None) -> str:
-        """Create comprehensive real-time status dashboard"""
-        if not nodes:
-            nodes = []
+
+# File viewer; theme placeholders are ProfessionalTheme.FLAT keys, per-call fields are doubled
+_FILE_CONTENT_VIEW_TMPL = """
+        <div style="padding: 2rem; font-family: {type_font_family};">
+            <div style="display: flex; justify-content: between; align-items: center; margin-bottom: 1.5rem;">
+                <div style="display: flex; align-items: center; gap: 1rem;">
+                    <div style="
+                        width: 3rem; 
+                        height: 3rem; 
+                        background: {{lang_color}}; 
+                        border-radius: {radius_lg};
+                        display: flex;
+                        align-items: center;
+                        justify-content: center;
+                        color: white;
+                        font-size: 1.2rem;
+                        font-weight: bold;
+                    ">
+                        📄
+                    </div>
+                    <div>
+                        <h3 style="color: var(--text-primary); font-size: {type_xl}; font-weight: {type_semibold}; margin: 0;">
+                            {{filename}}
+                        </h3>
+                        <div style="color: var(--text-muted); font-size: {type_sm};">
+                            {{lang_name}} • {{chars}} characters • {{lines}} lines
+                        </div>
+                    </div>
+                </div>
+                
+                <div style="display: flex; gap: 0.5rem;">
+                    <button onclick="copyToClipboard()" style="
+                        background: var(--primary); 
+                        color: white; 
+                        border: none; 
+                        border-radius: {radius_md}; 
+                        padding: 0.5rem 1rem; 
+                        cursor: pointer;
+                        transition: all {transition_fast};
+                    " onmouseover="this.style.background='var(--primary-dark)'" onmouseout="this.style.background='var(--primary)'">
+                        📋 Copy
+                    </button>
+                </div>
+            </div>
+            
+            <div style="
+                background: var(--bg_primary); 
+                border: 1px solid var(--border-light); 
+                border-radius: {radius_lg}; 
+                overflow: hidden;
+                box-shadow: {shadow_lg};
+            ">
+                <div style="
+                    background: var(--bg-secondary); 
+                    padding: 0.75rem 1rem; 
+                    border-bottom: 1px solid var(--border-light);
+                    display: flex;
+                    justify-content: space-between;
+                    align-items: center;
+                ">
+                    <span style="color: var(--text-secondary); font-size: {type_sm}; font-weight: {type_medium};">
+                        {{lang_name}} Source
+                    </span>
+                    <span style="color: var(--text-muted); font-size: {type_xs};">
+                        UTF-8
+                    </span>
+                </div>
+                
+                <div style="
+                    background: #1e293b; 
+                    padding: 1.5rem; 
+                    overflow: auto; 
+                    max-height: 500px;
+                    font-family: {type_font_mono};
+                    font-size: {type_sm};
+                    line-height: 1.6;
+                ">
+                    <pre style="margin: 0; color: #e2e8f0; white-space: pre-wrap; word-wrap: break-word;"><code class="language-{{lang_lower}}">{{content}}</code></pre>
+                </div>
+            </div>
+        </div>
         
-        html = f"""
+        """
+
+_FILE_CONTENT_SCRIPT_TMPL = """<script>
+            function copyToClipboard() {{
+                const text = {js_content};
+                navigator.clipboard.writeText(text).then(() => {{
+                    const btn = event.target;
+                    const originalText = btn.textContent;
+                    btn.textContent = '✅ Copied!';
+                    setTimeout(() => {{
+                        btn.textContent = originalText;
+                    }}, 2000);
+                }});
+            }}
+        </script>
+        """
+
+
+# Real-time dashboard fragments; theme placeholders are ProfessionalTheme.FLAT keys,
+# per-call fields are doubled
+_REALTIME_HEADER_TMPL = """
         <div class="status-dashboard">
-            <div style="padding: 2rem; font-family: {self.theme.TYPOGRAPHY['font_family']};">
+            <div style="padding: 2rem; font-family: {type_font_family};">
                 <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 2rem;">
-                    <h2 style="color: var(--text-primary); font-size: {self.theme.TYPOGRAPHY['2xl']}; font-weight: {self.theme.TYPOGRAPHY['bold']}; margin: 0;">
+                    <h2 style="color: var(--text-primary); font-size: {type_2xl}; font-weight: {type_bold}; margin: 0;">
                         🌐 Real-Time Network Dashboard
                     </h2>
                     <div class="status-indicator-animated" style="color: var(--success); display: flex; align-items: center; gap: 0.5rem;">
                         <span style="width: 8px; height: 8px; background: var(--success); border-radius: 50%; animation: pulse 2s infinite;"></span>
-                        <span style="font-weight: {self.theme.TYPOGRAPHY['medium']};">LIVE</span>
+                        <span style="font-weight: {type_medium};">LIVE</span>
                     </div>
                 </div>
-        """
-        
-        # System Overview Metrics
-        online_nodes = len([n for n in nodes if n.get('healthy', False)])
-        total_nodes = len(nodes)
-        health_percentage = (online_nodes / total_nodes * 100) if total_nodes > 0 else 0
         
-        html += f"""
                 <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1.5rem; margin-bottom: 2rem;">
                     <div class="metric-card">
                         <div style="text-align: center;">
-                            <div style="font-size: 2.5rem; font-weight: bold; color: var(--success); margin-bottom: 0.5rem;">{online_nodes}</div>
-                            <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">🟢 Online Nodes</div>
-                            <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['xs']}; margin-top: 0.25rem;">
-                                {health_percentage:.0f}% Health Score
+                            <div style="font-size: 2.5rem; font-weight: bold; color: var(--success); margin-bottom: 0.5rem;">{{online}}</div>
+                            <div style="color: var(--text-muted); font-size: {type_sm};">🟢 Online Nodes</div>
+                            <div style="color: var(--text-muted); font-size: {type_xs}; margin-top: 0.25rem;">
+                                {{health:.0f}}% Health Score
                             </div>
                         </div>
                     </div>
                     
                     <div class="metric-card">
                         <div style="text-align: center;">
-                            <div style="font-size: 2.5rem; font-weight: bold; color: var(--primary); margin-bottom: 0.5rem;">{total_nodes}</div>
-                            <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">🌐 Total Nodes</div>
-                            <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['xs']}; margin-top: 0.25rem;">
+                            <div style="font-size: 2.5rem; font-weight: bold; color: var(--primary); margin-bottom: 0.5rem;">{{total}}</div>
+                            <div style="color: var(--text-muted); font-size: {type_sm};">🌐 Total Nodes</div>
+                            <div style="color: var(--text-muted); font-size: {type_xs}; margin-top: 0.25rem;">
                                 Network Infrastructure
                             </div>
                         </div>
@@ -779,9 +853,9 @@ class ProfessionalNACCUI(EnterpriseNACCUI):
                     
                     <div class="metric-card">
                         <div style="text-align: center;">
-                            <div style="font-size: 2.5rem; font-weight: bold; color: var(--warning); margin-bottom: 0.5rem;">{total_nodes - online_nodes}</div>
-                            <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">🔴 Offline Nodes</div>
-                            <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['xs']}; margin-top: 0.25rem;">
+                            <div style="font-size: 2.5rem; font-weight: bold; color: var(--warning); margin-bottom: 0.5rem;">{{offline}}</div>
+                            <div style="color: var(--text-muted); font-size: {type_sm};">🔴 Offline Nodes</div>
+                            <div style="color: var(--text-muted); font-size: {type_xs}; margin-top: 0.25rem;">
                                 Requires Attention
                             </div>
                         </div>
@@ -790,146 +864,210 @@ class ProfessionalNACCUI(EnterpriseNACCUI):
                     <div class="metric-card">
                         <div style="text-align: center;">
                             <div style="font-size: 2.5rem; font-weight: bold; color: var(--info); margin-bottom: 0.5rem;">99.9%</div>
-                            <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">⚡ Uptime</div>
-                            <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['xs']}; margin-top: 0.25rem;">
+                            <div style="color: var(--text-muted); font-size: {type_sm};">⚡ Uptime</div>
+                            <div style="color: var(--text-muted); font-size: {type_xs}; margin-top: 0.25rem;">
                                 Last 30 Days
                             </div>
                         </div>
                     </div>
                 </div>
         """
-        
-        # Individual Node Details
-        if nodes:
-            html += """
-                <h3 style="color: var(--text-primary); font-size: {self.theme.TYPOGRAPHY['xl']}; font-weight: {self.theme.TYPOGRAPHY['semibold']}; margin-bottom: 1rem;">
+
+_REALTIME_DETAILS_TMPL = """
+                <h3 style="color: var(--text-primary); font-size: {type_xl}; font-weight: {type_semibold}; margin-bottom: 1rem;">
                     🖥️ Node Details
                 </h3>
             """
-            
-            for node in nodes:
-                node_id = node.get('node_id') or node.get('id', 'Unknown')
-                is_healthy = node.get('healthy', False)
-                status_color = 'var(--success)' if is_healthy else 'var(--error)'
-                status_text = 'ONLINE' if is_healthy else 'OFFLINE'
-                status_icon = '🟢' if is_healthy else '🔴'
-                metrics = node.get('metrics', {})
-                
-                # Calculate resource utilization
-                cpu = metrics.get('cpu_percent', 0)
-                memory = metrics.get('memory_percent', 0)
-                disk = metrics.get('disk_percent', 0)
-                
-                # Determine health status
-                if cpu > 80 or memory > 85:
-                    health_status = 'warning'
-                    health_color = 'var(--warning)'
-                    health_icon = '⚠️'
-                elif not is_healthy:
-                    health_status = 'error'
-                    health_color = 'var(--error)'
-                    health_icon = '🔴'
-                else:
-                    health_status = 'good'
-                    health_color = 'var(--success)'
-                    health_icon = '✅'
-                
-                html += f"""
+
+_REALTIME_NODE_TMPL = """
                 <div class="metric-card" style="margin-bottom: 1.5rem;">
                     <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 1rem;">
                         <div style="display: flex; align-items: center; gap: 1rem;">
                             <div style="font-size: 1.5rem;">🖥️</div>
                             <div>
-                                <h4 style="margin: 0; color: var(--text-primary); font-size: {self.theme.TYPOGRAPHY['lg']}; font-weight: {self.theme.TYPOGRAPHY['semibold']};">
-                                    {node_id}
+                                <h4 style="margin: 0; color: var(--text-primary); font-size: {type_lg}; font-weight: {type_semibold};">
+                                    {{node_id}}
                                 </h4>
-                                <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">
-                                    {', '.join(node.get('tags', []))}
+                                <div style="color: var(--text-muted); font-size: {type_sm};">
+                                    {{tags}}
                                 </div>
                             </div>
                         </div>
                         <div style="text-align: right;">
                             <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
-                                <span style="font-size: 1.2rem;">{health_icon}</span>
-                                <span style="color: {health_color}; font-weight: {self.theme.TYPOGRAPHY['semibold']};">{health_status.upper()}</span>
+                                <span style="font-size: 1.2rem;">{{health_icon}}</span>
+                                <span style="color: {{health_color}}; font-weight: {type_semibold};">{{health_label}}</span>
                             </div>
                             <span style="
-                                background: {status_color}; 
+                                background: {{status_color}}; 
                                 color: white; 
                                 padding: 0.25rem 0.75rem; 
-                                border-radius: {self.theme.RADIUS['full']}; 
-                                font-size: {self.theme.TYPOGRAPHY['xs']}; 
-                                font-weight: {self.theme.TYPOGRAPHY['semibold']};
+                                border-radius: {radius_full}; 
+                                font-size: {type_xs}; 
+                                font-weight: {type_semibold};
                                 text-transform: uppercase;
                             ">
-                                {status_text}
+                                {{status_text}}
                             </span>
                         </div>
                     </div>
                     
                     <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin-top: 1rem;">
                         <div>
-                            <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['xs']}; margin-bottom: 0.25rem;">💻 CPU</div>
+                            <div style="color: var(--text-muted); font-size: {type_xs}; margin-bottom: 0.25rem;">💻 CPU</div>
                             <div style="display: flex; align-items: center; gap: 0.5rem;">
-                                <div style="flex: 1; background: var(--bg-tertiary); border-radius: {self.theme.RADIUS['sm']}; height: 6px; overflow: hidden;">
+                                <div style="flex: 1; background: var(--bg-tertiary); border-radius: {radius_sm}; height: 6px; overflow: hidden;">
                                     <div style="
-                                        width: {cpu}%; 
+                                        width: {{cpu}}%; 
                                         height: 100%; 
-                                        background: {'var(--error)' if cpu > 80 else 'var(--warning)' if cpu > 60 else 'var(--success)'}; 
-                                        transition: width {self.theme.TRANSITIONS['normal']};
+                                        background: {{cpu_color}}; 
+                                        transition: width {transition_normal};
                                     "></div>
                                 </div>
-                                <span style="color: var(--text-secondary); font-size: {self.theme.TYPOGRAPHY['sm']}; font-weight: {self.theme.TYPOGRAPHY['medium']};">{cpu:.1f}%</span>
+                                <span style="color: var(--text-secondary); font-size: {type_sm}; font-weight: {type_medium};">{{cpu:.1f}}%</span>
                             </div>
                         </div>
                         
                         <div>
-                            <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['xs']}; margin-bottom: 0.25rem;">💾 Memory</div>
+                            <div style="color: var(--text-muted); font-size: {type_xs}; margin-bottom: 0.25rem;">💾 Memory</div>
                             <div style="display: flex; align-items: center; gap: 0.5rem;">
-                                <div style="flex: 1; background: var(--bg-tertiary); border-radius: {self.theme.RADIUS['sm']}; height: 6px; overflow: hidden;">
+                                <div style="flex: 1; background: var(--bg-tertiary); border-radius: {radius_sm}; height: 6px; overflow: hidden;">
                                     <div style="
-                                        width: {memory}%; 
+                                        width: {{memory}}%; 
                                         height: 100%; 
-                                        background: {'var(--error)' if memory > 85 else 'var(--warning)' if memory > 70 else 'var(--success)'}; 
-                                        transition: width {self.theme.TRANSITIONS['normal']};
+                                        background: {{memory_color}}; 
+                                        transition: width {transition_normal};
                                     "></div>
                                 </div>
-                                <span style="color: var(--text-secondary); font-size: {self.theme.TYPOGRAPHY['sm']}; font-weight: {self.theme.TYPOGRAPHY['medium']};">{memory:.1f}%</span>
+                                <span style="color: var(--text-secondary); font-size: {type_sm}; font-weight: {type_medium};">{{memory:.1f}}%</span>
                             </div>
                         </div>
                         
                         <div>
-                            <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['xs']}; margin-bottom: 0.25rem;">💽 Disk</div>
+                            <div style="color: var(--text-muted); font-size: {type_xs}; margin-bottom: 0.25rem;">💽 Disk</div>
                             <div style="display: flex; align-items: center; gap: 0.5rem;">
-                                <div style="flex: 1; background: var(--bg-tertiary); border-radius: {self.theme.RADIUS['sm']}; height: 6px; overflow: hidden;">
+                                <div style="flex: 1; background: var(--bg-tertiary); border-radius: {radius_sm}; height: 6px; overflow: hidden;">
                                     <div style="
-                                        width: {disk}%; 
+                                        width: {{disk}}%; 
                                         height: 100%; 
-                                        background: {'var(--error)' if disk > 90 else 'var(--warning)' if disk > 75 else 'var(--success)'}; 
-                                        transition: width {self.theme.TRANSITIONS['normal']};
+                                        background: {{disk_color}}; 
+                                        transition: width {transition_normal};
                                     "></div>
                                 </div>
-                                <span style="color: var(--text-secondary); font-size: {self.theme.TYPOGRAPHY['sm']}; font-weight: {self.theme.TYPOGRAPHY['medium']};">{disk:.1f}%</span>
+                                <span style="color: var(--text-secondary); font-size: {type_sm}; font-weight: {type_medium};">{{disk:.1f}}%</span>
                             </div>
                         </div>
                     </div>
                 </div>
                 """
-        else:
-            html += """
+
+_REALTIME_EMPTY = """
                 <div style="text-align: center; padding: 3rem; color: var(--text-muted);">
                     <div style="font-size: 3rem; margin-bottom: 1rem;">📡</div>
                     <h3 style="color: var(--text-secondary); margin-bottom: 0.5rem;">No Nodes Connected</h3>
                     <p>Connect your first node to start monitoring your network infrastructure.</p>
                 </div>
             """
-        
-        html += """
+
+_REALTIME_END = """
             </div>
         </div>
         """
+
+
+@lru_cache(maxsize=STATUS_DASHBOARD_CACHE_SIZE)
+def _realtime_header(theme: type, online: int, total: int) -> str:
+    """Dashboard header and summary tiles for a theme class and node counts"""
+    return themed(_REALTIME_HEADER_TMPL, theme).format(
+        online=online,
+        total=total,
+        offline=total - online,
+        health=(online / total * 100) if total > 0 else 0,
+    )
+
+
+@lru_cache(maxsize=None)
+def _empty_realtime_dashboard(theme: type) -> str:
+    """Whole dashboard for when no nodes are connected, for a theme class"""
+    return _realtime_header(theme, 0, 0) + _REALTIME_EMPTY + _REALTIME_END
+
+
+class ProfessionalNACCUI(EnterpriseNACCUI):
+    """Enhanced UI with professional features, dark mode, and enterprise capabilities"""
+    
+    theme = ProfessionalTheme
+    
+    def __init__(self, session_store: Optional[SessionStore] = None):
+        super().__init__(session_store)
+        self.current_theme = "dark"  # Default to dark mode like screenshot
+        self.animation_enabled = True
+        self.professional_mode = True
+        # Static panels, rendered once instead of on every page build
+        self._header_html = themed(_PROFESSIONAL_HEADER_TMPL, self.theme) + _THEME_TOGGLE_HTML
+        self._help_html = themed(_HELP_SYSTEM_TMPL, self.theme)
         
-        return html
+    def get_comprehensive_css(self) -> str:
+        """Generate comprehensive CSS with dark mode support and professional features"""
+        return _comprehensive_css(self.theme)
+    
+    def create_theme_toggle(self) -> str:
+        """Create theme toggle button"""
+        return _THEME_TOGGLE_HTML
+    
+    def create_professional_header(self) -> str:
+        """Create enhanced professional header with navigation"""
+        return self._header_html
+    
+    def create_help_system(self) -> str:
+        """Create comprehensive help system"""
+        return self._help_html
+    
+    def create_real_time_dashboard(self, nodes: List[Dict] = None) -> str:
+        """Create comprehensive real-time status dashboard"""
+        if not nodes:
+            return _empty_realtime_dashboard(self.theme)
+        
+        # System Overview Metrics; the header only changes with the counts
+        online_nodes = sum(1 for n in nodes if n.get('healthy', False))
+        parts = [_realtime_header(self.theme, online_nodes, len(nodes)), themed(_REALTIME_DETAILS_TMPL, self.theme)]
+        
+        # Individual Node Details
+        format_card = themed(_REALTIME_NODE_TMPL, self.theme).format
+        for node in nodes:
+            is_healthy = node.get('healthy', False)
+            metrics = node.get('metrics', {})
+            
+            # Calculate resource utilization
+            cpu = metrics.get('cpu_percent', 0)
+            memory = metrics.get('memory_percent', 0)
+            disk = metrics.get('disk_percent', 0)
+            
+            # Determine health status
+            if cpu > 80 or memory > 85:
+                health_label, health_color, health_icon = 'WARNING', 'var(--warning)', '⚠️'
+            elif not is_healthy:
+                health_label, health_color, health_icon = 'ERROR', 'var(--error)', '🔴'
+            else:
+                health_label, health_color, health_icon = 'GOOD', 'var(--success)', '✅'
+            
+            parts.append(format_card(
+                node_id=escape(str(node.get('node_id') or node.get('id', 'Unknown'))),
+                tags=escape(', '.join(node.get('tags', []))),
+                health_label=health_label,
+                health_color=health_color,
+                health_icon=health_icon,
+                status_color='var(--success)' if is_healthy else 'var(--error)',
+                status_text='ONLINE' if is_healthy else 'OFFLINE',
+                cpu=cpu,
+                memory=memory,
+                disk=disk,
+                cpu_color='var(--error)' if cpu > 80 else 'var(--warning)' if cpu > 60 else 'var(--success)',
+                memory_color='var(--error)' if memory > 85 else 'var(--warning)' if memory > 70 else 'var(--success)',
+                disk_color='var(--error)' if disk > 90 else 'var(--warning)' if disk > 75 else 'var(--success)',
+            ))
+        
+        parts.append(_REALTIME_END)
+        return "".join(parts)
     
     def create_enhanced_file_content_view(self, filename: str, content: str) -> str:
         """Create enhanced file content viewer with syntax highlighting"""
@@ -952,113 +1090,29 @@ class ProfessionalNACCUI(EnterpriseNACCUI):
         
         lang_name, lang_color = lang_map.get(ext, ("Text", self.theme.COLORS['secondary']))
         
-        html = f"""
-        <div style="padding: 2rem; font-family: {self.theme.TYPOGRAPHY['font_family']};">
-            <div style="display: flex; justify-content: between; align-items: center; margin-bottom: 1.5rem;">
-                <div style="display: flex; align-items: center; gap: 1rem;">
-                    <div style="
-                        width: 3rem; 
-                        height: 3rem; 
-                        background: {lang_color}; 
-                        border-radius: {self.theme.RADIUS['lg']};
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        color: white;
-                        font-size: 1.2rem;
-                        font-weight: bold;
-                    ">
-                        📄
-                    </div>
-                    <div>
-                        <h3 style="color: var(--text-primary); font-size: {self.theme.TYPOGRAPHY['xl']}; font-weight: {self.theme.TYPOGRAPHY['semibold']}; margin: 0;">
-                            {filename}
-                        </h3>
-                        <div style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['sm']};">
-                            {lang_name} • {len(content)} characters • {content.count('\\n')} lines
-                        </div>
-                    </div>
-                </div>
-                
-                <div style="display: flex; gap: 0.5rem;">
-                    <button onclick="copyToClipboard()" style="
-                        background: var(--primary); 
-                        color: white; 
-                        border: none; 
-                        border-radius: {self.theme.RADIUS['md']}; 
-                        padding: 0.5rem 1rem; 
-                        cursor: pointer;
-                        transition: all {self.theme.TRANSITIONS['fast']};
-                    " onmouseover="this.style.background='var(--primary-dark)'" onmouseout="this.style.background='var(--primary)'">
-                        📋 Copy
-                    </button>
-                </div>
-            </div>
-            
-            <div style="
-                background: var(--bg_primary); 
-                border: 1px solid var(--border-light); 
-                border-radius: {self.theme.RADIUS['lg']}; 
-                overflow: hidden;
-                box-shadow: {self.theme.SHADOWS['lg']};
-            ">
-                <div style="
-                    background: var(--bg-secondary); 
-                    padding: 0.75rem 1rem; 
-                    border-bottom: 1px solid var(--border-light);
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                ">
-                    <span style="color: var(--text-secondary); font-size: {self.theme.TYPOGRAPHY['sm']}; font-weight: {self.theme.TYPOGRAPHY['medium']};">
-                        {lang_name} Source
-                    </span>
-                    <span style="color: var(--text-muted); font-size: {self.theme.TYPOGRAPHY['xs']};">
-                        UTF-8
-                    </span>
-                </div>
-                
-                <div style="
-                    background: #1e293b; 
-                    padding: 1.5rem; 
-                    overflow: auto; 
-                    max-height: 500px;
-                    font-family: {self.theme.TYPOGRAPHY['font_mono']};
-                    font-size: {self.theme.TYPOGRAPHY['sm']};
-                    line-height: 1.6;
-                ">
-                    <pre style="margin: 0; color: #e2e8f0; white-space: pre-wrap; word-wrap: break-word;"><code class="language-{lang_name.lower()}">{content}</code></pre>
-                </div>
-            </div>
-        </div>
-        
-        <script>
-            function copyToClipboard() {{
-                const text = `{content.replace('`', '\\`').replace('$', '\\$')}`;
-                navigator.clipboard.writeText(text).then(() => {{
-                    const btn = event.target;
-                    const originalText = btn.textContent;
-                    btn.textContent = '✅ Copied!';
-                    setTimeout(() => {{
-                        btn.textContent = originalText;
-                    }}, 2000);
-                }});
-            }}
-        </script>
-        """
+        html = themed(_FILE_CONTENT_VIEW_TMPL, self.theme).format(
+            filename=escape(filename),
+            lang_name=lang_name,
+            lang_color=lang_color,
+            lang_lower=lang_name.lower(),
+            chars=len(content),
+            lines=content.count('\\n'),
+            content=escape(content),
+        ) + _FILE_CONTENT_SCRIPT_TMPL.format(
+            # A JSON string is a valid JS literal; "</" is split so the content can't close the <script>
+            js_content=json.dumps(content).replace("</", "<\\/")
+        )
         return html
 
 
-def create_professional_ui():
-    """Create the professional-grade UI interface"""
-    nacc = ProfessionalNACCUI()
+def create_professional_ui(stylesheet_href: Optional[str] = None):
+    """Create the professional-grade UI interface
     
-    # Create the interface with comprehensive styling
-    with gr.Blocks(
-        css=nacc.get_comprehensive_css(), 
-        title="NACC Enterprise AI - Professional Network Orchestration",
-        theme=gr.themes.Soft(primary_hue="blue", neutral_hue="slate"),
-        head="""
+    With stylesheet_href the comprehensive CSS is linked from that URL instead
+    of being inlined into every page (see create_professional_app).
+    """
+    nacc = ProfessionalNACCUI()
+    head = """
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <meta name="description" content="NACC Enterprise AI - Professional Network Orchestration & Command Control Platform">
         <link rel="preconnect" href="https://fonts.googleapis.com">
@@ -1066,6 +1120,15 @@ def create_professional_ui():
         <meta name="theme-color" content="#2563eb">
         <link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>🤖</text></svg>">
         """
+    if stylesheet_href:
+        head += f'<link rel="stylesheet" href="{stylesheet_href}">\n'
+    
+    # Create the interface with comprehensive styling
+    with gr.Blocks(
+        css=None if stylesheet_href else nacc.get_comprehensive_css(), 
+        title="NACC Enterprise AI - Professional Network Orchestration",
+        theme=gr.themes.Soft(primary_hue="blue", neutral_hue="slate"),
+        head=head
     ) as interface:
         
         # Professional Header
@@ -1108,7 +1171,7 @@ def create_professional_ui():
                 # Enhanced Right Panel with tabs
                 with gr.Tabs():
                     with gr.TabItem("📊 Status & Output", id="dashboard"):
-                        right_panel = gr.HTML(nacc.create_welcome_panel())
+                        right_panel = gr.HTML(nacc._welcome_panel_html)
                     
                     with gr.TabItem("🔍 File Browser", id="files"):
                         file_panel = gr.HTML(nacc.create_enhanced_file_browser([], "/home"))
@@ -1164,7 +1227,7 @@ def create_professional_ui():
         def respond(message, chat_history, session_id):
             """Handle user message with professional UI enhancements"""
             if not message.strip():
-                return chat_history, nacc.create_welcome_panel(), nacc.create_loading_state("Ready for enterprise commands!"), 
+                return chat_history, nacc._welcome_panel_html, nacc.create_loading_state("Ready for enterprise commands!"), 
             
             # Process with enhanced message handling
             updated_history, right_content, tool_log_content, session_info = nacc.process_message_with_enhanced_ui(
@@ -1177,8 +1240,8 @@ def create_professional_ui():
             Session: {session.session_id[:8]}... | 
             Node: {session.current_node} | 
             Path: {session.current_path} | 
-            Tools: {len(session.tool_execution_log)} | 
-            Messages: {len(session.conversation_history)} | 
+            Tools: {session.tool_count} | 
+            Messages: {session.message_count} | 
             Theme: {nacc.current_theme.title()}
             """
             
@@ -1190,7 +1253,7 @@ def create_professional_ui():
             from datetime import datetime
             new_session_id = hashlib.md5(str(datetime.now().timestamp()).encode()).hexdigest()[:8]
             
-            return [], nacc.create_welcome_panel(), nacc.create_loading_state("🚀 New enterprise session started! Professional AI mode activated.")
+            return [], nacc._welcome_panel_html, nacc.create_loading_state("🚀 New enterprise session started! Professional AI mode activated.")
         
         # Enhanced Event Handlers
         submit.click(
@@ -1228,17 +1291,22 @@ def create_professional_ui():
     return interface
 
 
+def create_professional_app():
+    """FastAPI app serving the professional UI, with its CSS as an immutable, content-hashed asset"""
+    return css_asset_app(_comprehensive_css(ProfessionalNACCUI.theme), "professional", create_professional_ui)
+
+
 def main():
-    """Main entry point for the professional UI"""
-    ui = create_professional_ui()
-    ui.launch(
-        server_name="0.0.0.0",
-        server_port=7860,
-        share=False,
-        show_error=True,
-        favicon_path=None,
-        debug=True
-    )
+    """Main entry point for the professional UI
+    
+    Serves create_professional_app() with uvicorn rather than ui.launch(debug=True);
+    uvicorn.run already blocks, and errors are logged by its server.
+    """
+    logging.basicConfig(level=logging.INFO)
+    enable_session_persistence()
+    import uvicorn
+    
+    uvicorn.run(create_professional_app(), host="0.0.0.0", port=7860)
 
 if __name__ == "__main__":
     main()
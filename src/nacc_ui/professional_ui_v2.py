@@ -15,21 +15,20 @@ import logging
 # Import the existing components
 from .ai_intent_parser import AIIntentParser
 from .conversational_ui import NACCConversationUI, SessionState, get_nacc_workspace
+from .session_store import SessionStore, enable_session_persistence
 from pathlib import Path
 
 # Orchestrator URL
 ORCHESTRATOR_URL = os.getenv("NACC_ORCHESTRATOR_URL", "http://127.0.0.1:8888")
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 class ModernNACCUI(NACCConversationUI):
     """Modern redesigned UI with clean dark theme"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session_store: Optional[SessionStore] = None):
+        super().__init__(session_store)
         
     def parse_and_enhance_response(self, result: Dict, message: str) -> str:
         """Parse orchestrator response and enhance with rich formatting"""
@@ -107,6 +106,7 @@ class ModernNACCUI(NACCConversationUI):
         
         # Add to history
         history = history + [{"role": "user", "content": message}, {"role": "assistant", "content": bot_response}]
+        self.save_session(session)
         
         # Update views dynamically based on current session state
         dashboard = self.get_dashboard_view(session)
@@ -860,6 +860,7 @@ def create_professional_ui_v2():
         def go_to_path(path, sid):
             session = nacc.get_or_create_session(sid)
             session.current_path = path
+            nacc.save_session(session)
             return nacc.list_files_view(path, session.current_node)
         
         def go_to_parent(path, sid):
@@ -867,6 +868,7 @@ def create_professional_ui_v2():
             session = nacc.get_or_create_session(sid)
             parent = os.path.dirname(path) if path != "/" else "/"
             session.current_path = parent
+            nacc.save_session(session)
             return parent, nacc.list_files_view(parent, session.current_node)
         
         up_btn.click(
@@ -950,6 +952,8 @@ def create_professional_ui_v2():
 
 def main():
     """Main entry point for the professional UI v2"""
+    logging.basicConfig(level=logging.INFO)
+    enable_session_persistence()
     ui = create_professional_ui_v2()
     ui.launch(
         server_name="0.0.0.0",
@@ -0,0 +1,75 @@
+"""SQLite persistence for conversational UI sessions."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Default session file; entry points opt in with enable_session_persistence()
+SESSION_DB_PATH = Path.home() / ".nacc" / "ui-sessions.db"
+
+
+class SessionStore:
+    """Key/value store of serialized sessions backed by a WAL-mode SQLite file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "session_id TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def load(self, session_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, session_id: str, data: dict[str, Any]) -> None:
+        blob = json.dumps(data, separators=(",", ":"), default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, data, updated_at) VALUES (?, ?, ?)",
+                (session_id, blob, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["SessionStore"]
+
+
+def enable_session_persistence() -> None:
+    """Persist sessions to SESSION_DB_PATH unless NACC_SESSION_DB already names a file; for entry points"""
+    os.environ.setdefault("NACC_SESSION_DB", str(SESSION_DB_PATH))
+
+
+def default_session_store() -> SessionStore | None:
+    """SessionStore at $NACC_SESSION_DB, or None (sessions live in memory only) when it isn't set"""
+    path = os.getenv("NACC_SESSION_DB")
+    if not path:
+        return None
+    try:
+        return SessionStore(Path(path))
+    except Exception as e:
+        logger.warning(f"Session persistence disabled: {e}")
+        return None
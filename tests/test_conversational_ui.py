@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import pytest
+
+from nacc_ui.ai_intent_parser import ExecutionPlan, ToolCall
+from nacc_ui.conversational_ui import NACCConversationUI, SessionState, _classify_intent
+
+LS_OUTPUT = """total 24
+drwxr-xr-x  5 dev  staff   160 Oct 16 12:00 .
+drwxr-xr-x 12 dev  staff   384 Oct 16 11:58 ..
+-rw-r--r--  1 dev  staff   120 Oct 16 12:00 my notes.txt
+drwxr-xr-x  2 dev  staff    64 Oct 16 12:00 Project Files
+lrwxr-xr-x  1 dev  staff    11 Oct 16 12:00 latest -> releases/v2
+-rw-r--r--  1 dev  staff  2048 Sep  3  2025 report.pdf
+"""
+
+
+@pytest.fixture
+def ui(monkeypatch) -> NACCConversationUI:
+    monkeypatch.delenv("NACC_SESSION_DB", raising=False)
+    return NACCConversationUI()
+
+
+def test_parse_ls_skips_total_and_keeps_names_with_spaces(ui: NACCConversationUI):
+    assert ui._parse_ls(LS_OUTPUT) == [
+        "./",
+        "../",
+        "my notes.txt",
+        "Project Files/",
+        "latest -> releases/v2",
+        "report.pdf",
+    ]
+
+
+def test_parse_ls_handles_crlf_output(ui: NACCConversationUI):
+    assert ui._parse_ls(LS_OUTPUT.replace("\n", "\r\n"))[2:4] == ["my notes.txt", "Project Files/"]
+
+
+def test_parse_ls_keeps_single_file_listing(ui: NACCConversationUI):
+    # `ls -la <file>` prints no "total N" header
+    assert ui._parse_ls("-rw-r--r--  1 dev  staff  5 Oct 16 12:00 only.txt\n") == ["only.txt"]
+
+
+def _classify_intent_elif(message_lower: str):
+    """The original if/elif router the keyword table replaced"""
+    if any(word in message_lower for word in ["show files", "list files", "files on", "what files"]):
+        return "list_files"
+    elif any(word in message_lower for word in ["navigate to", "go to", "open", "show me the", "file content", "show content"]):
+        return "navigate"
+    elif any(word in message_lower for word in ["share", "transfer", "copy", "send", "sync"]):
+        return "sync_files"
+    elif any(word in message_lower for word in ["show nodes", "list nodes", "nodes of", "what nodes"]):
+        return "list_nodes"
+    elif any(word in message_lower for word in ["run", "execute", "command"]):
+        return "execute_command"
+    elif any(word in message_lower for word in ["add", "modify", "change", "edit", "update", "write"]):
+        return "write_file"
+    return None
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("list files on the server", "list_files"),
+        ("show files and sync them", "list_files"),
+        ("open the file content", "navigate"),
+        ("go to /srv and copy logs", "navigate"),
+        ("run a command to copy the logs", "sync_files"),
+        ("show nodes then send a report", "sync_files"),
+        ("what nodes can run jobs", "list_nodes"),
+        ("execute the update script", "execute_command"),
+        ("write a new readme", "write_file"),
+        ("hello there", None),
+    ],
+)
+def test_classify_intent_keeps_elif_priority(message: str, expected):
+    assert _classify_intent(message) == expected == _classify_intent_elif(message)
+
+
+def test_context_window_prefix_is_stable_until_cap():
+    session = SessionState("abcdef123456")
+    previous: list = []
+    for index in range(session.window_cap):
+        session.add_message("user", f"message {index}")
+        window = session.get_context_window()
+        assert window[: len(previous)] == previous
+        assert len(window) == index + 1
+        previous = window
+
+    session.add_message("user", "overflow")
+    window = session.get_context_window()
+    assert len(window) == session.context_window_size
+    assert window[0]["content"] == f"message {session.window_cap + 1 - session.context_window_size}"
+    assert window[-1]["content"] == "overflow"
+
+
+def test_fetch_available_nodes_reads_node_list(ui: NACCConversationUI, monkeypatch):
+    calls = []
+
+    def fake_api(endpoint, method="GET", data=None):
+        calls.append(endpoint)
+        return [{"node_id": "kali-vm", "tags": ["lab"], "healthy": True}]
+
+    monkeypatch.setattr(ui, "call_orchestrator_api", fake_api)
+    nodes = ui.fetch_available_nodes()
+    assert [node["node_id"] for node in nodes] == ["kali-vm"]
+    assert nodes[0]["tags"] == ["lab"]
+    assert ui.fetch_available_nodes() == nodes
+    assert calls == ["/nodes"]
+
+
+def test_fetch_available_nodes_does_not_cache_errors(ui: NACCConversationUI, monkeypatch):
+    responses = iter([{"error": "connection refused"}, [{"node_id": "kali-vm"}]])
+    monkeypatch.setattr(ui, "call_orchestrator_api", lambda endpoint, method="GET", data=None: next(responses))
+    assert ui.fetch_available_nodes() == []
+    assert [node["node_id"] for node in ui.fetch_available_nodes()] == ["kali-vm"]
+
+
+def test_iter_plan_yields_each_tool_after_its_round_trip(ui: NACCConversationUI, monkeypatch):
+    calls = []
+
+    def fake_batch(commands):
+        calls.append(("batch", len(commands)))
+        return [{"results": [{"stdout": LS_OUTPUT, "exit_code": 0}]} for _ in commands]
+
+    def fake_write(filepath, content):
+        calls.append(("write", filepath))
+        return {"success": True, "path": filepath}
+
+    monkeypatch.setattr(ui, "tool_batch_execute", fake_batch)
+    monkeypatch.setattr(ui, "tool_write_file", fake_write)
+    session = ui.get_or_create_session("plan")
+    plan = ExecutionPlan(
+        intent="list_files",
+        tools=[
+            ToolCall("list_files", {"path": "/srv"}, "look", 1),
+            ToolCall("list_files", {"path": "/tmp"}, "look", 2),
+            ToolCall("write_file", {"filepath": "/tmp/a.txt", "content": "hi"}, "save", 3),
+        ],
+    )
+
+    steps = ui._iter_plan(plan, session, "log\n")
+    seen = []
+    for tool_name, right_panel, tool_log in steps:
+        seen.append((tool_name, list(calls)))
+        assert right_panel is not None and tool_log == "log\n"
+    assert seen == [
+        ("list_files", [("batch", 2)]),
+        ("list_files", [("batch", 2)]),
+        ("write_file", [("batch", 2), ("write", "/tmp/a.txt")]),
+    ]
+    assert session.tool_count == 3
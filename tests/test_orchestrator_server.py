@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from nacc_orchestrator.config import OrchestratorConfig
+from nacc_orchestrator.server import create_app
+from nacc_orchestrator.service import OrchestratorService
+
+
+def _build_client(root_dir: Path) -> TestClient:
+    config = OrchestratorConfig(
+        orchestrator_id="tests",
+        nodes=[
+            {
+                "node_id": "local-dev",
+                "transport": "local",
+                "root_dir": str(root_dir),
+                "allowed_commands": ["echo"],
+                "tags": ["dev"],
+            }
+        ],
+        agent_backend={"kind": "local-heuristic"},
+        audit={"path": str(root_dir / "audit.log")},
+    )
+    return TestClient(create_app(OrchestratorService(config)))
+
+
+def test_batch_rejects_empty_command_list(tmp_path: Path):
+    client = _build_client(tmp_path)
+    response = client.post("/commands/batch", json={"commands": []})
+    assert response.status_code == 422
+
+
+def test_batch_returns_per_command_errors_inline(tmp_path: Path):
+    client = _build_client(tmp_path)
+    response = client.post(
+        "/commands/batch",
+        json={
+            "commands": [
+                {"description": "allowed", "command": ["/bin/echo", "one"]},
+                {"description": "not allowed", "command": ["/bin/ls"]},
+                {"description": "allowed again", "command": ["/bin/echo", "three"]},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 3
+    assert results[0]["results"][0]["stdout"].strip() == "one"
+    assert "not allowed" in results[1]["error"]
+    assert results[2]["results"][0]["stdout"].strip() == "three"
+
+
+def test_write_file_outside_node_root_is_a_bad_request(tmp_path: Path):
+    root_dir = tmp_path / "root"
+    root_dir.mkdir()
+    client = _build_client(root_dir)
+    response = client.post("/files/write", json={"path": "../escape.txt", "content": "nope"})
+    assert response.status_code == 400
+    assert not (tmp_path / "escape.txt").exists()
+
+
+def test_write_file_inside_node_root(tmp_path: Path):
+    client = _build_client(tmp_path)
+    response = client.post("/files/write", json={"path": "notes/hello.txt", "content": "hi"})
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    assert (tmp_path / "notes" / "hello.txt").read_text(encoding="utf-8") == "hi"
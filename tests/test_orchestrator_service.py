@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
+import pytest
+
 from nacc_orchestrator.config import OrchestratorConfig
 from nacc_orchestrator.service import OrchestratorService
 
@@ -19,6 +22,7 @@ def _build_config(root_dir: Path) -> OrchestratorConfig:
             }
         ],
         agent_backend={"kind": "local-heuristic"},
+        audit={"path": str(root_dir / "audit.log")},
     )
 
 
@@ -53,3 +57,105 @@ def test_agent_probe(tmp_path: Path):
     result = service.check_agent_backend("health check")
     assert result["message"] == "health check"
     assert "response" in result
+
+
+def test_service_execute_batch(tmp_path: Path):
+    root_dir = tmp_path / "root"
+    root_dir.mkdir()
+    service = OrchestratorService(_build_config(root_dir))
+    responses = service.execute_batch(
+        [
+            {"description": "first", "command": ["/bin/echo", "one"], "preferred_tags": ["dev"]},
+            {"description": "second", "command": ["/bin/echo", "two"], "preferred_tags": ["dev"]},
+        ]
+    )
+    assert len(responses) == 2
+    assert [response["results"][0]["stdout"].strip() for response in responses] == ["one", "two"]
+
+
+def test_service_execute_batch_propagates_unexpected_errors(tmp_path: Path):
+    root_dir = tmp_path / "root"
+    root_dir.mkdir()
+    service = OrchestratorService(_build_config(root_dir))
+    with pytest.raises(TypeError):
+        service.execute_batch([{"description": "bad spec", "command": ["/bin/echo"], "bogus": 1}])
+
+
+def test_service_write_file(tmp_path: Path):
+    root_dir = tmp_path / "root"
+    root_dir.mkdir()
+    service = OrchestratorService(_build_config(root_dir))
+    content = "it's \"quoted\" $HOME `whoami`\n"
+    response = service.write_file("notes/quote.txt", content, preferred_tags=["dev"])
+    assert response["success"] is True
+    assert (root_dir / "notes" / "quote.txt").read_text(encoding="utf-8") == content
+
+
+def _build_multi_node_config(tmp_path: Path, node_ids: list[str]) -> OrchestratorConfig:
+    nodes = []
+    for node_id in node_ids:
+        root_dir = tmp_path / node_id
+        root_dir.mkdir()
+        nodes.append(
+            {
+                "node_id": node_id,
+                "transport": "local",
+                "root_dir": str(root_dir),
+                "allowed_commands": ["echo"],
+                "tags": ["dev"],
+            }
+        )
+    return OrchestratorConfig(
+        orchestrator_id="tests",
+        nodes=nodes,
+        agent_backend={"kind": "local-heuristic"},
+        audit={"path": str(tmp_path / "audit.log")},
+    )
+
+
+def _slow_node(client, method_name: str, delay: float, check=None):
+    """Delay one client method so that node answers after the others"""
+    original = getattr(client, method_name)
+
+    def slow(*args, **kwargs):
+        if check is not None:
+            check()
+        time.sleep(delay)
+        return original(*args, **kwargs)
+
+    setattr(client, method_name, slow)
+
+
+def test_refresh_all_keeps_node_order_without_holding_the_lock(tmp_path: Path):
+    node_ids = ["node-a", "node-b", "node-c"]
+    service = OrchestratorService(_build_multi_node_config(tmp_path, node_ids))
+    registry = service.registry
+    lock_free = []
+
+    def check_lock():
+        acquired = registry._lock.acquire(blocking=False)
+        lock_free.append(acquired)
+        if acquired:
+            registry._lock.release()
+
+    _slow_node(registry.get_client("node-a"), "get_node_info", 0.1, check_lock)
+    statuses = registry.refresh_all()
+    assert [status.node_id for status in statuses] == node_ids
+    assert lock_free == [True]
+
+
+def test_multi_node_execute_command_keeps_node_order(tmp_path: Path):
+    node_ids = ["node-a", "node-b", "node-c"]
+    service = OrchestratorService(_build_multi_node_config(tmp_path, node_ids))
+    # Earlier nodes answer later, whichever order the router picks them in
+    _slow_node(service.registry.get_client("node-a"), "execute_command", 0.1)
+    _slow_node(service.registry.get_client("node-b"), "execute_command", 0.05)
+    response = service.execute_command(
+        description="say hi everywhere",
+        command=["/bin/echo", "hi"],
+        preferred_tags=["dev"],
+        parallelism=3,
+    )
+    assert sorted(response["plan"]["nodes"]) == node_ids
+    assert [result["node_id"] for result in response["results"]] == response["plan"]["nodes"]
+    assert all(result["stdout"].strip() == "hi" for result in response["results"])
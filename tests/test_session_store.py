@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from nacc_ui.session_store import SessionStore
+
+
+def test_session_store_round_trip(tmp_path: Path):
+    store = SessionStore(tmp_path / "sessions" / "ui.db")
+    assert store.load("missing") is None
+
+    store.save("abc123", {"session_id": "abc123", "message_count": 2})
+    store.save("abc123", {"session_id": "abc123", "message_count": 4})
+    assert store.load("abc123") == {"session_id": "abc123", "message_count": 4}
+    store.close()
+
+    reopened = SessionStore(tmp_path / "sessions" / "ui.db")
+    assert reopened.load("abc123")["message_count"] == 4
+
+
+def test_ui_without_store_writes_nothing(tmp_path: Path, monkeypatch):
+    from nacc_ui.conversational_ui import NACCConversationUI
+
+    monkeypatch.delenv("NACC_SESSION_DB", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    ui = NACCConversationUI()
+    assert ui.session_store is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_evicted_session_reloads_from_store(tmp_path: Path, monkeypatch):
+    from nacc_ui import conversational_ui
+
+    monkeypatch.setattr(conversational_ui, "SESSION_CACHE_SIZE", 2)
+    ui = conversational_ui.NACCConversationUI(session_store=SessionStore(tmp_path / "ui.db"))
+
+    first = ui.get_or_create_session("first")
+    first.add_message("user", "hello")
+    first.current_path = "/srv"
+    ui.save_session(first)
+    ui.get_or_create_session("second")
+    ui.get_or_create_session("third")
+    assert list(ui.sessions) == ["second", "third"]
+
+    reloaded = ui.get_or_create_session("first")
+    assert reloaded is not first
+    assert reloaded.message_count == 1
+    assert reloaded.current_path == "/srv"
+    assert reloaded.conversation_history[-1]["content"] == "hello"
+    assert list(ui.sessions) == ["third", "first"]
+
+
+def test_modern_ui_chat_persists_session_context(tmp_path: Path, monkeypatch):
+    from nacc_ui import professional_ui_v2
+
+    response = SimpleNamespace(
+        status_code=200,
+        json=lambda: {"response": "moved", "context": {"current_node": "kali", "current_path": "/srv"}},
+    )
+    monkeypatch.setattr(professional_ui_v2.requests, "post", lambda *args, **kwargs: response)
+    store = SessionStore(tmp_path / "ui.db")
+    ui = professional_ui_v2.ModernNACCUI(session_store=store)
+    monkeypatch.setattr(ui, "get_dashboard_view", lambda session=None: "")
+    monkeypatch.setattr(ui, "list_files_view", lambda path=None, node=None: "")
+
+    ui.handle_chat("cd /srv on kali", [], "abc123")
+    saved = store.load("abc123")
+    assert saved["current_node"] == "kali"
+    assert saved["current_path"] == "/srv"
+
+
+def test_sessions_are_not_evicted_without_a_store(monkeypatch):
+    from nacc_ui import conversational_ui
+
+    monkeypatch.delenv("NACC_SESSION_DB", raising=False)
+    monkeypatch.setattr(conversational_ui, "SESSION_CACHE_SIZE", 2)
+    ui = conversational_ui.NACCConversationUI()
+
+    first = ui.get_or_create_session("first")
+    first.add_message("user", "hello")
+    ui.get_or_create_session("second")
+    ui.get_or_create_session("third")
+    assert list(ui.sessions) == ["first", "second", "third"]
+    assert ui.get_or_create_session("first") is first